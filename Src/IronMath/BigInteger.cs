@@ -598,28 +598,297 @@ namespace IronMath {
             if (object.ReferenceEquals(y, null)) {
                 throw new ArgumentNullException("y");
             }
-            int xl = x.Length;
-            int yl = y.Length;
-            int zl = xl + yl;
-            uint[] xd = x.data, yd = y.data, zd = new uint[zl];
+
+            if (object.ReferenceEquals(x, y)) return x.Square();
+
+            return new BigInteger(x.sign * y.sign, MultiplyDigits(x.data, 0, x.Length, y.data, 0, y.Length));
+        }
+
+        // Operands w/ fewer digits than these use the schoolbook algorithms, larger ones use
+        // Karatsuba and then Toom-3.  The thresholds are in 32-bit digits and were tuned by
+        // timing products of random operands.
+        private const int KaratsubaThreshold = 64;
+        private const int Toom3Threshold = 2048;
+        private const int KaratsubaSquareThreshold = 80;
+        private const int Toom3SquareThreshold = 4096;
+
+        /// <summary>
+        /// Multiplies the magnitudes x[xo..xo+xl) and y[yo..yo+yl), the result has xl + yl digits.
+        /// </summary>
+        private static uint[] MultiplyDigits(uint[] x, int xo, int xl, uint[] y, int yo, int yl) {
+            if (xl < yl) {
+                uint[] t = x; x = y; y = t;
+                int ti = xo; xo = yo; yo = ti;
+                ti = xl; xl = yl; yl = ti;
+            }
+
+            if (yl < KaratsubaThreshold) return SchoolbookMultiply(x, xo, xl, y, yo, yl);
+
+            if (2 * yl <= xl) {
+                // unbalanced operands, multiply x a piece at a time by all of y
+                uint[] z = new uint[xl + yl];
+                for (int start = 0; start < xl; start += yl) {
+                    int length = Math.Min(yl, xl - start);
+                    uint[] part = MultiplyDigits(x, xo + start, length, y, yo, yl);
+                    AddDigits(z, start, part, GetLength(part));
+                }
+                return z;
+            }
+
+            if (yl < Toom3Threshold) return KaratsubaMultiply(x, xo, xl, y, yo, yl);
+            return Toom3Multiply(x, xo, xl, y, yo, yl);
+        }
+
+        private static uint[] SquareDigits(uint[] x, int xo, int xl) {
+            if (xl < KaratsubaSquareThreshold) return SchoolbookSquare(x, xo, xl);
+            if (xl < Toom3SquareThreshold) return KaratsubaSquare(x, xo, xl);
+            return Toom3Square(x, xo, xl);
+        }
+
+        private static uint[] SchoolbookMultiply(uint[] x, int xo, int xl, uint[] y, int yo, int yl) {
+            uint[] z = new uint[xl + yl];
 
             for (int xi = 0; xi < xl; xi++) {
-                uint xv = xd[xi];
+                uint xv = x[xo + xi];
+                if (xv == 0) continue;
+
                 int zi = xi;
                 ulong carry = 0;
                 for (int yi = 0; yi < yl; yi++) {
-                    carry = carry + ((ulong)xv) * yd[yi] + zd[zi];
-                    zd[zi++] = (uint)carry;
+                    carry = carry + ((ulong)xv) * y[yo + yi] + z[zi];
+                    z[zi++] = (uint)carry;
                     carry >>= BitsPerDigit;
                 }
-                while (carry != 0) {
-                    carry += zd[zi];
-                    zd[zi++] = (uint)carry;
+                z[zi] = (uint)carry;
+            }
+
+            return z;
+        }
+
+        /// <summary>
+        /// Squares w/ the schoolbook algorithm, but computes each cross product x[i] * x[j] once
+        /// and doubles their sum, which takes about half the multiplications.
+        /// </summary>
+        private static uint[] SchoolbookSquare(uint[] x, int xo, int xl) {
+            uint[] z = new uint[2 * xl];
+
+            // the cross products x[i] * x[j] for i < j
+            for (int i = 0; i < xl; i++) {
+                uint xv = x[xo + i];
+                ulong carry = 0;
+                for (int j = i + 1; j < xl; j++) {
+                    carry = carry + ((ulong)xv) * x[xo + j] + z[i + j];
+                    z[i + j] = (uint)carry;
                     carry >>= BitsPerDigit;
                 }
+                z[i + xl] = (uint)carry;
+            }
+
+            // double them
+            uint shifted = 0;
+            for (int i = 0; i < z.Length; i++) {
+                uint v = z[i];
+                z[i] = (v << 1) | shifted;
+                shifted = v >> (BitsPerDigit - 1);
             }
 
-            return new BigInteger(x.sign * y.sign, zd);
+            // and add the squares
+            ulong sum = 0;
+            for (int i = 0; i < xl; i++) {
+                ulong square = ((ulong)x[xo + i]) * x[xo + i];
+                sum = sum + (uint)square + z[2 * i];
+                z[2 * i] = (uint)sum;
+                sum >>= BitsPerDigit;
+                sum = sum + (square >> BitsPerDigit) + z[2 * i + 1];
+                z[2 * i + 1] = (uint)sum;
+                sum >>= BitsPerDigit;
+            }
+            Debug.Assert(sum == 0);
+
+            return z;
+        }
+
+        /// <summary>
+        /// Karatsuba multiplication: w/ x = x1 * B + x0 and y = y1 * B + y0,
+        ///     x * y = x1 * y1 * B^2 + ((x0 + x1) * (y0 + y1) - x0 * y0 - x1 * y1) * B + x0 * y0
+        /// which takes three half size multiplications instead of four.  xl >= yl > xl / 2.
+        /// </summary>
+        private static uint[] KaratsubaMultiply(uint[] x, int xo, int xl, uint[] y, int yo, int yl) {
+            int m = (xl + 1) / 2;
+            int yl0 = Math.Min(m, yl);
+
+            uint[] z0 = MultiplyDigits(x, xo, m, y, yo, yl0);
+            uint[] z2 = MultiplyDigits(x, xo + m, xl - m, y, yo + m, yl - m);
+
+            uint[] sx = AddDigits(x, xo, m, x, xo + m, xl - m);
+            uint[] sy = AddDigits(y, yo, yl0, y, yo + m, yl - m);
+            uint[] z1 = MultiplyDigits(sx, 0, GetLength(sx), sy, 0, GetLength(sy));
+
+            return KaratsubaCombine(z0, z1, z2, m, xl + yl);
+        }
+
+        private static uint[] KaratsubaSquare(uint[] x, int xo, int xl) {
+            int m = (xl + 1) / 2;
+
+            uint[] z0 = SquareDigits(x, xo, m);
+            uint[] z2 = SquareDigits(x, xo + m, xl - m);
+
+            uint[] sx = AddDigits(x, xo, m, x, xo + m, xl - m);
+            uint[] z1 = SquareDigits(sx, 0, GetLength(sx));
+
+            return KaratsubaCombine(z0, z1, z2, m, 2 * xl);
+        }
+
+        /// <summary>
+        /// Returns z2 * B^2 + (z1 - z0 - z2) * B + z0 where B is m digits.  z1 is overwritten.
+        /// </summary>
+        private static uint[] KaratsubaCombine(uint[] z0, uint[] z1, uint[] z2, int m, int length) {
+            int z0l = GetLength(z0), z2l = GetLength(z2);
+            int z1l = GetLength(z1);
+            SubtractDigits(z1, z1l, z0, z0l);
+            SubtractDigits(z1, z1l, z2, z2l);
+
+            uint[] z = new uint[length];
+            Array.Copy(z0, z, z0l);
+            Array.Copy(z2, 0, z, 2 * m, z2l);
+            AddDigits(z, m, z1, GetLength(z1));
+            return z;
+        }
+
+        /// <summary>
+        /// Toom-3 (Toom-Cook w/ 3 pieces) multiplication.  x and y are split into 3 pieces which
+        /// are the coefficients of polynomials p and q, so that x = p(B) and y = q(B).  The
+        /// product is found by evaluating p and q at 0, 1, -1, -2 and infinity, multiplying the
+        /// values (five multiplications of a third of the size) and interpolating the product's
+        /// coefficients, using the sequence of operations from Bodrato & Zanoni, "What about
+        /// Toom-Cook matrices optimality?".  The evaluation and interpolation use signed values,
+        /// so they're done w/ BigIntegers.  xl >= yl > xl / 2.
+        /// </summary>
+        private static uint[] Toom3Multiply(uint[] x, int xo, int xl, uint[] y, int yo, int yl) {
+            int k = (xl + 2) / 3;
+
+            BigInteger x0 = GetPiece(x, xo, xl, 0, k), x1 = GetPiece(x, xo, xl, k, k), x2 = GetPiece(x, xo, xl, 2 * k, k);
+            BigInteger y0 = GetPiece(y, yo, yl, 0, k), y1 = GetPiece(y, yo, yl, k, k), y2 = GetPiece(y, yo, yl, 2 * k, k);
+
+            BigInteger px = x0 + x2, py = y0 + y2;
+            BigInteger px1 = px + x1, py1 = py + y1;                    // p(1), q(1)
+            BigInteger pxm1 = px - x1, pym1 = py - y1;                  // p(-1), q(-1)
+            BigInteger pxm2 = ((pxm1 + x2) << 1) - x0;                  // p(-2)
+            BigInteger pym2 = ((pym1 + y2) << 1) - y0;                  // q(-2)
+
+            return Toom3Interpolate(x0 * y0, px1 * py1, pxm1 * pym1, pxm2 * pym2, x2 * y2, k, xl + yl);
+        }
+
+        private static uint[] Toom3Square(uint[] x, int xo, int xl) {
+            int k = (xl + 2) / 3;
+
+            BigInteger x0 = GetPiece(x, xo, xl, 0, k), x1 = GetPiece(x, xo, xl, k, k), x2 = GetPiece(x, xo, xl, 2 * k, k);
+
+            BigInteger px = x0 + x2;
+            BigInteger px1 = px + x1;
+            BigInteger pxm1 = px - x1;
+            BigInteger pxm2 = ((pxm1 + x2) << 1) - x0;
+
+            return Toom3Interpolate(x0.Square(), px1.Square(), pxm1.Square(), pxm2.Square(), x2.Square(), k, 2 * xl);
+        }
+
+        /// <summary>
+        /// Finds the coefficients of the product r from its values at 0, 1, -1, -2 and infinity
+        /// and evaluates r(B), where B is k digits.
+        /// </summary>
+        private static uint[] Toom3Interpolate(BigInteger r0, BigInteger r1, BigInteger rm1, BigInteger rm2, BigInteger rinf, int k, int length) {
+            BigInteger c3 = (rm2 - r1) / Three;         // the divisions are exact
+            BigInteger c1 = (r1 - rm1) >> 1;
+            BigInteger c2 = rm1 - r0;
+            c3 = ((c2 - c3) >> 1) + (rinf << 1);
+            c2 = c2 + c1 - rinf;
+            c1 = c1 - c3;
+
+            int shift = k * BitsPerDigit;
+            BigInteger res = r0 + ((c1 + ((c2 + ((c3 + (rinf << shift)) << shift)) << shift)) << shift);
+            Debug.Assert(res.sign >= 0);
+
+            return resize(res.data, length);
+        }
+
+        private static readonly BigInteger Three = new BigInteger(+1, new uint[] { 3 });
+
+        /// <summary>
+        /// Returns the digits [start, start + count) of the magnitude d[offset..offset+length)
+        /// as a non-negative BigInteger.
+        /// </summary>
+        private static BigInteger GetPiece(uint[] d, int offset, int length, int start, int count) {
+            count = Math.Min(count, length - start);
+            if (count <= 0) return Zero;
+
+            uint[] piece = new uint[count];
+            Array.Copy(d, offset + start, piece, 0, count);
+            return new BigInteger(+1, piece);
+        }
+
+        /// <summary>
+        /// Returns the sum of the magnitudes x[xo..xo+xl) and y[yo..yo+yl), w/ room for the carry.
+        /// </summary>
+        private static uint[] AddDigits(uint[] x, int xo, int xl, uint[] y, int yo, int yl) {
+            if (xl < yl) {
+                uint[] t = x; x = y; y = t;
+                int ti = xo; xo = yo; yo = ti;
+                ti = xl; xl = yl; yl = ti;
+            }
+
+            uint[] z = new uint[xl + 1];
+            ulong sum = 0;
+            int i;
+            for (i = 0; i < yl; i++) {
+                sum = sum + x[xo + i] + y[yo + i];
+                z[i] = (uint)sum;
+                sum >>= BitsPerDigit;
+            }
+            for (; i < xl; i++) {
+                sum = sum + x[xo + i];
+                z[i] = (uint)sum;
+                sum >>= BitsPerDigit;
+            }
+            z[i] = (uint)sum;
+            return z;
+        }
+
+        /// <summary>
+        /// Adds the magnitude y[0..yl) to z starting at digit zo.  z must be large enough to
+        /// hold the result.
+        /// </summary>
+        private static void AddDigits(uint[] z, int zo, uint[] y, int yl) {
+            ulong sum = 0;
+            int i;
+            for (i = 0; i < yl; i++) {
+                sum = sum + z[zo + i] + y[i];
+                z[zo + i] = (uint)sum;
+                sum >>= BitsPerDigit;
+            }
+            for (i += zo; sum != 0; i++) {
+                sum += z[i];
+                z[i] = (uint)sum;
+                sum >>= BitsPerDigit;
+            }
+        }
+
+        /// <summary>
+        /// Subtracts the magnitude y[0..yl) from z[0..zl) in place, z must be >= y.
+        /// </summary>
+        private static void SubtractDigits(uint[] z, int zl, uint[] y, int yl) {
+            long borrow = 0;
+            int i;
+            for (i = 0; i < yl; i++) {
+                borrow = borrow + z[i] - y[i];
+                z[i] = (uint)borrow;
+                borrow >>= BitsPerDigit;
+            }
+            for (; borrow != 0 && i < zl; i++) {
+                borrow += z[i];
+                z[i] = (uint)borrow;
+                borrow >>= BitsPerDigit;
+            }
+            Debug.Assert(borrow == 0);
         }
 
         public static BigInteger Divide(BigInteger x, BigInteger y) {
@@ -1172,18 +1441,7 @@ namespace IronMath {
             if (power < 0) {
                 throw new ArgumentOutOfRangeException(IronMath.NonNegativePower);
             }
-            BigInteger factor = this;
-            BigInteger result = One;
-            while (power != 0) {
-                if ((power & 1) != 0) {
-                    result = result * factor;
-                    result = result % mod;
-                }
-                factor = factor.Square();
-                factor = factor % mod;
-                power >>= 1;
-            }
-            return result;
+            return ModPow(Create(power), mod);
         }
 
         public BigInteger ModPow(BigInteger power, BigInteger mod) {
@@ -1198,23 +1456,223 @@ namespace IronMath {
             if (power < 0) {
                 throw new ArgumentOutOfRangeException(IronMath.NonNegativePower);
             }
+            if (mod.IsZero()) throw new DivideByZeroException();
+
+            // the result has the sign of this ^ power, like repeatedly multiplying and taking
+            // the remainder
+            BigInteger m = mod.Abs();
+            BigInteger result = Zero;
+            if (m != One) {
+                BigInteger x = Abs() % m;
+                if (!x.IsZero()) {
+                    ModularReduction reduction;
+                    if (m.IsOdd() && m.Length <= MontgomeryThreshold) {
+                        reduction = new MontgomeryReduction(m);
+                    } else {
+                        reduction = new BarrettReduction(m);
+                    }
+                    result = SlidingWindowPower(x, power, reduction);
+                }
+            }
+            return IsNegative() && power.IsOdd() ? -result : result;
+        }
 
-            BigInteger factor = this;
-            BigInteger result = One;
-            while (power != Zero) {
-                if (power.IsOdd()) {
-                    result = result * factor;
-                    result = result % mod;
+        #region Modular exponentiation
+
+        // odd moduli up to this many digits are reduced w/ Montgomery multiplication, which is
+        // quadratic, larger ones w/ Barrett reduction which uses the subquadratic multiply.
+        private const int MontgomeryThreshold = 256;
+
+        /// <summary>
+        /// Computes x ^ power mod m, 0 &lt; x &lt; m, scanning the exponent from the most significant
+        /// bit in windows of up to k bits which start and end w/ a one bit.  Each window costs
+        /// a single multiplication by one of the precomputed odd powers x, x^3, ..., x^(2^k - 1).
+        /// </summary>
+        private static BigInteger SlidingWindowPower(BigInteger x, BigInteger power, ModularReduction reduction) {
+            uint[] e = power.data;
+            int bits = power.GetBitLength();
+            int k = bits > 671 ? 6 : bits > 239 ? 5 : bits > 79 ? 4 : bits > 23 ? 3 : bits > 6 ? 2 : 1;
+
+            BigInteger[] oddPowers = new BigInteger[1 << (k - 1)];
+            oddPowers[0] = reduction.Enter(x);
+            if (oddPowers.Length > 1) {
+                BigInteger square = reduction.Square(oddPowers[0]);
+                for (int i = 1; i < oddPowers.Length; i++) {
+                    oddPowers[i] = reduction.Multiply(oddPowers[i - 1], square);
                 }
-                factor = factor.Square();
-                factor = factor % mod;
-                power >>= 1;
             }
-            return result;
+
+            BigInteger result = null;
+            int bit = bits - 1;
+            while (bit >= 0) {
+                if (GetBit(e, bit) == 0) {
+                    result = reduction.Square(result);
+                    bit--;
+                    continue;
+                }
+
+                // the window is bits [low, bit], shortened so that bit low is set
+                int low = Math.Max(bit - k + 1, 0);
+                while (GetBit(e, low) == 0) low++;
+
+                int window = 0;
+                for (int i = bit; i >= low; i--) {
+                    window = (window << 1) | GetBit(e, i);
+                }
+
+                if (object.ReferenceEquals(result, null)) {
+                    result = oddPowers[window >> 1];
+                } else {
+                    for (int i = bit; i >= low; i--) {
+                        result = reduction.Square(result);
+                    }
+                    result = reduction.Multiply(result, oddPowers[window >> 1]);
+                }
+                bit = low - 1;
+            }
+            return reduction.Leave(result);
+        }
+
+        private static int GetBit(uint[] data, int bit) {
+            return (int)(data[bit / BitsPerDigit] >> (bit % BitsPerDigit)) & 1;
+        }
+
+        /// <summary>
+        /// Multiplication modulo a positive number m.  Numbers less than m are converted into
+        /// another representation before they're multiplied and converted back afterwards.
+        /// </summary>
+        private abstract class ModularReduction {
+            public abstract BigInteger Enter(BigInteger x);
+            public abstract BigInteger Leave(BigInteger x);
+            public abstract BigInteger Multiply(BigInteger x, BigInteger y);
+
+            public virtual BigInteger Square(BigInteger x) {
+                return Multiply(x, x);
+            }
+        }
+
+        private sealed class BarrettReduction : ModularReduction {
+            private readonly BarrettDivisor mod;
+
+            public BarrettReduction(BigInteger mod) {
+                this.mod = new BarrettDivisor(mod);
+            }
+
+            public override BigInteger Enter(BigInteger x) {
+                return x;
+            }
+
+            public override BigInteger Leave(BigInteger x) {
+                return x;
+            }
+
+            public override BigInteger Multiply(BigInteger x, BigInteger y) {
+                return Reduce(x * y);
+            }
+
+            public override BigInteger Square(BigInteger x) {
+                return Reduce(x.Square());
+            }
+
+            private BigInteger Reduce(BigInteger x) {
+                BigInteger rem;
+                mod.DivRem(x, out rem);
+                return rem;
+            }
         }
 
+        /// <summary>
+        /// Montgomery multiplication modulo an odd number m of n digits: numbers are
+        /// represented as x * R mod m, R = 2 ^ (32 * n), and the product of a * R and b * R is
+        /// reduced by dividing it by R, which needs no trial division.  The representations
+        /// always have exactly n digits.
+        /// </summary>
+        private sealed class MontgomeryReduction : ModularReduction {
+            private readonly BigInteger mod;
+            private readonly uint[] m;
+            private readonly int n;
+            private readonly uint mInv;         // -1 / m mod 2 ^ 32
+
+            public MontgomeryReduction(BigInteger mod) {
+                Debug.Assert(mod.IsOdd());
+
+                this.mod = mod;
+                n = mod.Length;
+                m = resize(mod.data, n);
+
+                // Newton's iteration doubles the number of correct low bits of 1 / m[0]
+                uint inv = m[0];
+                for (int i = 0; i < 4; i++) {
+                    inv *= 2 - m[0] * inv;
+                }
+                mInv = 0 - inv;
+            }
+
+            public override BigInteger Enter(BigInteger x) {
+                return new BigInteger(+1, resize(((x << (n * BitsPerDigit)) % mod).data, n));
+            }
+
+            public override BigInteger Leave(BigInteger x) {
+                return new BigInteger(+1, Reduce(x.data));
+            }
+
+            public override BigInteger Multiply(BigInteger x, BigInteger y) {
+                return new BigInteger(+1, Reduce(MultiplyDigits(x.data, 0, n, y.data, 0, n)));
+            }
+
+            public override BigInteger Square(BigInteger x) {
+                return new BigInteger(+1, Reduce(SquareDigits(x.data, 0, n)));
+            }
+
+            /// <summary>
+            /// Returns value / R mod m for value &lt; m * R: a multiple of m is added to the value
+            /// a digit at a time to clear its low n digits.
+            /// </summary>
+            private uint[] Reduce(uint[] value) {
+                uint[] t = new uint[2 * n + 1];
+                Array.Copy(value, t, Math.Min(value.Length, 2 * n));
+
+                for (int i = 0; i < n; i++) {
+                    ulong u = t[i] * mInv;
+                    ulong carry = 0;
+                    for (int j = 0; j < n; j++) {
+                        carry += t[i + j] + u * m[j];
+                        t[i + j] = (uint)carry;
+                        carry >>= BitsPerDigit;
+                    }
+                    for (int j = i + n; carry != 0; j++) {
+                        carry += t[j];
+                        t[j] = (uint)carry;
+                        carry >>= BitsPerDigit;
+                    }
+                }
+
+                // the result is less than 2 * m
+                uint[] z = new uint[n];
+                Array.Copy(t, n, z, 0, n);
+                if (t[2 * n] != 0 || Compare(z, m, n) >= 0) {
+                    long borrow = 0;
+                    for (int j = 0; j < n; j++) {
+                        borrow = borrow + z[j] - m[j];
+                        z[j] = (uint)borrow;
+                        borrow >>= BitsPerDigit;
+                    }
+                }
+                return z;
+            }
+
+            private static int Compare(uint[] x, uint[] y, int n) {
+                for (int i = n - 1; i >= 0; i--) {
+                    if (x[i] != y[i]) return x[i] < y[i] ? -1 : +1;
+                }
+                return 0;
+            }
+        }
+
+        #endregion
+
         public BigInteger Square() {
-            return this * this;
+            return new BigInteger(sign * sign, SquareDigits(data, 0, Length));
         }
 
         public override string ToString() {
@@ -1238,14 +1696,15 @@ namespace IronMath {
             if (len == 0) return "0";
 
             List<uint> digitGroups = new List<uint>();
-
-            uint[] d = copy(data);
-            int dl = Length;
-
-            uint groupRadix = groupRadixValues[radix];
-            while (dl > 0) {
-                uint rem = div(d, ref dl, groupRadix);
-                digitGroups.Add(rem);
+            if (len <= ToStringThreshold) {
+                GetRadixGroups(data, len, radix, digitGroups, 0);
+            } else {
+                // split the number in half by powers of the group radix until the pieces are
+                // small enough for the simple loop.  x < groupRadix ^ groupCount.
+                int groupCount = (int)(len * BitsPerDigit / Math.Log(groupRadixValues[radix], 2)) + 1;
+                int k = 0;
+                while ((1 << k) < groupCount) k++;
+                GetRadixGroups(sign < 0 ? -this : this, radix, k, digitGroups, false);
             }
 
             StringBuilder ret = new StringBuilder();
@@ -1275,6 +1734,235 @@ namespace IronMath {
             else buf.Append(tmp, i, digits - i);
         }
 
+        #region Radix conversion
+
+        // numbers w/ more digits than these are converted by divide and conquer
+        private const int ToStringThreshold = 40;
+        private const int ParseThreshold = 40;         // in digit groups
+        private const int ReciprocalThreshold = 80;
+
+        // groupRadix ^ (2 ^ k) for each radix, shared by ToString(radix) and Parse
+        private static List<BarrettDivisor>[] radixPowers = new List<BarrettDivisor>[37];
+
+        /// <summary>
+        /// Parses count digits of the given radix starting at text[index].  Digits are 0-9
+        /// followed by the letters a-z in either case.  The number is split in half until the
+        /// pieces are small enough to be parsed one digit group at a time and the pieces are
+        /// combined by multiplying with powers of the group radix.
+        /// </summary>
+        public static BigInteger Parse(string text, int index, int count, uint radix) {
+            if (radix < 2) {
+                throw new ArgumentOutOfRangeException("radix", radix, IronMath.RadixLessThan2);
+            }
+            if (radix > 36) {
+                throw new ArgumentOutOfRangeException("radix", radix, IronMath.RadixGreaterThan36);
+            }
+            if (text == null) throw new ArgumentNullException("text");
+            if (index < 0 || count < 0 || index + count > text.Length) {
+                throw new ArgumentOutOfRangeException("count", count, IronMath.InvalidArgument);
+            }
+
+            int groupChars = (int)maxCharsPerDigit[radix];
+            int groupCount = (count + groupChars - 1) / groupChars;
+            if (groupCount <= ParseThreshold) {
+                return new BigInteger(+1, ParseGroups(text, index, count, radix));
+            }
+
+            int k = 0;
+            while ((2 << k) < groupCount) k++;
+            return ParseDivideAndConquer(text, index, count, radix, k);
+        }
+
+        /// <summary>
+        /// Parses text[index, index + count) which holds at most 2 ^ (k + 1) digit groups.
+        /// </summary>
+        private static BigInteger ParseDivideAndConquer(string text, int index, int count, uint radix, int k) {
+            int groupChars = (int)maxCharsPerDigit[radix];
+            if (count <= ParseThreshold * groupChars) {
+                return new BigInteger(+1, ParseGroups(text, index, count, radix));
+            }
+
+            // the low half is exactly 2 ^ k groups
+            int lowChars = groupChars << k;
+            if (count <= lowChars) {
+                return ParseDivideAndConquer(text, index, count, radix, k - 1);
+            }
+
+            BigInteger high = ParseDivideAndConquer(text, index, count - lowChars, radix, k - 1);
+            BigInteger low = ParseDivideAndConquer(text, index + count - lowChars, lowChars, radix, k - 1);
+            return high * GetRadixPower(radix, k).Value + low;
+        }
+
+        /// <summary>
+        /// Parses a few digit groups w/ the quadratic multiply and add loop.
+        /// </summary>
+        private static uint[] ParseGroups(string text, int index, int count, uint radix) {
+            int groupChars = (int)maxCharsPerDigit[radix];
+            uint groupRadix = groupRadixValues[radix];
+            uint[] d = new uint[(count + groupChars - 1) / groupChars];
+            int dl = 0;
+
+            // the first group takes the digits which don't fill a whole group
+            int end = index + count;
+            int groupEnd = index + (count % groupChars == 0 ? groupChars : count % groupChars);
+            while (index < end) {
+                uint group = 0;
+                for (; index < groupEnd; index++) {
+                    group = group * radix + GetDigitValue(text[index], radix);
+                }
+                groupEnd += groupChars;
+
+                ulong carry = group;
+                for (int i = 0; i < dl; i++) {
+                    carry += (ulong)d[i] * groupRadix;
+                    d[i] = (uint)carry;
+                    carry >>= BitsPerDigit;
+                }
+                if (carry != 0) d[dl++] = (uint)carry;
+            }
+            return d;
+        }
+
+        private static uint GetDigitValue(char ch, uint radix) {
+            uint value;
+            if (ch >= '0' && ch <= '9') value = (uint)(ch - '0');
+            else if (ch >= 'a' && ch <= 'z') value = (uint)(ch - 'a' + 10);
+            else if (ch >= 'A' && ch <= 'Z') value = (uint)(ch - 'A' + 10);
+            else value = radix;
+
+            if (value >= radix) throw new ArgumentException(IronMath.InvalidArgument, "text");
+            return value;
+        }
+
+        /// <summary>
+        /// Appends the digit groups of x, which is less than groupRadix ^ (2 ^ k), to groups,
+        /// least significant first.  If pad is true exactly 2 ^ k groups are appended.
+        /// </summary>
+        private static void GetRadixGroups(BigInteger x, uint radix, int k, List<uint> groups, bool pad) {
+            int len = x.Length;
+            if (len <= ToStringThreshold) {
+                GetRadixGroups(x.data, len, radix, groups, pad ? 1 << k : 0);
+                return;
+            }
+
+            // the most significant piece isn't padded, so it may not need splitting at this level
+            BarrettDivisor power = GetRadixPower(radix, k - 1);
+            if (!pad) {
+                while (x < power.Value) {
+                    power = GetRadixPower(radix, --k - 1);
+                }
+            }
+
+            BigInteger rem;
+            BigInteger quot = power.DivRem(x, out rem);
+            GetRadixGroups(rem, radix, k - 1, groups, true);
+            GetRadixGroups(quot, radix, k - 1, groups, pad);
+        }
+
+        /// <summary>
+        /// Appends the digit groups of data[0, len) to groups w/ the quadratic divide loop,
+        /// followed by zero groups until there are at least minGroups.
+        /// </summary>
+        private static void GetRadixGroups(uint[] data, int len, uint radix, List<uint> groups, int minGroups) {
+            uint[] d = copy(data);
+            int dl = len;
+            int start = groups.Count;
+
+            uint groupRadix = groupRadixValues[radix];
+            while (dl > 0) {
+                uint rem = div(d, ref dl, groupRadix);
+                groups.Add(rem);
+            }
+            while (groups.Count - start < minGroups) {
+                groups.Add(0);
+            }
+        }
+
+        private static BarrettDivisor GetRadixPower(uint radix, int k) {
+            lock (radixPowers) {
+                List<BarrettDivisor> powers = radixPowers[radix];
+                if (powers == null) {
+                    radixPowers[radix] = powers = new List<BarrettDivisor>();
+                    powers.Add(new BarrettDivisor(Create(groupRadixValues[radix])));
+                }
+                while (powers.Count <= k) {
+                    powers.Add(new BarrettDivisor(powers[powers.Count - 1].Value.Square()));
+                }
+                return powers[k];
+            }
+        }
+
+        /// <summary>
+        /// A positive divisor which numbers less than its square can be divided by w/ Barrett
+        /// reduction: the quotient is estimated by multiplying w/ a precomputed reciprocal, so
+        /// dividing only costs a couple of multiplications.
+        /// </summary>
+        private sealed class BarrettDivisor {
+            public readonly BigInteger Value;
+            private readonly int bits;
+            private BigInteger reciprocal;      // floor(2 ^ (2 * bits) / Value), computed on first use
+
+            public BarrettDivisor(BigInteger value) {
+                Value = value;
+                bits = value.GetBitLength();
+            }
+
+            /// <summary>
+            /// Divides x, 0 &lt;= x &lt; Value ^ 2, by Value.
+            /// </summary>
+            public BigInteger DivRem(BigInteger x, out BigInteger remainder) {
+                BigInteger m = reciprocal;
+                if (object.ReferenceEquals(m, null)) {
+                    reciprocal = m = Reciprocal(Value, bits);
+                }
+
+                // the estimate is at most 2 too small
+                BigInteger quot = ((x >> (bits - 1)) * m) >> (bits + 1);
+                remainder = x - quot * Value;
+                while (remainder >= Value) {
+                    remainder -= Value;
+                    quot += 1;
+                }
+                return quot;
+            }
+        }
+
+        /// <summary>
+        /// Returns floor(2 ^ (2 * bits) / d) where d is bits bits long, refining the reciprocal
+        /// of the top half of d w/ a Newton iteration.
+        /// </summary>
+        private static BigInteger Reciprocal(BigInteger d, int bits) {
+            BigInteger scale = One << (2 * bits);
+            if (d.Length <= ReciprocalThreshold) {
+                return scale / d;
+            }
+
+            int h = bits / 2 + 2;
+            BigInteger m = Reciprocal(d >> (bits - h), h) << (bits - h);
+
+            // m = m * (2 - m * d / 2 ^ (2 * bits)), which doubles the number of correct bits
+            m += (m * (scale - m * d)) >> (2 * bits);
+
+            BigInteger rem = scale - m * d;
+            while (rem.IsNegative()) {
+                m -= 1;
+                rem += d;
+            }
+            while (rem >= d) {
+                m += 1;
+                rem -= d;
+            }
+            return m;
+        }
+
+        private int GetBitLength() {
+            int len = Length;
+            if (len == 0) return 0;
+            return len * BitsPerDigit - GetNormalizeShift(data[len - 1]);
+        }
+
+        #endregion
+
         public override int GetHashCode() {
             if (data.Length == 0) return 0;
             // HashCode must be same as int for values in the range of a single int
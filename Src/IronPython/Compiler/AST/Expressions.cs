@@ -22,6 +22,8 @@ using System.CodeDom;
 using System.Text;
 using System.Diagnostics;
 
+using IronMath;
+
 using IronPython.Runtime;
 using IronPython.Runtime.Operations;
 using IronPython.Runtime.Calls;
@@ -170,6 +172,8 @@ namespace IronPython.Compiler.Ast {
                 cg.EmitStringArray(keywordNames);
                 cg.EmitCall(typeof(Ops), "Call",
                     new Type[] { typeof(ICallerContext), typeof(object), typeof(object[]), typeof(string[]) });
+            } else if (target is FieldExpression) {
+                EmitMethodCall(cg, (FieldExpression)target, exprs);
             } else {
                 cg.EmitCallerContext();
                 target.Emit(cg);
@@ -195,6 +199,42 @@ namespace IronPython.Compiler.Ast {
             }
         }
 
+        /// <summary>
+        /// Emits a call of the form o.name(args).  Ops.GetMethodForCall looks up the attribute
+        /// before the arguments are evaluated, as usual, but hands back the unbound function and
+        /// the instance for plain methods so that no bound method is created just to be called.
+        /// </summary>
+        private static void EmitMethodCall(CodeGen cg, FieldExpression target, Expression[] exprs) {
+            Slot self = cg.GetLocalTmp(typeof(object));
+
+            cg.EmitCallerContext();
+            cg.EmitCallerContext();
+            target.Target.Emit(cg);
+            cg.EmitSymbolId(target.Name);
+            self.EmitGetAddr(cg);
+            cg.EmitCall(typeof(Ops), "GetMethodForCall");
+            self.EmitGet(cg);
+
+            if (exprs.Length <= Ops.MaximumCallArgs) {
+                Type[] argTypes = new Type[exprs.Length + 3];
+                int i = 0;
+                argTypes[i++] = typeof(ICallerContext);
+                argTypes[i++] = typeof(object);
+                argTypes[i++] = typeof(object);
+                foreach (Expression e in exprs) {
+                    e.Emit(cg);
+                    argTypes[i++] = typeof(object);
+                }
+                cg.EmitCall(typeof(Ops), "InvokeMethod", argTypes);
+            } else {
+                cg.EmitObjectArray(exprs);
+                cg.EmitCall(typeof(Ops), "InvokeMethod",
+                    new Type[] { typeof(ICallerContext), typeof(object), typeof(object), typeof(object[]) });
+            }
+
+            cg.FreeLocalTmp(self);
+        }
+
         public override void Walk(IAstWalker walker) {
             if (walker.Walk(this)) {
                 target.Walk(walker);
@@ -267,6 +307,13 @@ namespace IronPython.Compiler.Ast {
         }
 
         internal override void Emit(CodeGen cg) {
+            if (Options.CacheAttributeLookups && GetAttrSite.IsCacheableName(name) && cg.TryEmitGetAttrSite(name)) {
+                cg.EmitCallerContext();
+                target.Emit(cg);
+                cg.EmitCall(typeof(GetAttrSite), "GetAttr");
+                return;
+            }
+
             cg.EmitCallerContext();
             target.Emit(cg);
 
@@ -890,8 +937,165 @@ namespace IronPython.Compiler.Ast {
                 FinishCompare(cg);
             } else {
                 right.Emit(cg);
-                op.Emit(cg);
+                if (Options.InlineNumericOperations && CanEmitInline(op)) {
+                    EmitInline(cg);
+                } else {
+                    op.Emit(cg);
+                }
+            }
+        }
+
+        private static bool CanEmitInline(BinaryOperator op) {
+            return op == PythonOperator.Add || op == PythonOperator.Subtract || op == PythonOperator.Multiply ||
+                op == PythonOperator.LessThan || op == PythonOperator.LessThanOrEqual ||
+                op == PythonOperator.GreaterThan || op == PythonOperator.GreaterThanOrEqual ||
+                op == PythonOperator.Equal || op == PythonOperator.NotEqual;
+        }
+
+        /// <summary>
+        /// Emits the operator w/ both operands on the stack as:
+        ///
+        ///     if (l is int && r is int) inline int operation
+        ///     else if (l is double && r is double) inline double operation
+        ///     else op.Target(l, r)
+        ///
+        /// Exact type checks are used so subclasses of int and float, which may override the
+        /// operators, always go through the Ops call.
+        /// </summary>
+        private void EmitInline(CodeGen cg) {
+            Slot leftTmp = cg.GetLocalTmp(typeof(object));
+            Slot rightTmp = cg.GetLocalTmp(typeof(object));
+            rightTmp.EmitSet(cg);
+            leftTmp.EmitSet(cg);
+
+            Label notInt = cg.DefineLabel();
+            Label generic = cg.DefineLabel();
+            Label end = cg.DefineLabel();
+
+            // int op int
+            leftTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Isinst, typeof(int));
+            cg.Emit(OpCodes.Brfalse, notInt);
+            rightTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Isinst, typeof(int));
+            cg.Emit(OpCodes.Brfalse, generic);
+            EmitUnboxed(cg, leftTmp, rightTmp, typeof(int));
+            EmitIntOperation(cg);
+            cg.Emit(OpCodes.Br, end);
+
+            // double op double
+            cg.MarkLabel(notInt);
+            leftTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Isinst, typeof(double));
+            cg.Emit(OpCodes.Brfalse, generic);
+            rightTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Isinst, typeof(double));
+            cg.Emit(OpCodes.Brfalse, generic);
+            EmitUnboxed(cg, leftTmp, rightTmp, typeof(double));
+            EmitDoubleOperation(cg);
+            cg.Emit(OpCodes.Br, end);
+
+            // anything else
+            cg.MarkLabel(generic);
+            leftTmp.EmitGet(cg);
+            rightTmp.EmitGet(cg);
+            op.Emit(cg);
+
+            cg.MarkLabel(end);
+
+            cg.FreeLocalTmp(leftTmp);
+            cg.FreeLocalTmp(rightTmp);
+        }
+
+        private static void EmitUnboxed(CodeGen cg, Slot leftTmp, Slot rightTmp, Type type) {
+            leftTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Unbox_Any, type);
+            rightTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Unbox_Any, type);
+        }
+
+        /// <summary>
+        /// Emits the operation on two int32's.  Arithmetic is done in 64 bits, which can't
+        /// overflow, and the result is promoted to a long if it doesn't fit back in an int.
+        /// </summary>
+        private void EmitIntOperation(CodeGen cg) {
+            if (op.IsComparison) {
+                EmitComparison(cg, false);
+                return;
+            }
+
+            // widen both operands, the right one is on top of the stack
+            Slot rightTmp = cg.GetLocalTmp(typeof(int));
+            rightTmp.EmitSet(cg);
+            cg.Emit(OpCodes.Conv_I8);
+            rightTmp.EmitGet(cg);
+            cg.Emit(OpCodes.Conv_I8);
+            cg.FreeLocalTmp(rightTmp);
+
+            if (op == PythonOperator.Add) cg.Emit(OpCodes.Add);
+            else if (op == PythonOperator.Subtract) cg.Emit(OpCodes.Sub);
+            else cg.Emit(OpCodes.Mul);
+
+            Slot result = cg.GetLocalTmp(typeof(long));
+            result.EmitSet(cg);
+
+            Label overflow = cg.DefineLabel();
+            Label done = cg.DefineLabel();
+            result.EmitGet(cg);
+            cg.Emit(OpCodes.Conv_I4);
+            cg.Emit(OpCodes.Conv_I8);
+            result.EmitGet(cg);
+            cg.Emit(OpCodes.Bne_Un, overflow);
+
+            result.EmitGet(cg);
+            cg.Emit(OpCodes.Conv_I4);
+            cg.EmitCall(typeof(Ops), "Int2Object");
+            cg.Emit(OpCodes.Br, done);
+
+            cg.MarkLabel(overflow);
+            result.EmitGet(cg);
+            cg.EmitCall(typeof(BigInteger), "Create", new Type[] { typeof(long) });
+
+            cg.MarkLabel(done);
+            cg.FreeLocalTmp(result);
+        }
+
+        private void EmitDoubleOperation(CodeGen cg) {
+            if (op.IsComparison) {
+                EmitComparison(cg, true);
+                return;
+            }
+
+            if (op == PythonOperator.Add) cg.Emit(OpCodes.Add);
+            else if (op == PythonOperator.Subtract) cg.Emit(OpCodes.Sub);
+            else cg.Emit(OpCodes.Mul);
+            cg.Emit(OpCodes.Box, typeof(double));
+        }
+
+        /// <summary>
+        /// Emits a comparison of two primitive values producing a boxed bool.  For doubles the
+        /// negated comparisons use the unordered forms so that any comparison involving NaN is
+        /// false (and != is true), matching the Ops implementation.
+        /// </summary>
+        private void EmitComparison(CodeGen cg, bool isDouble) {
+            if (op == PythonOperator.LessThan) {
+                cg.Emit(OpCodes.Clt);
+            } else if (op == PythonOperator.GreaterThan) {
+                cg.Emit(OpCodes.Cgt);
+            } else if (op == PythonOperator.Equal) {
+                cg.Emit(OpCodes.Ceq);
+            } else {
+                if (op == PythonOperator.LessThanOrEqual) {
+                    cg.Emit(isDouble ? OpCodes.Cgt_Un : OpCodes.Cgt);
+                } else if (op == PythonOperator.GreaterThanOrEqual) {
+                    cg.Emit(isDouble ? OpCodes.Clt_Un : OpCodes.Clt);
+                } else {
+                    cg.Emit(OpCodes.Ceq);
+                }
+                cg.Emit(OpCodes.Ldc_I4_0);
+                cg.Emit(OpCodes.Ceq);
             }
+            cg.EmitCall(typeof(Ops), "Bool2Object");
         }
 
         protected bool IsComparison() {
@@ -50,6 +50,7 @@ namespace IronPython.Compiler.Ast {
         private Expression decorators;
         private string filename;
         private int yieldCount = 0;
+        private bool canStopIteration;
 
         public FunctionDefinition(SymbolId name, Expression[] parameters, Expression[] defaults, FunctionAttributes flags, string sourceFile)
             : this(name, parameters, defaults, flags, null, sourceFile) {
@@ -210,6 +211,7 @@ namespace IronPython.Compiler.Ast {
             FunctionCode.FuncCodeFlags codeFlags = 0;
             if (cg.Context.TrueDivision) codeFlags |= FunctionCode.FuncCodeFlags.FutureDivision;
             if (this.yieldCount > 0) codeFlags |= FunctionCode.FuncCodeFlags.Generator;
+            if (canStopIteration) codeFlags |= FunctionCode.FuncCodeFlags.IterationStop;
             if (codeFlags != 0) {
                 functionCode.EmitGet(cg);
                 cg.EmitInt((int)codeFlags);
@@ -325,6 +327,8 @@ namespace IronPython.Compiler.Ast {
         }
 
         private void EmitFunctionBody(CodeGen cg, CodeGen ocg) {
+            List<RaiseStatement> stops = EmitIterationStops(cg);
+
             if (HasEnvironment) {
                 cg.ContextSlot = cg.EnvironmentSlot = CreateEnvironment(cg);
             }
@@ -341,6 +345,32 @@ namespace IronPython.Compiler.Ast {
             EmitTupleParams(cg);
             Body.Emit(cg);
             cg.EmitReturn(null);
+
+            foreach (RaiseStatement rs in stops) {
+                rs.IterationStops = null;
+            }
+        }
+
+        /// <summary>
+        /// A loop over a user defined iterator ends when its next method raises StopIteration, which
+        /// is expensive.  When the function raises StopIteration or IndexError outside of any try or
+        /// with block those raises instead return Ops.IterationStopped if the function's been called
+        /// by an iterator (see Ops.CallIterationMethod).  Returns the raise statements to update.
+        /// </summary>
+        private List<RaiseStatement> EmitIterationStops(CodeGen cg) {
+            List<RaiseStatement> stops = IterationStopFinder.Find(Body);
+            canStopIteration = stops.Count > 0;
+            if (canStopIteration) {
+                // this must run before anything which might call another function
+                Slot slot = cg.GetLocalTmp(typeof(int));
+                cg.EmitCall(typeof(Ops), "TakeIterationStops");
+                slot.EmitSet(cg);
+
+                foreach (RaiseStatement rs in stops) {
+                    rs.IterationStops = slot;
+                }
+            }
+            return stops;
         }
 
         private void EmitGeneratorBody(CodeGen cg, CodeGen ocg) {
@@ -564,6 +594,32 @@ namespace IronPython.Compiler.Ast {
         }
     }
 
+    /// <summary>
+    /// Finds the raise StopIteration and raise IndexError statements in a function body which
+    /// aren't in a try or with block, so the function can't catch or observe the exception itself.
+    /// Nested functions and classes are left alone.
+    /// </summary>
+    class IterationStopFinder : AstWalker {
+        private List<RaiseStatement> raises = new List<RaiseStatement>();
+
+        public static List<RaiseStatement> Find(Statement body) {
+            IterationStopFinder finder = new IterationStopFinder();
+            body.Walk(finder);
+            return finder.raises;
+        }
+
+        public override bool Walk(RaiseStatement node) {
+            if (node.RaisesIterationStop) raises.Add(node);
+            return false;
+        }
+
+        public override bool Walk(TryStatement node) { return false; }
+        public override bool Walk(TryFinallyStatement node) { return false; }
+        public override bool Walk(WithStatement node) { return false; }
+        public override bool Walk(FunctionDefinition node) { return false; }
+        public override bool Walk(ClassDefinition node) { return false; }
+    }
+
     class YieldLabelBuilder : AstWalker {
         public abstract class ExceptionBlock {
             public enum State {
@@ -316,12 +316,18 @@ namespace IronPython.Compiler.Ast {
         }
 
         internal override void Emit(CodeGen cg) {
+            cg.EmitPosition(Start, header);
+
+            CallExpression rangeCall = GetRangeCall();
+            if (rangeCall != null && !cg.IsGenerator()) {
+                EmitRangeLoop(cg, rangeCall);
+                return;
+            }
+
             Label eol = cg.DefineLabel();
             Label breakTarget = cg.DefineLabel();
             Label continueTarget = cg.DefineLabel();
 
-            cg.EmitPosition(Start, header);
-
             list.Emit(cg);
             cg.EmitCall(typeof(Ops), "GetEnumeratorForIteration");
 
@@ -363,6 +369,183 @@ namespace IronPython.Compiler.Ast {
             }
         }
 
+        private static readonly SymbolId rangeSymbol = SymbolTable.StringToId("range");
+        private static readonly SymbolId xrangeSymbol = SymbolTable.StringToId("xrange");
+
+        /// <summary>
+        /// Returns the call if the loop is over range(...) or xrange(...) w/ 1 to 3 positional
+        /// arguments, otherwise null.
+        /// </summary>
+        private CallExpression GetRangeCall() {
+            CallExpression call = list as CallExpression;
+            if (call == null) return null;
+
+            NameExpression name = call.Target as NameExpression;
+            if (name == null || (name.Name != rangeSymbol && name.Name != xrangeSymbol)) return null;
+
+            if (call.Args.Count < 1 || call.Args.Count > 3) return null;
+            foreach (Arg arg in call.Args) {
+                if (arg.Name != SymbolTable.Empty) return null;
+            }
+            return call;
+        }
+
+        /// <summary>
+        /// Emits a loop over range(...) or xrange(...) which counts w/ native ints instead of
+        /// creating the list or the xrange object.  The name may have been rebound (or the
+        /// arguments may not be ints) so we check at runtime and if needed fall back to calling
+        /// the function and iterating over the result.  Either way the body is emitted only once:
+        ///
+        ///     func = range; args = ...
+        ///     if (counted = Ops.IsCountedRange(func, args)) { cur = start; stop = ...; step = ... }
+        ///     else iter = GetEnumeratorForIteration(func(args))
+        /// continue:
+        ///     if (counted) { if (cur reached stop) goto eol; value = Int2Object(cur); cur += step }
+        ///     else { if (!iter.MoveNext()) goto eol; value = iter.Current }
+        ///     lhs = value; body; goto continue
+        /// eol:
+        ///     else statement
+        /// </summary>
+        private void EmitRangeLoop(CodeGen cg, CallExpression call) {
+            Label eol = cg.DefineLabel();
+            Label breakTarget = cg.DefineLabel();
+            Label continueTarget = cg.DefineLabel();
+            Label enumerate = cg.DefineLabel();
+            Label nextItem = cg.DefineLabel();
+            Label countDown = cg.DefineLabel();
+            Label produceCount = cg.DefineLabel();
+            Label assign = cg.DefineLabel();
+
+            // evaluate the function and the arguments once, in order
+            Slot func = cg.GetLocalTmp(typeof(object));
+            call.Target.Emit(cg);
+            func.EmitSet(cg);
+
+            Slot[] args = new Slot[call.Args.Count];
+            Type[] argTypes = new Type[args.Length + 1];
+            argTypes[0] = typeof(object);
+            for (int i = 0; i < args.Length; i++) {
+                args[i] = cg.GetLocalTmp(typeof(object));
+                call.Args[i].Expression.Emit(cg);
+                args[i].EmitSet(cg);
+                argTypes[i + 1] = typeof(object);
+            }
+
+            Slot counted = cg.GetLocalTmp(typeof(bool));
+            Slot current = cg.GetLocalTmp(typeof(long));
+            Slot stop = cg.GetLocalTmp(typeof(long));
+            Slot step = cg.GetLocalTmp(typeof(int));
+            Slot iter = cg.GetLocalTmp(typeof(IEnumerator));
+
+            func.EmitGet(cg);
+            foreach (Slot arg in args) arg.EmitGet(cg);
+            cg.EmitCall(typeof(Ops), "IsCountedRange", argTypes);
+            cg.Emit(OpCodes.Dup);
+            counted.EmitSet(cg);
+            cg.Emit(OpCodes.Brfalse, enumerate);
+
+            // counted: range(stop), range(start, stop) or range(start, stop, step)
+            if (args.Length == 1) {
+                cg.EmitInt(0);
+            } else {
+                args[0].EmitGet(cg);
+                cg.Emit(OpCodes.Unbox_Any, typeof(int));
+            }
+            cg.Emit(OpCodes.Conv_I8);
+            current.EmitSet(cg);
+
+            args[args.Length == 1 ? 0 : 1].EmitGet(cg);
+            cg.Emit(OpCodes.Unbox_Any, typeof(int));
+            cg.Emit(OpCodes.Conv_I8);
+            stop.EmitSet(cg);
+
+            if (args.Length == 3) {
+                args[2].EmitGet(cg);
+                cg.Emit(OpCodes.Unbox_Any, typeof(int));
+            } else {
+                cg.EmitInt(1);
+            }
+            step.EmitSet(cg);
+            cg.Emit(OpCodes.Br, continueTarget);
+
+            // not counted: call whatever range is bound to and iterate the result
+            cg.MarkLabel(enumerate);
+            cg.EmitCallerContext();
+            func.EmitGet(cg);
+            Type[] callTypes = new Type[args.Length + 2];
+            callTypes[0] = typeof(ICallerContext);
+            callTypes[1] = typeof(object);
+            for (int i = 0; i < args.Length; i++) {
+                args[i].EmitGet(cg);
+                callTypes[i + 2] = typeof(object);
+            }
+            cg.EmitCall(typeof(Ops), "CallWithContext", callTypes);
+            cg.EmitCall(typeof(Ops), "GetEnumeratorForIteration");
+            iter.EmitSet(cg);
+
+            cg.MarkLabel(continueTarget);
+            counted.EmitGet(cg);
+            cg.Emit(OpCodes.Brfalse, nextItem);
+
+            // counted: current is 64 bits so adding the step can't overflow
+            step.EmitGet(cg);
+            cg.EmitInt(0);
+            cg.Emit(OpCodes.Ble, countDown);
+            current.EmitGet(cg);
+            stop.EmitGet(cg);
+            cg.Emit(OpCodes.Bge, eol);
+            cg.Emit(OpCodes.Br, produceCount);
+
+            cg.MarkLabel(countDown);
+            current.EmitGet(cg);
+            stop.EmitGet(cg);
+            cg.Emit(OpCodes.Ble, eol);
+
+            cg.MarkLabel(produceCount);
+            current.EmitGet(cg);
+            cg.Emit(OpCodes.Conv_I4);
+            cg.EmitCall(typeof(Ops), "Int2Object");
+            current.EmitGet(cg);
+            step.EmitGet(cg);
+            cg.Emit(OpCodes.Conv_I8);
+            cg.Emit(OpCodes.Add);
+            current.EmitSet(cg);
+            cg.Emit(OpCodes.Br, assign);
+
+            // enumerated
+            cg.MarkLabel(nextItem);
+            iter.EmitGet(cg);
+            cg.EmitCall(typeof(IEnumerator), "MoveNext");
+            cg.Emit(OpCodes.Brfalse, eol);
+            iter.EmitGet(cg);
+            cg.EmitCall(typeof(IEnumerator).GetProperty("Current").GetGetMethod());
+
+            cg.MarkLabel(assign);
+            cg.PushTargets(breakTarget, continueTarget);
+
+            lhs.EmitSet(cg);
+
+            body.Emit(cg);
+
+            cg.Emit(OpCodes.Br, continueTarget);
+
+            cg.PopTargets();
+
+            cg.MarkLabel(eol);
+            if (elseStmt != null) {
+                elseStmt.Emit(cg);
+            }
+            cg.MarkLabel(breakTarget);
+
+            cg.FreeLocalTmp(func);
+            foreach (Slot arg in args) cg.FreeLocalTmp(arg);
+            cg.FreeLocalTmp(counted);
+            cg.FreeLocalTmp(current);
+            cg.FreeLocalTmp(stop);
+            cg.FreeLocalTmp(step);
+            cg.FreeLocalTmp(iter);
+        }
+
         public override void Walk(IAstWalker walker) {
             if (walker.Walk(this)) {
                 lhs.Walk(walker);
@@ -1492,7 +1675,11 @@ namespace IronPython.Compiler.Ast {
     }
 
     public class RaiseStatement : Statement {
+        private static readonly SymbolId StopIterationName = SymbolTable.StringToId("StopIteration");
+        private static readonly SymbolId IndexErrorName = SymbolTable.StringToId("IndexError");
+
         private readonly Expression type, value, traceback;
+        private Slot iterationStops;
 
         public RaiseStatement(Expression exceptionType, Expression exceptionValue, Expression traceBack) {
             this.type = exceptionType; this.value = exceptionValue; this.traceback = traceBack;
@@ -1511,6 +1698,30 @@ namespace IronPython.Compiler.Ast {
             get { return type; }
         }
 
+        /// <summary>
+        /// True for raise StopIteration and raise IndexError, w/ the exception named directly or
+        /// called.  Those are the exceptions which end an iteration.
+        /// </summary>
+        internal bool RaisesIterationStop {
+            get {
+                Expression target = type;
+                CallExpression call = target as CallExpression;
+                if (call != null) target = call.Target;
+
+                NameExpression name = target as NameExpression;
+                return name != null && (name.Name == StopIterationName || name.Name == IndexErrorName);
+            }
+        }
+
+        /// <summary>
+        /// Set by the enclosing function while it's emitted when the raise can end the function by
+        /// returning Ops.IterationStopped instead.  The slot holds the result of Ops.TakeIterationStops.
+        /// </summary>
+        internal Slot IterationStops {
+            get { return iterationStops; }
+            set { iterationStops = value; }
+        }
+
         internal override void Emit(CodeGen cg) {
             cg.EmitPosition(Start, End);
             if (type == null && value == null && traceback == null) {
@@ -1520,7 +1731,13 @@ namespace IronPython.Compiler.Ast {
                 cg.EmitExprOrNone(type);
                 cg.EmitExprOrNone(value);
                 cg.EmitExprOrNone(traceback);
-                cg.EmitCall(typeof(Ops), "Raise", new Type[] { typeof(object), typeof(object), typeof(object) });
+                if (iterationStops != null) {
+                    iterationStops.EmitGet(cg);
+                    cg.EmitCall(typeof(Ops), "RaiseOrStopIteration", new Type[] { typeof(object), typeof(object), typeof(object), typeof(int) });
+                    cg.EmitReturnFromObject();
+                } else {
+                    cg.EmitCall(typeof(Ops), "Raise", new Type[] { typeof(object), typeof(object), typeof(object) });
+                }
             }
         }
         public override void Walk(IAstWalker walker) {
@@ -812,6 +812,28 @@ namespace IronPython.Compiler.Generation {
             }
         }
 
+        /// <summary>
+        /// Emits a reference to a new GetAttrSite for name.  Returns false, emitting nothing,
+        /// if the method has nowhere to store the site.
+        /// </summary>
+        public bool TryEmitGetAttrSite(SymbolId name) {
+            if (typeGen != null) {
+                typeGen.AddGetAttrSite(name).EmitGet(this);
+                return true;
+            }
+
+            if (staticData != null && contextSlot != null) {
+                EmitCallerContext();
+                EmitInt(staticData.Count);
+                EmitCall(typeof(ICallerContext), "GetStaticData");
+                Emit(OpCodes.Castclass, typeof(GetAttrSite));
+                staticData.Add(new GetAttrSite(name));
+                return true;
+            }
+
+            return false;
+        }
+
         public void EmitUInt(uint i) {
             EmitInt((int)i);
             Emit(OpCodes.Conv_U4);
@@ -0,0 +1,209 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Reflection;
+using System.Security.Cryptography;
+using System.Text;
+
+using IronPython.Runtime;
+
+namespace IronPython.Compiler.Generation {
+    /// <summary>
+    /// Caches the assemblies generated for modules imported from source so that later imports,
+    /// including those made by other processes, load the assembly instead of parsing and
+    /// compiling the module again.  This is the equivalent of CPython's .pyc files.
+    ///
+    /// Cached assemblies are written next to the source file, or to Options.BinariesDirectory if
+    /// it is set.  The name of the cache file includes a hash of the source file's path, size,
+    /// timestamp and contents along with the module name, the IronPython build and the options
+    /// which affect code generation.  The hash is SHA1, which is available when Windows enforces
+    /// FIPS algorithms (MD5 isn't); if no hash is available modules simply aren't cached.  A changed source file or a different configuration simply
+    /// misses the cache, and the out of date files for the module are removed when the new one
+    /// is written.
+    ///
+    /// Assemblies are written to a temporary file which is then renamed, so readers never see a
+    /// partially written file.  If two writers race the second rename fails and that writer
+    /// discards its copy; both copies are equivalent.
+    /// </summary>
+    static class ModuleCache {
+        private const string CacheExtension = ".ipyc";
+        private const string TempExtension = ".tmp";
+
+        // Assembly.LoadFile returns the same assembly when a file is loaded twice, but the statics
+        // of a compiled module can only be used by one module instance.
+        private static Dictionary<string, bool> loadedFiles = new Dictionary<string, bool>(StringComparer.OrdinalIgnoreCase);
+
+        /// <summary>
+        /// Returns the name of the cache file for the source file, or null if the source
+        /// file can't be read or can't be hashed.
+        /// </summary>
+        internal static string GetCacheFile(string moduleName, string sourceFile) {
+            try {
+                FileInfo info = new FileInfo(sourceFile);
+                string fullPath = info.FullName;
+                string outDir = Options.BinariesDirectory == null ? info.DirectoryName : Options.BinariesDirectory;
+
+                StringBuilder key = new StringBuilder();
+                key.Append(moduleName).Append('|');
+                key.Append(info.Length).Append('|');
+                key.Append(info.LastWriteTimeUtc.Ticks).Append('|');
+                key.Append(GetEngineVersion()).Append('|');
+                key.Append(GetCodeGenerationOptions()).Append('|');
+
+                byte[] contents = File.ReadAllBytes(fullPath);
+                using (SHA1 sha = SHA1.Create()) {
+                    key.Append(ToHex(sha.ComputeHash(contents), 16));
+
+                    return Path.Combine(outDir, GetFilePrefix(sha, fullPath) + ToHex(sha.ComputeHash(Encoding.UTF8.GetBytes(key.ToString())), 16) + CacheExtension);
+                }
+            } catch (IOException) {
+                return null;
+            } catch (UnauthorizedAccessException) {
+                return null;
+            } catch (InvalidOperationException) {
+                // the hash algorithm isn't permitted by the system's crypto policy
+                return null;
+            } catch (CryptographicException) {
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Loads the module from the cache file if it exists, otherwise returns null.
+        /// </summary>
+        internal static PythonModule TryLoad(SystemState state, string moduleName, string cacheFile) {
+            lock (loadedFiles) {
+                if (loadedFiles.ContainsKey(cacheFile) || !File.Exists(cacheFile)) return null;
+                loadedFiles[cacheFile] = true;
+            }
+
+            Type type;
+            try {
+                Assembly assm = Assembly.LoadFile(cacheFile);
+                type = assm.GetType(moduleName);
+            } catch (IOException) {
+                return null;
+            } catch (BadImageFormatException) {
+                // a corrupt file, let the next write replace it.
+                TryDelete(cacheFile);
+                return null;
+            } catch (TypeLoadException) {
+                return null;
+            }
+
+            if (type == null || !typeof(CompiledModule).IsAssignableFrom(type)) return null;
+
+            return CompiledModule.Load(moduleName, type, state);
+        }
+
+        /// <summary>
+        /// Returns the name of the temporary file the assembly for cacheFile is written to.  The
+        /// name is unique to this writer.
+        /// </summary>
+        internal static string GetTempFileName(string cacheFile) {
+            return Path.GetFileNameWithoutExtension(cacheFile) + "." + Guid.NewGuid().ToString("N") + TempExtension;
+        }
+
+        /// <summary>
+        /// Moves the assembly (and its symbols) written to tempFile into the cache and removes any
+        /// out of date cache files for the same source file.  Failures are ignored, the module just
+        /// isn't cached.
+        /// </summary>
+        internal static void Commit(string tempFile, string cacheFile) {
+            string dir = Path.GetDirectoryName(cacheFile);
+            string tempPdb = Path.ChangeExtension(tempFile, ".pdb");
+            try {
+                try {
+                    File.Move(tempFile, cacheFile);
+                } catch (IOException) {
+                    // someone else already wrote the same module, keep theirs
+                    TryDelete(tempFile);
+                    TryDelete(tempPdb);
+                    return;
+                }
+
+                if (File.Exists(tempPdb)) {
+                    string pdb = Path.ChangeExtension(cacheFile, ".pdb");
+                    TryDelete(pdb);
+                    File.Move(tempPdb, pdb);
+                }
+
+                string prefix = Path.GetFileName(cacheFile);
+                prefix = prefix.Substring(0, prefix.Length - CacheExtension.Length - 16);
+                foreach (string file in Directory.GetFiles(dir, prefix + "*" + CacheExtension)) {
+                    if (String.Compare(file, cacheFile, StringComparison.OrdinalIgnoreCase) == 0) continue;
+
+                    TryDelete(file);
+                    TryDelete(Path.ChangeExtension(file, ".pdb"));
+                }
+            } catch (IOException) {
+            } catch (UnauthorizedAccessException) {
+            }
+        }
+
+        internal static void TryDelete(string file) {
+            try {
+                File.Delete(file);
+            } catch (IOException) {
+                // in use by another process
+            } catch (UnauthorizedAccessException) {
+            }
+        }
+
+        /// <summary>
+        /// Cache files start w/ the source file name and a hash of its full path, so that
+        /// source files w/ the same name in different directories can share BinariesDirectory.
+        /// </summary>
+        private static string GetFilePrefix(HashAlgorithm hash, string fullPath) {
+            byte[] pathHash = hash.ComputeHash(Encoding.UTF8.GetBytes(fullPath.ToLowerInvariant()));
+            return Path.GetFileNameWithoutExtension(fullPath) + "." + ToHex(pathHash, 8) + ".";
+        }
+
+        private static string GetEngineVersion() {
+            Module engine = typeof(ModuleCache).Module;
+            return engine.Assembly.GetName().Version.ToString() + "/" + engine.ModuleVersionId.ToString();
+        }
+
+        private static string GetCodeGenerationOptions() {
+            return String.Join(",", new string[] {
+                Options.DebugMode.ToString(),
+                Options.EngineDebug.ToString(),
+                Options.TraceBackSupport.ToString(),
+                Options.CheckInitialized.ToString(),
+                Options.CacheAttributeLookups.ToString(),
+                Options.InlineNumericOperations.ToString(),
+                Options.OptimizeEnvironments.ToString(),
+                Options.Frames.ToString(),
+                Options.GenerateDynamicMethods.ToString(),
+                Options.GenerateSafeCasts.ToString(),
+                Options.DoNotCacheConstants.ToString(),
+                Options.StripDocStrings.ToString(),
+                Options.Division.ToString(),
+                Options.Python25.ToString(),
+            });
+        }
+
+        private static string ToHex(byte[] bytes, int length) {
+            StringBuilder res = new StringBuilder(length);
+            for (int i = 0; i < length / 2; i++) {
+                res.Append(bytes[i].ToString("x2"));
+            }
+            return res.ToString();
+        }
+    }
+}
@@ -189,6 +189,40 @@ namespace IronPython.Compiler.Generation {
             return DoGenerateModule(state, context, gs, moduleName, context.SourceFile, outSuffix);
         }
 
+        /// <summary>
+        /// Generates the module and saves the assembly as cacheFile so it can be loaded by
+        /// later imports (see ModuleCache).
+        /// </summary>
+        internal static PythonModule GenerateCachedModule(SystemState state, CompilerContext context, Statement body, string moduleName, string cacheFile) {
+            GlobalSuite gs = Ast.Binder.Bind(body, context);
+
+            string outDir = Path.GetDirectoryName(cacheFile);
+            string tempFile = ModuleCache.GetTempFileName(cacheFile);
+
+            AssemblyGen ag = new AssemblyGen(moduleName, outDir, tempFile, true);
+            ag.SetPythonSourceFile(Path.GetFullPath(context.SourceFile));
+
+            Type ret = GenerateModuleCode(context, gs, moduleName, ag);
+
+            bool saved = false;
+            try {
+                ag.Dump();
+                saved = true;
+            } catch (IOException) {
+            } catch (UnauthorizedAccessException) {
+            }
+
+            string tempPath = Path.Combine(outDir, tempFile);
+            if (saved) {
+                ModuleCache.Commit(tempPath, cacheFile);
+            } else {
+                ModuleCache.TryDelete(tempPath);
+            }
+
+            // use the in-memory assembly, the cached copy will be used by the next import
+            return CompiledModule.Load(moduleName, ret, state);
+        }
+
         [PythonType(typeof(Dict))]
         internal class SnippetModuleRunner : CompiledModule {
             PythonModule module;
@@ -266,7 +300,15 @@ namespace IronPython.Compiler.Generation {
             AssemblyGen ag = new AssemblyGen(moduleName + outSuffix, outDir, fileName + outSuffix + ".exe", true);
             ag.SetPythonSourceFile(fullPath);
 
+            Type ret = GenerateModuleCode(context, gs, moduleName, ag);
+            Assembly assm = ag.DumpAndLoad();
+            ret = assm.GetType(moduleName);
+
+            PythonModule pmod = CompiledModule.Load(moduleName, ret, state);
+            return pmod;
+        }
 
+        private static Type GenerateModuleCode(CompilerContext context, GlobalSuite gs, string moduleName, AssemblyGen ag) {
             TypeGen tg = GenerateModuleType(moduleName, ag);
             CodeGen cg = GenerateModuleInitialize(context, gs, tg);
 
@@ -274,12 +316,7 @@ namespace IronPython.Compiler.Generation {
             ag.SetEntryPoint(main.MethodInfo, PEFileKinds.ConsoleApplication);
             ag.AddPythonModuleAttribute(tg, moduleName);
 
-            Type ret = tg.FinishType();
-            Assembly assm = ag.DumpAndLoad();
-            ret = assm.GetType(moduleName);
-
-            PythonModule pmod = CompiledModule.Load(moduleName, ret, state);
-            return pmod;
+            return tg.FinishType();
         }
 
         internal delegate void CustomModuleInit(CodeGen cg);
@@ -24,6 +24,7 @@ using System.Reflection.Emit;
 using System.Security.Permissions;
 
 using IronPython.Runtime;
+using IronPython.Runtime.Calls;
 using IronMath;
 
 namespace IronPython.Compiler.Generation {
@@ -37,6 +38,7 @@ namespace IronPython.Compiler.Generation {
         private CodeGen initGen; // The IL generator for the .cctor()
         private Dictionary<object, Slot> constants = new Dictionary<object, Slot>();
         private Dictionary<SymbolId, Slot> indirectSymbolIds = new Dictionary<SymbolId, Slot>();
+        private int siteCount;
         private List<TypeGen> nestedTypeGens = new List<TypeGen>();
 
         internal ConstructorBuilder DefaultConstructor;
@@ -231,6 +233,22 @@ namespace IronPython.Compiler.Generation {
             return ret;
         }
 
+        /// <summary>
+        /// Creates a static field holding a new GetAttrSite for name.  Unlike constants
+        /// sites are never shared, each one caches the types seen at a single location.
+        /// </summary>
+        public Slot AddGetAttrSite(SymbolId name) {
+            Slot site = AddStaticField(typeof(GetAttrSite), FieldAttributes.Private | FieldAttributes.InitOnly,
+                "site$" + SymbolTable.IdToString(name) + "$" + siteCount++);
+
+            CodeGen init = GetOrMakeInitializer();
+            init.EmitSymbolId(name);
+            init.EmitNew(typeof(GetAttrSite), new Type[] { typeof(SymbolId) });
+            site.EmitSet(init);
+
+            return site;
+        }
+
         public void EmitIndirectedSymbol(CodeGen cg, SymbolId id) {
             Slot value;
             if (!indirectSymbolIds.TryGetValue(id, out value)) {
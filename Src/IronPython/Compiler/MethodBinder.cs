@@ -14,6 +14,7 @@
  * **********************************************************************************/
 
 using System;
+using System.Collections;
 using System.Collections.Generic;
 using System.Reflection;
 using System.Reflection.Emit;
@@ -34,6 +35,54 @@ namespace IronPython.Compiler {
         ImplicitInstance,
     }
 
+    /// <summary>
+    /// Statistics for the per-signature overload resolution caches kept by MethodBinder.
+    ///
+    /// When a call into an overloaded CLR method is made the binder remembers which overload
+    /// was selected for the CLR types of the arguments, so subsequent calls with the same types
+    /// skip the applicability checks and the comparison of the candidates.  Each overload set
+    /// remembers at most MaxSignatures different argument type lists.
+    ///
+    /// The counters are not updated atomically; they are accurate enough for tuning.
+    /// </summary>
+    public static class MethodBinderCache {
+        /// <summary>
+        /// The maximum number of distinct argument type lists remembered for a single overload set.
+        /// </summary>
+        public const int MaxSignatures = 64;
+
+        internal static long hits, misses;
+
+        /// <summary>
+        /// The number of overloaded calls which re-used a previously selected overload.
+        /// </summary>
+        public static long Hits {
+            get { return hits; }
+        }
+
+        /// <summary>
+        /// The number of overloaded calls which required a full overload resolution.
+        /// </summary>
+        public static long Misses {
+            get { return misses; }
+        }
+
+        /// <summary>
+        /// The fraction of overloaded calls which were satisfied from the cache.
+        /// </summary>
+        public static double HitRatio {
+            get {
+                long total = hits + misses;
+                if (total == 0) return 0.0;
+                return (double)hits / total;
+            }
+        }
+
+        public static void ResetStatistics() {
+            hits = misses = 0;
+        }
+    }
+
     class MethodBinder {
         string name;
         bool isBinaryOperator;
@@ -1068,10 +1117,13 @@ namespace IronPython.Compiler {
 
 
         class TargetSet {
+            private static readonly object NotImplementedTarget = new object();
+
             private MethodBinder binder;
             internal int count;
             internal List<MethodTarget> targets;
             private bool hasConflict = false;
+            private Hashtable resolved;     // ArgumentSignature -> MethodTarget or NotImplementedTarget
 
             public TargetSet(MethodBinder binder, int count) {
                 this.binder = binder;
@@ -1142,6 +1194,39 @@ namespace IronPython.Compiler {
             public object Call(ICallerContext context, CallType callType, object[] args) {
                 if (targets.Count == 1 && !binder.isBinaryOperator) return targets[0].Call(context, args);
 
+                // applicability only depends on the types of the arguments, so the
+                // overload selected for one call is valid for any call w/ the same types.
+                ArgumentSignature signature = new ArgumentSignature(callType, args);
+                Hashtable cache = resolved;
+                object selected = cache == null ? null : cache[signature];
+                if (selected != null) {
+                    MethodBinderCache.hits++;
+                } else {
+                    MethodBinderCache.misses++;
+                    selected = SelectTarget(context, callType, args);
+                    AddResolved(signature, selected);
+                }
+
+                if (selected == NotImplementedTarget) return Ops.NotImplemented;
+                return ((MethodTarget)selected).Call(context, args);
+            }
+
+            private void AddResolved(ArgumentSignature signature, object selected) {
+                if (resolved == null) resolved = new Hashtable();
+
+                // Hashtable supports any number of concurrent readers w/ a single writer
+                lock (resolved) {
+                    if (resolved.Count < MethodBinderCache.MaxSignatures) {
+                        resolved[signature] = selected;
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Performs overload resolution for the arguments, returning the MethodTarget to call or
+            /// NotImplementedTarget if this is a binary operator which doesn't support the arguments.
+            /// </summary>
+            private object SelectTarget(ICallerContext context, CallType callType, object[] args) {
                 List<MethodTarget> applicableTargets = new List<MethodTarget>();
                 foreach (MethodTarget target in targets) {
                     if (target.IsApplicable(args, NarrowingLevel.None)) {
@@ -1150,18 +1235,18 @@ namespace IronPython.Compiler {
                 }
 
                 if (applicableTargets.Count == 1) {
-                    return applicableTargets[0].Call(context, args);
+                    return applicableTargets[0];
                 }
                 if (applicableTargets.Count > 1) {
                     MethodTarget target = FindBest(callType, applicableTargets);
                     if (target != null) {
-                        return target.Call(context, args);
+                        return target;
                     } else {
                         throw MultipleTargets(applicableTargets, context, callType, args);
                     }
                 }
 
-                if (binder.isBinaryOperator) return Ops.NotImplemented;
+                if (binder.isBinaryOperator) return NotImplementedTarget;
 
                 //no targets are applicable without narrowing conversions, so try those
 
@@ -1180,7 +1265,7 @@ namespace IronPython.Compiler {
                 }
 
                 if (applicableTargets.Count == 1) {
-                    return applicableTargets[0].Call(context, args);
+                    return applicableTargets[0];
                 }
 
                 if (applicableTargets.Count == 0) {
@@ -1265,5 +1350,47 @@ namespace IronPython.Compiler {
                 return string.Format("TargetSet({0} on {1}, nargs={2})", targets[0].method.Name, targets[0].method.DeclaringType.FullName, count);
             }
         }
+
+        /// <summary>
+        /// The CLR types of the arguments to a call (null for None) along w/ the CallType, used as
+        /// the key for the overload resolution cache.
+        /// </summary>
+        sealed class ArgumentSignature {
+            private readonly CallType callType;
+            private readonly Type[] types;
+            private readonly int hashCode;
+
+            public ArgumentSignature(CallType callType, object[] args) {
+                this.callType = callType;
+                this.types = new Type[args.Length];
+
+                int hash = (int)callType;
+                for (int i = 0; i < args.Length; i++) {
+                    object arg = args[i];
+                    if (arg != null) {
+                        Type t = arg.GetType();
+                        types[i] = t;
+                        hash = (hash * 31) ^ t.GetHashCode();
+                    } else {
+                        hash = hash * 31;
+                    }
+                }
+                hashCode = hash;
+            }
+
+            public override bool Equals(object obj) {
+                ArgumentSignature other = obj as ArgumentSignature;
+                if (other == null || other.hashCode != hashCode || other.callType != callType || other.types.Length != types.Length) return false;
+
+                for (int i = 0; i < types.Length; i++) {
+                    if (types[i] != other.types[i]) return false;
+                }
+                return true;
+            }
+
+            public override int GetHashCode() {
+                return hashCode;
+            }
+        }
     }
 }
@@ -35,6 +35,8 @@ namespace IronPython.Compiler {
         private static bool traceBackSupport = (IntPtr.Size == 4);  // currently only enabled on 32-bit
         private static bool checkInitialized = true;
         private static bool optimizeReflectCalls = true;
+        private static bool cacheAttributeLookups = true;
+        private static bool inlineNumericOperations;
         private static bool trackPerformance;
         private static bool optimizeEnvironments = true;
         private static bool fastEval;
@@ -46,8 +48,10 @@ namespace IronPython.Compiler {
         private static bool generateSafeCasts = true;
         private static bool doNotCacheConstants;
         private static bool saveAndReloadBinaries;
+        private static bool cacheCompiledModules;
         private static bool generateModulesAsSnippets;
         private static int maximumRecursion = Int32.MaxValue;
+        private static int regexCompileThreshold = 1000;
         private static bool bufferedStdOutAndError = true;
         private static bool warningOnIndentationInconsistency;
         private static bool errorOnIndentationInconsistency;
@@ -105,6 +109,25 @@ namespace IronPython.Compiler {
             set { Options.optimizeReflectCalls = value; }
         }
 
+        /// <summary>
+        /// Should attribute accesses (obj.attr) be compiled to use per-site
+        /// caches of the attribute lookup (see GetAttrSite)
+        /// </summary>
+        public static bool CacheAttributeLookups {
+            get { return Options.cacheAttributeLookups; }
+            set { Options.cacheAttributeLookups = value; }
+        }
+
+        /// <summary>
+        /// Should binary operators be compiled with inline fast paths for
+        /// int op int and float op float, falling back to the Ops call for
+        /// any other operand types
+        /// </summary>
+        public static bool InlineNumericOperations {
+            get { return Options.inlineNumericOperations; }
+            set { Options.inlineNumericOperations = value; }
+        }
+
         /// <summary>
         /// Closures, generators and environments can use the optimized
         /// generated environments FunctionEnvironment2 .. 32 
@@ -170,6 +193,15 @@ namespace IronPython.Compiler {
             set { Options.binariesDirectory = value; }
         }
 
+        /// <summary>
+        /// Should the assemblies generated for imported modules be saved next to
+        /// the source (or in BinariesDirectory) and re-used by later imports?
+        /// </summary>
+        public static bool CacheCompiledModules {
+            get { return Options.cacheCompiledModules; }
+            set { Options.cacheCompiledModules = value; }
+        }
+
         public static bool PrivateBinding {
             get { return Options.privateBinding; }
             set { Options.privateBinding = value; }
@@ -196,6 +228,15 @@ namespace IronPython.Compiler {
             set { Options.maximumRecursion = value; }
         }
 
+        /// <summary>
+        /// The number of times a regular expression is used before it's compiled to IL.  0
+        /// compiles every regular expression when it's created and -1 never compiles them.
+        /// </summary>
+        public static int RegexCompileThreshold {
+            get { return Options.regexCompileThreshold; }
+            set { Options.regexCompileThreshold = value; }
+        }
+
         public static bool BufferedStandardOutAndError {
             get { return Options.bufferedStdOutAndError; }
             set { Options.bufferedStdOutAndError = value; }
@@ -40,6 +40,7 @@ namespace IronPython.Hosting {
         private bool exceptionDetail;
         private bool showClrExceptions;
         private bool skipFirstLine;
+        private int codeCacheSize;
 
         #region Public accessors
 
@@ -80,6 +81,20 @@ namespace IronPython.Hosting {
             set { showClrExceptions = value; }
         }
 
+        /// <summary>
+        /// The number of compiled snippets the engine keeps so that executing, evaluating or
+        /// creating a delegate from the same source text again doesn't re-compile it.  The least
+        /// recently used code is discarded once the limit is reached.  0 (the default) disables
+        /// the cache.
+        /// </summary>
+        public int CodeCacheSize {
+            get { return codeCacheSize; }
+            set {
+                if (value < 0) throw new ArgumentOutOfRangeException("value", "CodeCacheSize must be non-negative");
+                codeCacheSize = value;
+            }
+        }
+
         #endregion
 
         internal EngineOptions Clone() {
@@ -123,6 +138,9 @@ namespace IronPython.Hosting {
 
         private PythonFile stdIn, stdOut, stdErr;
 
+        // compiled code keyed by source text, null if the cache is disabled
+        private LruCache<CodeCacheKey, object> codeCache;
+
         #endregion
 
         #region Constructor
@@ -176,6 +194,10 @@ namespace IronPython.Hosting {
 
             systemState = new SystemState(engineOptions);
             defaultModule = new EngineModule("defaultModule", new Dictionary<string, object>(), systemState);
+
+            if (engineOptions.CodeCacheSize > 0) {
+                codeCache = new LruCache<CodeCacheKey, object>(engineOptions.CodeCacheSize);
+            }
         }
 
         internal void EnsureValidModule(EngineModule engineModule) {
@@ -617,7 +639,18 @@ namespace IronPython.Hosting {
         public object Evaluate(string expression, EngineModule engineModule, IDictionary<string, object> locals) {
             ModuleScope moduleScope = GetModuleScope(engineModule, locals);
 
-            return Builtin.Eval(moduleScope, expression);
+            if (codeCache == null || Options.FastEvaluation) {
+                return Builtin.Eval(moduleScope, expression);
+            }
+
+            CompilerContext context = moduleScope.CreateCompilerContext();
+            CodeCacheKey key = new CodeCacheKey(CodeCacheKind.Expression, expression, context, null, null);
+            object cached;
+            if (!codeCache.TryGetValue(key, out cached)) {
+                cached = Builtin.CompileEval(moduleScope.SystemState, context, expression);
+                codeCache.Add(key, cached);
+            }
+            return ((CompiledCode)cached).Run(moduleScope);
         }
 
         [System.Diagnostics.CodeAnalysis.SuppressMessage("Microsoft.Design", "CA1004:GenericMethodsShouldProvideTypeParameter")]
@@ -753,13 +786,23 @@ namespace IronPython.Hosting {
         public ModuleBinder<TDelegate> CreateMethodUnscoped<TDelegate>(string statements, IList<string> parameters) {
             ValidateCreationParameters<TDelegate>();
 
+            CodeCacheKey key = null;
+            object cached;
+            if (codeCache != null) {
+                key = new CodeCacheKey(CodeCacheKind.Method, statements, DefaultCompilerContext(), typeof(TDelegate), parameters);
+                if (codeCache.TryGetValue(key, out cached)) return (ModuleBinder<TDelegate>)cached;
+            }
+
             Parser p = Parser.FromString(Sys, DefaultCompilerContext(), statements);
             CodeGen cg = CreateDelegateWorker<TDelegate>(p.ParseFunction(), parameters);
 
-            return delegate(EngineModule engineModule) {
+            ModuleBinder<TDelegate> res = delegate(EngineModule engineModule) {
                 ModuleScope scope = GetModuleScope(engineModule, null);
                 return (TDelegate)(object)cg.CreateDelegate(typeof(TDelegate), scope);
             };
+
+            if (key != null) codeCache.Add(key, res);
+            return res;
         }
 
 #if DEBUG
@@ -777,6 +820,13 @@ namespace IronPython.Hosting {
         public ModuleBinder<TDelegate> CreateLambdaUnscoped<TDelegate>(string expression, IList<string> parameters) {
             ValidateCreationParameters<TDelegate>();
 
+            CodeCacheKey key = null;
+            object cached;
+            if (codeCache != null) {
+                key = new CodeCacheKey(CodeCacheKind.Lambda, expression, DefaultCompilerContext(), typeof(TDelegate), parameters);
+                if (codeCache.TryGetValue(key, out cached)) return (ModuleBinder<TDelegate>)cached;
+            }
+
             Parser p = Parser.FromString(Sys, DefaultCompilerContext(), expression.TrimStart(' ', '\t'));
             Expression e = p.ParseTestListAsExpression();
             ReturnStatement ret = new ReturnStatement(e);
@@ -784,10 +834,13 @@ namespace IronPython.Hosting {
             ret.SetLoc(new Location(lineCnt, 0), new Location(lineCnt, 10));
             CodeGen cg = CreateDelegateWorker<TDelegate>(ret, parameters);
 
-            return delegate(EngineModule engineModule) {
+            ModuleBinder<TDelegate> res = delegate(EngineModule engineModule) {
                 ModuleScope scope = GetModuleScope(engineModule, null);
                 return (TDelegate)(object)cg.CreateDelegate(typeof(TDelegate), scope);
             };
+
+            if (key != null) codeCache.Add(key, res);
+            return res;
         }
 
         private static void ValidateCreationParameters<T>() {
@@ -941,8 +994,18 @@ namespace IronPython.Hosting {
             // When a sourceFileName is passed in, it is used to generated debug info
             CompilerContext context = DefaultCompilerContext(sourceFileName);
 
-            Parser p = Parser.FromString(Sys, context, scriptCode);
-            return Compile(p, sourceFileName != null);
+            if (codeCache == null) {
+                Parser p = Parser.FromString(Sys, context, scriptCode);
+                return Compile(p, sourceFileName != null);
+            }
+
+            CodeCacheKey key = new CodeCacheKey(CodeCacheKind.Statements, scriptCode, context, null, null);
+            object cached;
+            if (!codeCache.TryGetValue(key, out cached)) {
+                cached = Compile(Parser.FromString(Sys, context, scriptCode), sourceFileName != null);
+                codeCache.Add(key, cached);
+            }
+            return (CompiledCode)cached;
         }
 
         public CompiledCode CompileFile(string fileName) {
@@ -953,6 +1016,101 @@ namespace IronPython.Hosting {
 
         #endregion
 
+        #region Code Cache
+
+        /// <summary>
+        /// The number of times compiling a snippet was avoided by re-using code from the code cache.
+        /// </summary>
+        public long CodeCacheHits {
+            get { return codeCache == null ? 0 : codeCache.Hits; }
+        }
+
+        /// <summary>
+        /// The number of snippets which had to be compiled because they weren't in the code cache.
+        /// </summary>
+        public long CodeCacheMisses {
+            get { return codeCache == null ? 0 : codeCache.Misses; }
+        }
+
+        /// <summary>
+        /// The number of compiled snippets discarded to make room for new ones.
+        /// </summary>
+        public long CodeCacheEvictions {
+            get { return codeCache == null ? 0 : codeCache.Evictions; }
+        }
+
+        /// <summary>
+        /// Discards all of the code in the code cache and resets its statistics.  Hosts should call
+        /// this after changing IronPython.Compiler.Options which affect code generation.
+        /// </summary>
+        public void ClearCodeCache() {
+            if (codeCache != null) codeCache.Clear();
+        }
+
+        private enum CodeCacheKind {
+            Statements,
+            Expression,
+            Method,
+            Lambda,
+        }
+
+        /// <summary>
+        /// Identifies a snippet in the code cache: the source text along with everything else
+        /// which affects the code generated for it.
+        /// </summary>
+        private sealed class CodeCacheKey : IEquatable<CodeCacheKey> {
+            private readonly CodeCacheKind kind;
+            private readonly string source;
+            private readonly string fileName;
+            private readonly bool trueDivision, allowWithStatement;
+            private readonly Type delegateType;
+            private readonly string[] parameters;
+            private readonly int hash;
+
+            public CodeCacheKey(CodeCacheKind kind, string source, CompilerContext context, Type delegateType, IList<string> parameters) {
+                this.kind = kind;
+                this.source = source;
+                this.fileName = context.SourceFile;
+                this.trueDivision = context.TrueDivision;
+                this.allowWithStatement = context.AllowWithStatement;
+                this.delegateType = delegateType;
+                if (parameters != null) {
+                    this.parameters = new string[parameters.Count];
+                    parameters.CopyTo(this.parameters, 0);
+                }
+
+                hash = source.GetHashCode() ^ (int)kind;
+                if (fileName != null) hash ^= fileName.GetHashCode() * 31;
+                if (delegateType != null) hash ^= delegateType.GetHashCode();
+            }
+
+            public bool Equals(CodeCacheKey other) {
+                if (other == null || hash != other.hash || kind != other.kind ||
+                    trueDivision != other.trueDivision || allowWithStatement != other.allowWithStatement ||
+                    delegateType != other.delegateType ||
+                    source != other.source || fileName != other.fileName) {
+                    return false;
+                }
+
+                if (parameters == null || other.parameters == null) return parameters == other.parameters;
+                if (parameters.Length != other.parameters.Length) return false;
+                for (int i = 0; i < parameters.Length; i++) {
+                    if (parameters[i] != other.parameters[i]) return false;
+                }
+                return true;
+            }
+
+            public override bool Equals(object obj) {
+                return Equals(obj as CodeCacheKey);
+            }
+
+            public override int GetHashCode() {
+                return hash;
+            }
+        }
+
+        #endregion
+
         private CompilerContext DefaultCompilerContext() {
             return DefaultCompilerContext(null);
         }
@@ -357,12 +357,20 @@ namespace IronPython.Modules {
                 // Direct evaluation can be much faster than codegen (>100x)
                 return e.Evaluate(new NameEnvironment(moduleScope.Module, ((ICallerContext)moduleScope).Locals));
             } else {
-                Statement s = new ReturnStatement(e);
-                CompiledCode compiledCode = OutputGenerator.GenerateSnippet(cc, s);
-                return compiledCode.Run(moduleScope);
+                return CompileEval(e, cc).Run(moduleScope);
             }
         }
 
+        internal static CompiledCode CompileEval(SystemState state, CompilerContext cc, string expression) {
+            Parser p = Parser.FromString(state, cc, expression.TrimStart(' ', '\t'));
+            return CompileEval(p.ParseTestListAsExpression(), cc);
+        }
+
+        private static CompiledCode CompileEval(Expression e, CompilerContext cc) {
+            Statement s = new ReturnStatement(e);
+            return OutputGenerator.GenerateSnippet(cc, s);
+        }
+
         [PythonName("execfile")]
         public static object ExecFile(ICallerContext context, object filename) {
             return ExecFile(context, filename, null, null);
@@ -1159,21 +1167,24 @@ namespace IronPython.Modules {
                 throw Ops.ValueError("step of 0");
             }
 
-            List ret;
+            // computed in longs so that stepping past Int32.MaxValue (or MinValue) can't wrap around
+            long length;
             if (step > 0) {
                 if (start > stop) stop = start;
-                ret = List.MakeEmptyList((stop - start) / step);
-                for (int i = start; i < stop; i += step) {
-                    ret.AddNoLock(Ops.Int2Object(i));
-                }
+                length = ((long)stop - start + step - 1) / step;
             } else {
                 if (start < stop) stop = start;
-                ret = List.MakeEmptyList((stop - start) / step);
-                for (int i = start; i > stop; i += step) {
-                    ret.AddNoLock(Ops.Int2Object(i));
+                length = ((long)stop - start + step + 1) / step;
+            }
+
+            if (length <= Int32.MaxValue) {
+                List ret = List.MakeEmptyList((int)length);
+                for (long i = start; length > 0; i += step, length--) {
+                    ret.AddNoLock(Ops.Int2Object((int)i));
                 }
+                return ret;
             }
-            return ret;
+            throw Ops.OverflowError("too many items for list");
         }
 
         private static object rangeWorker(BigInteger start, BigInteger stop, BigInteger step) {
@@ -69,12 +69,10 @@ namespace IronPython.Modules {
             )]
         [PythonName("dumps")]
         public static string DumpToString(ICallerContext context, object obj, [DefaultParameterValue(null)] object protocol, [DefaultParameterValue(null)] object bin) {
-            //??? possible perf enhancement: use a C# TextWriter-backed IFileOutput and
-            // thus avoid Python call overhead. Also do similar thing for LoadFromString.
-            object stringIO = Ops.Invoke(Ops.GetDynamicTypeFromClsOnlyType(typeof(PythonStringIO)), SymbolTable.StringToId("StringIO"));
-            Pickler pickler = new Pickler(stringIO, protocol, bin);
+            StringOutput output = new StringOutput();
+            Pickler pickler = new Pickler(output, protocol, bin);
             pickler.Dump(context, obj);
-            return Converter.ConvertToString(Ops.Invoke(stringIO, SymbolTable.StringToId("getvalue")));
+            return output.GetValue();
         }
 
         [Documentation("load(file) -> unpickled object\n\n"
@@ -101,12 +99,7 @@ namespace IronPython.Modules {
             )]
         [PythonName("loads")]
         public static object LoadFromString(ICallerContext context, object @string) {
-            object stringIO = Ops.Invoke(
-                Ops.GetDynamicTypeFromClsOnlyType(typeof(PythonStringIO)),
-                SymbolTable.StringToId("StringIO"),
-                @string
-            );
-            return new Unpickler(stringIO).Load(context);
+            return new Unpickler(new StringInput(Converter.ConvertToString(@string))).Load(context);
         }
 
         #endregion
@@ -130,6 +123,172 @@ namespace IronPython.Modules {
             void Write(string data);
         }
 
+        /// <summary>
+        /// Returns an IFileInput which reads from file.  cStringIO objects and files are read
+        /// directly, other objects through their Python read and readline methods.
+        /// </summary>
+        private static IFileInput MakeFileInput(object file) {
+            if (!(file is ISuperDynamicObject)) {
+                PythonStringIO.StringI si = file as PythonStringIO.StringI;
+                if (si != null) return new StringIInput(si);
+
+                PythonStringIO.StringO so = file as PythonStringIO.StringO;
+                if (so != null) return new StringOInput(so);
+
+                PythonFile pf = file as PythonFile;
+                if (pf != null) return new FileInput(pf);
+            }
+            return new PythonFileInput(file);
+        }
+
+        /// <summary>
+        /// Returns an IFileOutput which writes to file.  cStringIO objects are written
+        /// directly.  Writes to files and other objects are buffered and passed on when the
+        /// buffer fills up or the pickler flushes it at the end of dump().
+        /// </summary>
+        private static IFileOutput MakeFileOutput(object file) {
+            if (!(file is ISuperDynamicObject)) {
+                PythonStringIO.StringO so = file as PythonStringIO.StringO;
+                if (so != null) return new StringOOutput(so);
+
+                PythonFile pf = file as PythonFile;
+                if (pf != null) return new BufferedFileOutput(new FileOutput(pf));
+            }
+            return new BufferedFileOutput(new PythonFileOutput(file));
+        }
+
+        private class StringInput : IFileInput {
+            private readonly string data;
+            private int position;
+
+            public StringInput(string data) {
+                this.data = data;
+            }
+
+            public string Read(int size) {
+                if (size < 0 || position + size > data.Length) size = data.Length - position;
+                string res = data.Substring(position, size);
+                position += size;
+                return res;
+            }
+
+            public string ReadLine() {
+                int end = data.IndexOf('\n', position);
+                end = end == -1 ? data.Length : end + 1;
+
+                string res = data.Substring(position, end - position);
+                position = end;
+                return res;
+            }
+        }
+
+        private class StringOutput : IFileOutput {
+            private readonly StringBuilder data = new StringBuilder();
+
+            public void Write(string data) {
+                this.data.Append(data);
+            }
+
+            public string GetValue() {
+                return data.ToString();
+            }
+        }
+
+        private class BufferedFileOutput : IFileOutput {
+            private const int BufferSize = 8192;
+            private readonly IFileOutput file;
+            private readonly StringBuilder buffer = new StringBuilder();
+
+            public BufferedFileOutput(IFileOutput file) {
+                this.file = file;
+            }
+
+            public void Write(string data) {
+                buffer.Append(data);
+                if (buffer.Length >= BufferSize) Flush();
+            }
+
+            public void Flush() {
+                if (buffer.Length > 0) {
+                    string data = buffer.ToString();
+                    buffer.Length = 0;
+                    file.Write(data);
+                }
+            }
+        }
+
+        private class StringIInput : IFileInput {
+            private readonly PythonStringIO.StringI file;
+
+            public StringIInput(PythonStringIO.StringI file) {
+                this.file = file;
+            }
+
+            public string Read(int size) {
+                return file.Read(size);
+            }
+
+            public string ReadLine() {
+                return file.ReadLine();
+            }
+        }
+
+        private class StringOInput : IFileInput {
+            private readonly PythonStringIO.StringO file;
+
+            public StringOInput(PythonStringIO.StringO file) {
+                this.file = file;
+            }
+
+            public string Read(int size) {
+                return file.Read(size);
+            }
+
+            public string ReadLine() {
+                return file.ReadLine();
+            }
+        }
+
+        private class StringOOutput : IFileOutput {
+            private readonly PythonStringIO.StringO file;
+
+            public StringOOutput(PythonStringIO.StringO file) {
+                this.file = file;
+            }
+
+            public void Write(string data) {
+                file.Write(data);
+            }
+        }
+
+        private class FileInput : IFileInput {
+            private readonly PythonFile file;
+
+            public FileInput(PythonFile file) {
+                this.file = file;
+            }
+
+            public string Read(int size) {
+                return file.Read(size);
+            }
+
+            public string ReadLine() {
+                return file.ReadLine();
+            }
+        }
+
+        private class FileOutput : IFileOutput {
+            private readonly PythonFile file;
+
+            public FileOutput(PythonFile file) {
+                this.file = file;
+            }
+
+            public void Write(string data) {
+                file.Write(data);
+            }
+        }
+
         private class PythonFileInput : IFileInput {
             private object readMethod;
             private object readLineMethod;
@@ -169,22 +328,6 @@ namespace IronPython.Modules {
             }
         }
 
-        private class PythonReadableFileOutput : PythonFileOutput {
-            private object getValueMethod;
-
-            public PythonReadableFileOutput(object file) : base(file) {
-                if (!Ops.TryGetAttr(file, SymbolTable.StringToId("getvalue"), out getValueMethod) ||
-                    !Ops.IsCallable(getValueMethod)
-                ) {
-                    throw Ops.TypeError("argument must have callable 'getvalue' attribute");
-                }
-            }
-
-            public object GetValue() {
-                return Ops.Call(getValueMethod);
-            }
-        }
-
         #endregion
 
         #region Opcode constants
@@ -327,9 +470,9 @@ namespace IronPython.Modules {
                     // https://sourceforge.net/tracker/?func=detail&atid=105470&aid=939395&group_id=5470
                     int intProtocol;
                     if (file == null) {
-                        file = new PythonReadableFileOutput(new PythonStringIO.StringO());
+                        file = new StringOutput();
                     } else if (Converter.TryConvertToInt32(file, out intProtocol)) {
-                        return new Pickler((IFileOutput) new PythonReadableFileOutput(new PythonStringIO.StringO()), intProtocol, bin);
+                        return new Pickler((IFileOutput)new StringOutput(), intProtocol, bin);
                     }
                     return new Pickler(file, protocol, bin);
                 } else {
@@ -340,7 +483,7 @@ namespace IronPython.Modules {
             }
 
             public Pickler(object file, object protocol, object bin)
-                : this(new PythonFileOutput(file), protocol, bin) { }
+                : this(file as IFileOutput ?? MakeFileOutput(file), protocol, bin) { }
 
             public Pickler(IFileOutput file, object protocol, object bin) {
                 dispatchTable = new Dictionary<DynamicType, PickleFunction>();
@@ -389,9 +532,14 @@ namespace IronPython.Modules {
                 )]
             [PythonName("dump")]
             public void Dump(ICallerContext context, object obj) {
-                if (protocol >= 2) WriteProto();
-                Save(context, obj);
-                Write(Opcode.Stop);
+                try {
+                    if (protocol >= 2) WriteProto();
+                    Save(context, obj);
+                    Write(Opcode.Stop);
+                } finally {
+                    BufferedFileOutput buffered = file as BufferedFileOutput;
+                    if (buffered != null) buffered.Flush();
+                }
             }
 
             [Documentation("clear_memo() -> None\n\n"
@@ -410,8 +558,8 @@ namespace IronPython.Modules {
                 )]
             [PythonName("getvalue")]
             public object GetValue() {
-                if (file is PythonReadableFileOutput) {
-                    return ((PythonReadableFileOutput)file).GetValue();
+                if (file is StringOutput) {
+                    return ((StringOutput)file).GetValue();
                 }
                 throw ExceptionConverter.CreateThrowable(PicklingError, "Attempt to getvalue() a non-list-based pickler");
             }
@@ -1232,7 +1380,7 @@ namespace IronPython.Modules {
             private IDictionary<object, object> memo;
 
             public Unpickler(object file)
-                : this(new PythonFileInput(file)) { }
+                : this(MakeFileInput(file)) { }
 
             public Unpickler(IFileInput file) {
                 this.file = file;
@@ -23,15 +23,24 @@ using IronPython.Runtime.Operations;
 
 [assembly: PythonModule("cStringIO", typeof(IronPython.Modules.PythonStringIO))]
 namespace IronPython.Modules {
+    /// <summary>
+    /// The contents of a cStringIO object.  The characters are kept in a buffer which grows
+    /// geometrically so that a sequence of writes takes time proportional to the amount of data
+    /// written, and the string returned from Data is only created when it's first requested
+    /// after a change.
+    /// </summary>
     class StringStream {
-        private string data;
+        private char[] data;
         private int position;
         private int length;
+        private string value;       // the contents as a string, null if out of date
 
         public StringStream(string data) {
-            this.data = data;
+            if (data == null) data = "";
+            this.data = data.ToCharArray();
             this.position = 0;
-            this.length = data == null ? 0 : data.Length;
+            this.length = data.Length;
+            this.value = data;
         }
 
         public bool EOF {
@@ -44,24 +53,16 @@ namespace IronPython.Modules {
 
         public string Data {
             get {
-                return data;
-            }
-            set {
-                data = value;
-                if (data == null) {
-                    length = position = 0;
-                } else {
-                    length = data.Length;
-                    if (position > length) {
-                        position = length;
-                    }
+                if (value == null) {
+                    value = new string(data, 0, length);
                 }
+                return value;
             }
         }
 
         public string Prefix {
             get {
-                return data.Substring(0, position);
+                return new string(data, 0, Math.Min(position, length));
             }
         }
 
@@ -74,10 +75,12 @@ namespace IronPython.Modules {
         }
 
         public string Read(int i) {
+            if (position >= length) return "";
+
             if (position + i > length) {
                 i = length - position;
             }
-            string ret = data.Substring(position, i);
+            string ret = new string(data, position, i);
             position += i;
             return ret;
         }
@@ -88,12 +91,12 @@ namespace IronPython.Modules {
                 char c = data[i];
                 if (c == '\n' || c == '\r') {
                     i++;
-                    if (c == '\r' && position < length && data[i] == '\n') {
+                    if (c == '\r' && i < length && data[i] == '\n') {
                         i++;
                     }
                     // preserve newline character like StringIO
 
-                    string res = data.Substring(position, i - position);
+                    string res = new string(data, position, i - position);
                     position = i;
                     return res;
                 }
@@ -101,7 +104,7 @@ namespace IronPython.Modules {
             }
 
             if (i > position) {
-                string res = data.Substring(position, i - position);
+                string res = new string(data, position, i - position);
                 position = i;
                 return res;
             }
@@ -111,7 +114,7 @@ namespace IronPython.Modules {
 
         public string ReadToEnd() {
             if (position < length) {
-                string res = data.Substring(position);
+                string res = new string(data, position, length - position);
                 position = length;
                 return res;
             } else return "";
@@ -136,32 +139,39 @@ namespace IronPython.Modules {
         }
 
         public void Truncate() {
-            data = data.Substring(0, position);
-            length = data.Length;
+            SetLength(position);
         }
 
         public void Truncate(int size) {
-            data = data.Substring(0, size);
+            if (size < 0 || size > length) throw new ArgumentOutOfRangeException("size");
+
+            SetLength(size);
             position = size;
-            length = data.Length;
         }
 
         internal void Write(string s) {
-            string newData;
-            int newPosition;
-            if (position > 0) {
-                newData = data.Substring(0, position) + s;
-            } else {
-                newData = s;
+            int end = position + s.Length;
+            if (end > data.Length) {
+                char[] newData = new char[Math.Max(end, data.Length * 2)];
+                Array.Copy(data, newData, length);
+                data = newData;
             }
-            newPosition = newData.Length;
-            if (position + s.Length < length) {
-                newData = newData + data.Substring(position + s.Length);
+            if (position > length) {
+                // writing past the end, fill the gap w/ nulls
+                Array.Clear(data, length, position - length);
             }
 
-            data = newData;
-            position = newPosition;
-            length = data.Length;
+            s.CopyTo(0, data, position, s.Length);
+            position = end;
+            if (end > length) length = end;
+            value = null;
+        }
+
+        private void SetLength(int newLength) {
+            if (newLength < length) {
+                length = newLength;
+                value = null;
+            }
         }
     }
 
@@ -309,7 +319,6 @@ namespace IronPython.Modules {
         }
 
         public class StringO {
-            private StringWriter sw = new StringWriter();
             private StringStream sr = new StringStream("");
             private int softspace;
 
@@ -323,40 +332,35 @@ namespace IronPython.Modules {
 
             [PythonName("close")]
             public void Close() {
-                if (sw != null) { sw.Close(); sw = null; }
-                if (sr != null) { sr = null; }
+                sr = null;
             }
 
             public bool Closed {
                 [PythonName("closed")]
                 get {
-                    return sw == null || sr == null;
+                    return sr == null;
                 }
             }
 
             [PythonName("flush")]
             public void Flush() {
-                FixStreams();
             }
 
             [PythonName("getvalue")]
             public string GetValue() {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.Data;
             }
 
             [PythonName("getvalue")]
             public string GetValue(bool usePos) {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.Prefix;
             }
 
             [PythonName("next")]
             public string Next() {
                 ThrowIfClosed();
-                FixStreams();
                 if (sr.EOF) {
                     throw Ops.StopIteration();
                 }
@@ -366,21 +370,18 @@ namespace IronPython.Modules {
             [PythonName("read")]
             public string Read() {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.ReadToEnd();
             }
 
             [PythonName("read")]
             public string Read(int i) {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.Read(i);
             }
 
             [PythonName("readline")]
             public string ReadLine() {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.ReadLine();
             }
 
@@ -410,7 +411,6 @@ namespace IronPython.Modules {
             [PythonName("reset")]
             public void Reset() {
                 ThrowIfClosed();
-                FixStreams();
                 sr.Reset();
             }
 
@@ -422,7 +422,6 @@ namespace IronPython.Modules {
             [PythonName("seek")]
             public void Seek(int offset, int origin) {
                 ThrowIfClosed();
-                FixStreams();
                 SeekOrigin so;
                 switch (origin) {
                     case 1: so = SeekOrigin.Current; break;
@@ -442,28 +441,25 @@ namespace IronPython.Modules {
             [PythonName("tell")]
             public int Tell() {
                 ThrowIfClosed();
-                FixStreams();
                 return sr.Position;
             }
 
             [PythonName("truncate")]
             public void Truncate() {
                 ThrowIfClosed();
-                FixStreams();
                 sr.Truncate();
             }
 
             [PythonName("truncate")]
             public void Truncate(int size) {
                 ThrowIfClosed();
-                FixStreams();
                 sr.Truncate(size);
             }
 
             [PythonName("write")]
             public void Write(string s) {
                 ThrowIfClosed();
-                sw.Write(s);
+                sr.Write(s);
             }
 
             [PythonName("writelines")]
@@ -479,16 +475,6 @@ namespace IronPython.Modules {
                 }
             }
 
-            private void FixStreams() {
-                if (sr != null) {
-                    StringBuilder sb = sw.GetStringBuilder();
-                    if (sb != null && sb.Length > 0) {
-                        sr.Write(sb.ToString());
-                        sb.Length = 0;
-                    }
-                }
-            }
-
             private void ThrowIfClosed() {
                 if (Closed) {
                     throw Ops.ValueError("I/O operation on closed file");
@@ -20,6 +20,7 @@ using System.Collections;
 using System.Collections.Generic;
 using System.Diagnostics;
 
+using IronPython.Compiler;
 using IronPython.Runtime;
 using IronPython.Runtime.Operations;
 using IronPython.Runtime.Exceptions;
@@ -58,7 +59,7 @@ namespace IronPython.Modules {
         [PythonName("compile")]
         public static RE_Pattern Compile(object pattern) {
             try {
-                return new RE_Pattern(ValidatePattern(pattern));
+                return GetPattern(pattern, 0);
             } catch (ArgumentException e) {
                 throw ExceptionConverter.CreateThrowable(error, e.Message);
             }
@@ -67,7 +68,7 @@ namespace IronPython.Modules {
         [PythonName("compile")]
         public static RE_Pattern Compile(object pattern, object flags) {
             try {
-                return new RE_Pattern(ValidatePattern(pattern), Converter.ConvertToInt32(flags));
+                return GetPattern(pattern, Converter.ConvertToInt32(flags));
             } catch (ArgumentException e) {
                 throw ExceptionConverter.CreateThrowable(error, e.Message);
             }
@@ -76,6 +77,15 @@ namespace IronPython.Modules {
 
         public static object error = ExceptionConverter.CreatePythonException("error", "re");
 
+        private const int MaxCacheSize = 100;
+        private static LruCache<PatternKey, RE_Pattern> cache = new LruCache<PatternKey, RE_Pattern>(MaxCacheSize);
+
+        // The (pattern, flags) of the patterns which have been compiled to IL.  A pattern which is
+        // evicted from the cache and compiled again is only recorded once, and only the most recently
+        // compiled MaxCompiledPatterns are remembered.
+        private const int MaxCompiledPatterns = 1000;
+        private static LruCache<PatternKey, Tuple> compiledPatterns = new LruCache<PatternKey, Tuple>(MaxCompiledPatterns);
+
         [PythonName("escape")]
         public static string Escape(string text) {
             if (text == null) throw Ops.TypeError("text must not be None");
@@ -114,46 +124,10 @@ namespace IronPython.Modules {
 
         [PythonName("findall")]
         public static object FindAll(object pattern, string @string, int flags) {
-            RE_Pattern pat = new RE_Pattern(ValidatePattern(pattern), flags);
+            RE_Pattern pat = GetPattern(pattern, flags);
             ValidateString(@string, "string");
 
-            MatchCollection mc = pat.FindAllWorker(@string, 0, @string.Length);
-            object[] matches = new object[mc.Count];
-            int numgrps = pat.re.GetGroupNumbers().Length;
-            for (int i = 0; i < mc.Count; i++) {
-                if (numgrps > 2) { // CLR gives us a "bonus" group of 0 - the entire expression
-                    //  at this point we have more than one group in the pattern;
-                    //  need to return a list of tuples in this case
-
-                    //  for each match item in the matchcollection, create a tuple representing what was matched
-                    //  e.g. findall("(\d+)|(\w+)", "x = 99y") == [('', 'x'), ('99', ''), ('', 'y')]
-                    //  in the example above, ('', 'x') did not match (\d+) as indicated by '' but did 
-                    //  match (\w+) as indicated by 'x' and so on...
-                    int k = 0;
-                    ArrayList tpl = new ArrayList();
-                    foreach (Group g in mc[i].Groups) {
-                        //  here also the CLR gives us a "bonus" match as the first item which is the 
-                        //  group that was actually matched in the tuple e.g. we get 'x', '', 'x' for 
-                        //  the first match object...so we'll skip the first item when creating the 
-                        //  tuple
-                        if (k++ != 0) {
-                            tpl.Add(g.Value);
-                        }
-                    }
-                    matches[i] = Tuple.Make(tpl);
-                } else if (numgrps == 2) {
-                    //  at this point we have exactly one group in the pattern (including the "bonus" one given 
-                    //  by the CLR 
-                    //  skip the first match since that contains the entire match and not the group match
-                    //  e.g. re.findall(r"(\w+)\s+fish\b", "green fish") will have "green fish" in the 0 
-                    //  index and "green" as the (\w+) group match
-                    matches[i] = mc[i].Groups[1].Value;
-                } else {
-                    matches[i] = mc[i].Value;
-                }
-            }
-
-            return new List(matches);
+            return pat.FindAll(@string, 0, null);
         }
 
         [PythonName("finditer")]
@@ -163,10 +137,10 @@ namespace IronPython.Modules {
 
         [PythonName("finditer")]
         public static object FindIter(object pattern, object @string, int flags) {
-            RE_Pattern pat = new RE_Pattern(ValidatePattern(pattern), flags);
+            RE_Pattern pat = GetPattern(pattern, flags);
 
             string str = ValidateString(@string, "string");
-            return MatchIterator(pat.FindAllWorker(str, 0, str.Length), pat, str);
+            return MatchIterator(pat.FindAllWorker(str, 0, null), pat, str);
         }
 
         [PythonName("match")]
@@ -176,7 +150,18 @@ namespace IronPython.Modules {
 
         [PythonName("match")]
         public static object Match(object pattern, object @string, int flags) {
-            return new RE_Pattern(ValidatePattern(pattern), flags).Match(ValidateString(@string, "string"));
+            return GetPattern(pattern, flags).Match(ValidateString(@string, "string"));
+        }
+
+        [PythonName("compiled_patterns")]
+        [Documentation("compiled_patterns() -> list of (pattern, flags) for the patterns which have been compiled to IL.\n\nPatterns are compiled once they've been used Options.RegexCompileThreshold times.  The most\nrecently compiled patterns come first, and only the last 1000 are listed.")]
+        public static List GetCompiledPatterns() {
+            return new List(compiledPatterns.GetValues());
+        }
+
+        [PythonName("purge")]
+        public static void Purge() {
+            cache.Clear();
         }
 
         [PythonName("search")]
@@ -185,7 +170,7 @@ namespace IronPython.Modules {
         }
         [PythonName("search")]
         public static object Search(object pattern, object @string, int flags) {
-            return new RE_Pattern(ValidatePattern(pattern), flags).Search(ValidateString(@string, "string"));
+            return GetPattern(pattern, flags).Search(ValidateString(@string, "string"));
         }
 
         [PythonName("split")]
@@ -194,7 +179,7 @@ namespace IronPython.Modules {
         }
         [PythonName("split")]
         public static object Split(object pattern, object @string, int maxSplit) {
-            return new RE_Pattern(ValidatePattern(pattern)).Split(ValidateString(@string, "string"),
+            return GetPattern(pattern, 0).Split(ValidateString(@string, "string"),
                 maxSplit);
         }
 
@@ -205,7 +190,7 @@ namespace IronPython.Modules {
 
         [PythonName("sub")]
         public static object Substitute(object pattern, object repl, object @string, int count) {
-            return new RE_Pattern(ValidatePattern(pattern)).Substitute(repl, ValidateString(@string, "string"), count);
+            return GetPattern(pattern, 0).Substitute(repl, ValidateString(@string, "string"), count);
         }
 
         [PythonName("subn")]
@@ -215,7 +200,7 @@ namespace IronPython.Modules {
 
         [PythonName("subn")]
         public static object SubGetCount(object pattern, object repl, object @string, int count) {
-            return new RE_Pattern(ValidatePattern(pattern)).SubGetCount(repl, ValidateString(@string, "string"), count);
+            return GetPattern(pattern, 0).SubGetCount(repl, ValidateString(@string, "string"), count);
 
         }
 
@@ -231,6 +216,9 @@ namespace IronPython.Modules {
             private int compileFlags;
             private WeakRefTracker weakRefTracker;
             internal ParsedRegex pre;
+            private int uses;                   // number of matching operations performed until re is compiled
+            private bool compiled;
+            private readonly object compileLock = new object();
 
             public RE_Pattern(object pattern)
                 : this(pattern, 0) {
@@ -238,32 +226,62 @@ namespace IronPython.Modules {
 
             public RE_Pattern(object pattern, int flags) {
                 pre = PreParseRegex(ValidatePattern(pattern));
+                this.compileFlags = flags;
                 try {
                     RegexOptions opts = FlagsToOption(flags);
+                    if (Options.RegexCompileThreshold == 0) {
+                        opts |= RegexOptions.Compiled;
+                        compiled = true;
+                    }
                     this.re = new Regex(pre.Pattern, opts);
                 } catch (ArgumentException e) {
                     throw ExceptionConverter.CreateThrowable(error, e.Message);
                 }
-                this.compileFlags = flags;
+                if (compiled) RecordCompiled();
+            }
+
+            /// <summary>
+            /// Returns the Regex for a matching operation.  Patterns start out interpreted, which
+            /// is cheap to construct, and are re-built compiled to IL once they've been used
+            /// Options.RegexCompileThreshold times.
+            /// </summary>
+            private Regex GetRegex() {
+                if (!compiled) {
+                    int threshold = Options.RegexCompileThreshold;
+                    if (threshold >= 0 && System.Threading.Interlocked.Increment(ref uses) >= threshold) {
+                        lock (compileLock) {
+                            if (!compiled) {
+                                re = new Regex(pre.Pattern, re.Options | RegexOptions.Compiled);
+                                compiled = true;
+                                RecordCompiled();
+                            }
+                        }
+                    }
+                }
+                return re;
+            }
+
+            private void RecordCompiled() {
+                compiledPatterns.Add(new PatternKey(pre.UserPattern, compileFlags), Tuple.MakeTuple(pre.UserPattern, compileFlags));
             }
 
             [PythonName("match")]
             public RE_Match Match(object text) {
                 string input = ValidateString(text, "text");
-                return RE_Match.makeMatch(re.Match(input), this, input, 0);
+                return RE_Match.makeMatch(GetRegex().Match(input), this, input, 0);
             }
 
             [PythonName("match")]
             public RE_Match Match(object text, int pos) {
                 string input = ValidateString(text, "text");
-                return RE_Match.makeMatch(re.Match(input, pos), this, input, pos);
+                return RE_Match.makeMatch(GetRegex().Match(input, pos), this, input, pos);
             }
 
             [PythonName("match")]
             public RE_Match Match(object text, int pos, int endpos) {
                 string input = ValidateString(text, "text");
                 return RE_Match.makeMatch(
-                    re.Match(input.Substring(0, endpos), pos),
+                    GetRegex().Match(input.Substring(0, endpos), pos),
                     this,
                     input,
                     pos);
@@ -272,19 +290,19 @@ namespace IronPython.Modules {
             [PythonName("search")]
             public RE_Match Search(object text) {
                 string input = ValidateString(text, "text");
-                return RE_Match.make(re.Match(input), this, input);
+                return RE_Match.make(GetRegex().Match(input), this, input);
             }
 
             [PythonName("search")]
             public RE_Match Search(object text, int pos) {
                 string input = ValidateString(text, "text");
-                return RE_Match.make(re.Match(input, pos, input.Length - pos), this, input);
+                return RE_Match.make(GetRegex().Match(input, pos, input.Length - pos), this, input);
             }
 
             [PythonName("search")]
             public RE_Match Search(object text, int pos, int endpos) {
                 string input = ValidateString(text, "text");
-                return RE_Match.make(re.Match(input, pos, Math.Max(endpos - pos, 0)), this, input);
+                return RE_Match.make(GetRegex().Match(input, pos, Math.Max(endpos - pos, 0)), this, input);
             }
 
             [PythonName("findall")]
@@ -299,35 +317,63 @@ namespace IronPython.Modules {
 
             [PythonName("findall")]
             public object FindAll(object @string, int pos, object endpos) {
-                MatchCollection mc = FindAllWorker(ValidateString(@string, "text"), pos, endpos);
-
-                object[] matches = new object[mc.Count];
-                for (int i = 0; i < mc.Count; i++) {
-                    matches[i] = mc[i].Value;
+                Match m = FindAllWorker(ValidateString(@string, "text"), pos, endpos);
+
+                // the matches are added as they're found rather than collected in a
+                // MatchCollection which holds onto all of them.
+                List res = new List();
+                int numgrps = re.GetGroupNumbers().Length;
+                for (; m.Success; m = m.NextMatch()) {
+                    if (numgrps > 2) { // CLR gives us a "bonus" group of 0 - the entire expression
+                        //  at this point we have more than one group in the pattern;
+                        //  need to return a list of tuples in this case
+
+                        //  for each match create a tuple representing what was matched by each group
+                        //  e.g. findall("(\d+)|(\w+)", "x = 99y") == [('', 'x'), ('99', ''), ('', 'y')]
+                        //  in the example above, ('', 'x') did not match (\d+) as indicated by '' but did 
+                        //  match (\w+) as indicated by 'x' and so on...  we skip group 0, the entire match.
+                        object[] tpl = new object[numgrps - 1];
+                        for (int i = 1; i < numgrps; i++) {
+                            tpl[i - 1] = m.Groups[i].Value;
+                        }
+                        res.AddNoLock(new Tuple(false, tpl));
+                    } else if (numgrps == 2) {
+                        //  at this point we have exactly one group in the pattern (including the "bonus" one given 
+                        //  by the CLR 
+                        //  skip the first match since that contains the entire match and not the group match
+                        //  e.g. re.findall(r"(\w+)\s+fish\b", "green fish") will have "green fish" in the 0 
+                        //  index and "green" as the (\w+) group match
+                        res.AddNoLock(m.Groups[1].Value);
+                    } else {
+                        res.AddNoLock(m.Value);
+                    }
                 }
 
-                return new List(matches);
+                return res;
             }
 
-            internal MatchCollection FindAllWorker(string str, int pos, object endpos) {
+            /// <summary>
+            /// Returns the first match at or after pos, the following matches are found w/ NextMatch.
+            /// </summary>
+            internal Match FindAllWorker(string str, int pos, object endpos) {
                 string against = str;
                 if (endpos != null) {
                     int end = Converter.ConvertToInt32(endpos);
-                    against = against.Substring(0, Math.Max(end, 0));
+                    if (end < str.Length) against = against.Substring(0, Math.Max(end, 0));
                 }
-                return re.Matches(against, pos);
+                return GetRegex().Match(against, pos);
             }
 
             [PythonName("finditer")]
             public object FindIter(object @string) {
                 string input = ValidateString(@string, "string");
-                return MatchIterator(FindAllWorker(input, 0, input.Length), this, input);
+                return MatchIterator(FindAllWorker(input, 0, null), this, input);
             }
 
             [PythonName("finditer")]
             public object FindIter(object @string, int pos) {
                 string input = ValidateString(@string, "string");
-                return MatchIterator(FindAllWorker(input, pos, input.Length), this, input);
+                return MatchIterator(FindAllWorker(input, pos, null), this, input);
             }
 
             [PythonName("finditer")]
@@ -350,10 +396,9 @@ namespace IronPython.Modules {
                 else {
                     // iterate over all matches
                     string theStr = ValidateString(@string, "string");
-                    MatchCollection matches = re.Matches(theStr);
                     int lastPos = 0; // is either start of the string, or first position *after* the last match
                     int nSplits = 0; // how many splits have occurred?
-                    foreach (Match m in matches) {
+                    for (Match m = GetRegex().Match(theStr); m.Success; m = m.NextMatch()) {
                         // add substring from lastPos to beginning of current match
                         result.AddNoLock(theStr.Substring(lastPos, m.Index - lastPos));
                         // if there are subgroups of the match, add their match or None
@@ -395,7 +440,7 @@ namespace IronPython.Modules {
 
                 Match prev = null;
                 string input = ValidateString(@string, "string");
-                return re.Replace(
+                return GetRegex().Replace(
                     input,
                     delegate(Match match) {
                         //  from the docs: Empty matches for the pattern are replaced 
@@ -435,7 +480,7 @@ namespace IronPython.Modules {
 
                 Match prev = null;
                 string input = ValidateString(@string, "string");
-                res = re.Replace(
+                res = GetRegex().Replace(
                     input,
                     delegate(Match match) {
                         //  from the docs: Empty matches for the pattern are replaced 
@@ -740,9 +785,53 @@ namespace IronPython.Modules {
         #endregion
 
         #region Private helper functions
-        private static IEnumerator MatchIterator(MatchCollection matches, RE_Pattern pattern, string input) {
-            for (int i = 0; i < matches.Count; i++) {
-                yield return RE_Match.make(matches[i], pattern, input);
+
+        /// <summary>
+        /// Returns the compiled pattern for a pattern string and flags.  Like CPython we keep the
+        /// most recently used patterns so that module level functions called w/ the same pattern
+        /// don't parse it and build the Regex each time.  Compiled patterns are returned as-is.
+        /// </summary>
+        private static RE_Pattern GetPattern(object pattern, int flags) {
+            RE_Pattern res = pattern as RE_Pattern;
+            if (res != null) return res;
+
+            PatternKey key = new PatternKey(ValidatePattern(pattern), flags);
+            if (!cache.TryGetValue(key, out res)) {
+                res = new RE_Pattern(key.Pattern, flags);
+                cache.Add(key, res);
+            }
+            return res;
+        }
+
+        private struct PatternKey : IEquatable<PatternKey> {
+            public readonly string Pattern;
+            public readonly int Flags;
+
+            public PatternKey(string pattern, int flags) {
+                Pattern = pattern;
+                Flags = flags;
+            }
+
+            public bool Equals(PatternKey other) {
+                return Flags == other.Flags && Pattern == other.Pattern;
+            }
+
+            public override bool Equals(object obj) {
+                return obj is PatternKey && Equals((PatternKey)obj);
+            }
+
+            public override int GetHashCode() {
+                return Pattern.GetHashCode() ^ Flags;
+            }
+        }
+
+        /// <summary>
+        /// Lazily produces the matches starting w/ m.  Only the current match is kept alive so
+        /// iterating over the matches in a large string uses constant memory.
+        /// </summary>
+        private static IEnumerator MatchIterator(Match m, RE_Pattern pattern, string input) {
+            for (; m.Success; m = m.NextMatch()) {
+                yield return RE_Match.make(m, pattern, input);
             }
         }
 
@@ -0,0 +1,281 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Net.Sockets;
+using System.Runtime.InteropServices;
+using System.Threading;
+
+using IronPython.Runtime;
+using IronPython.Runtime.Operations;
+using IronPython.Runtime.Exceptions;
+
+[assembly: PythonModule("select", typeof(IronPython.Modules.PythonSelect))]
+namespace IronPython.Modules {
+    [PythonType("select")]
+    public static class PythonSelect {
+        public static string __doc__ = "This module supports asynchronous I/O on multiple sockets.\n\n"
+            + "It is implemented w/ System.Net.Sockets.Socket.Select, so like CPython on Windows\n"
+            + "only sockets (or objects whose fileno() is the file number of a socket) can be\n"
+            + "waited on, not files or pipes.";
+
+        public static IPythonType error = ExceptionConverter.CreatePythonException("error", "select");
+
+        public static object POLLIN = 0x0001;
+        public static object POLLPRI = 0x0002;
+        public static object POLLOUT = 0x0004;
+        public static object POLLERR = 0x0008;
+        public static object POLLHUP = 0x0010;
+        public static object POLLNVAL = 0x0020;
+
+        private const int DefaultPollMask = 0x0001 | 0x0002 | 0x0004;
+        private const int WSAEINVAL = 10022;
+        private const int WSAENOTSOCK = 10038;
+
+        #region Public API
+
+        [Documentation("select(rlist, wlist, xlist[, timeout]) -> (rlist, wlist, xlist)\n\n"
+            + "Wait until one or more of the sockets in the lists are ready. The lists hold\n"
+            + "sockets, file numbers or objects w/ a fileno() method.\n"
+            + " - rlist: wait until ready for reading (or for accept() on a listening socket)\n"
+            + " - wlist: wait until ready for writing\n"
+            + " - xlist: wait for an \"exceptional condition\" (out of band data or a failed connect)\n"
+            + "timeout is a float number of seconds, if it's omitted or None select() blocks\n"
+            + "until at least one socket is ready. The result is the subsets of the lists which\n"
+            + "are ready.")]
+        [PythonName("select")]
+        public static Tuple Select(object rlist, object wlist, object xlist, [DefaultParameterValue(null)] object timeout) {
+            List<object> readObjs, writeObjs, errorObjs;
+            List<Socket> readSocks, writeSocks, errorSocks;
+            GetSockets(rlist, out readObjs, out readSocks);
+            GetSockets(wlist, out writeObjs, out writeSocks);
+            GetSockets(xlist, out errorObjs, out errorSocks);
+
+            int microseconds;
+            if (timeout == null) {
+                microseconds = -1;
+            } else {
+                double seconds = Converter.ConvertToDouble(timeout);
+                if (seconds < 0) throw Ops.ValueError("timeout must be non-negative");
+                microseconds = (int)Math.Min(seconds * 1000000, Int32.MaxValue);
+            }
+
+            if (readSocks.Count == 0 && writeSocks.Count == 0 && errorSocks.Count == 0) {
+                // Windows rejects empty sets, just wait for the timeout like CPython does elsewhere
+                if (microseconds == -1) throw MakeException(WSAEINVAL, "An invalid argument was supplied");
+                Thread.Sleep(microseconds / 1000);
+                return Tuple.MakeTuple(new List(), new List(), new List());
+            }
+
+            // Socket.Select removes the sockets which aren't ready from the lists.
+            List<Socket> readReady = new List<Socket>(readSocks);
+            List<Socket> writeReady = new List<Socket>(writeSocks);
+            List<Socket> errorReady = new List<Socket>(errorSocks);
+            try {
+                Socket.Select(readReady.Count == 0 ? null : readReady,
+                    writeReady.Count == 0 ? null : writeReady,
+                    errorReady.Count == 0 ? null : errorReady,
+                    microseconds);
+            } catch (SocketException e) {
+                throw MakeException(e.ErrorCode, e.Message);
+            } catch (ObjectDisposedException) {
+                throw MakeException((int)PythonSocket.EBADF, "Bad file descriptor");
+            }
+
+            return Tuple.MakeTuple(
+                GetReady(readObjs, readSocks, readReady),
+                GetReady(writeObjs, writeSocks, writeReady),
+                GetReady(errorObjs, errorSocks, errorReady));
+        }
+
+        [Documentation("poll() -> poll object\n\n"
+            + "Returns an object which can wait for events on many sockets at once.")]
+        [PythonName("poll")]
+        public static PollObj Poll() {
+            return new PollObj();
+        }
+
+        #endregion
+
+        #region Poll object
+
+        [PythonType("pollobject")]
+        public class PollObj {
+            // the event masks of the registered sockets, keyed by file number
+            private Dictionary<long, int> masks = new Dictionary<long, int>();
+
+            internal PollObj() {
+            }
+
+            [Documentation("register(fd[, eventmask]) -> None\n\n"
+                + "Register a socket (or file number) to be polled. eventmask is a combination\n"
+                + "of POLLIN, POLLPRI and POLLOUT, and defaults to all three. Registering a\n"
+                + "socket again changes its mask.")]
+            [PythonName("register")]
+            public void Register(object fd, [DefaultParameterValue(DefaultPollMask)] int eventmask) {
+                masks[GetFileNumber(fd)] = eventmask;
+            }
+
+            [Documentation("unregister(fd) -> None\n\nStop polling a socket (or file number).")]
+            [PythonName("unregister")]
+            public void Unregister(object fd) {
+                if (!masks.Remove(GetFileNumber(fd))) {
+                    throw Ops.KeyError("{0}", Ops.Repr(fd));
+                }
+            }
+
+            [Documentation("poll([timeout]) -> list of (fd, event)\n\n"
+                + "Wait for events on the registered sockets. timeout is in milliseconds, if it's\n"
+                + "omitted, None or negative poll() blocks until there's an event. The result\n"
+                + "lists the file numbers which have events and the events that happened.\n"
+                + "Registered file numbers which aren't open sockets are reported w/ POLLNVAL,\n"
+                + "in which case poll() doesn't wait for the other sockets.")]
+            [PythonName("poll")]
+            public List Poll([DefaultParameterValue(null)] object timeout) {
+                int microseconds = -1;
+                if (timeout != null) {
+                    double milliseconds = Converter.ConvertToDouble(timeout);
+                    if (milliseconds >= 0) microseconds = (int)Math.Min(milliseconds * 1000, Int32.MaxValue);
+                }
+
+                List res = new List();
+                List<Socket> readSocks = new List<Socket>(), writeSocks = new List<Socket>(), errorSocks = new List<Socket>();
+                Dictionary<Socket, long> fds = new Dictionary<Socket, long>();
+                foreach (KeyValuePair<long, int> entry in masks) {
+                    Socket socket = PythonSocket.SocketObj.HandleToSocket(entry.Key);
+                    if (socket == null) {
+                        // closed or not a socket
+                        res.AddNoLock(Tuple.MakeTuple(entry.Key, POLLNVAL));
+                        continue;
+                    }
+
+                    fds[socket] = entry.Key;
+                    if ((entry.Value & (int)POLLIN) != 0) readSocks.Add(socket);
+                    if ((entry.Value & (int)POLLOUT) != 0) writeSocks.Add(socket);
+                    errorSocks.Add(socket);
+                }
+
+                if (fds.Count == 0) {
+                    // nothing to wait on, like CPython just sleep for the timeout (forever if there isn't one)
+                    if (res.Count == 0) Thread.Sleep(microseconds == -1 ? Timeout.Infinite : microseconds / 1000);
+                    return res;
+                }
+
+                // POLLNVAL is an event, so report it right away along w/ whatever the valid sockets have
+                if (res.Count != 0) microseconds = 0;
+
+                try {
+                    Socket.Select(readSocks.Count == 0 ? null : readSocks,
+                        writeSocks.Count == 0 ? null : writeSocks,
+                        errorSocks,
+                        microseconds);
+                } catch (SocketException e) {
+                    throw MakeException(e.ErrorCode, e.Message);
+                } catch (ObjectDisposedException) {
+                    throw MakeException((int)PythonSocket.EBADF, "Bad file descriptor");
+                }
+
+                Dictionary<Socket, int> events = new Dictionary<Socket, int>();
+                AddEvents(events, readSocks, (int)POLLIN);
+                AddEvents(events, writeSocks, (int)POLLOUT);
+                foreach (Socket socket in errorSocks) {
+                    // out of band data if it was asked for, otherwise an error (such as a failed connect)
+                    int mask = masks[fds[socket]];
+                    AddEvents(events, socket, (mask & (int)POLLPRI) != 0 ? (int)POLLPRI : (int)POLLERR);
+                }
+
+                foreach (KeyValuePair<Socket, int> entry in events) {
+                    res.AddNoLock(Tuple.MakeTuple(fds[entry.Key], entry.Value));
+                }
+                return res;
+            }
+
+            private static void AddEvents(Dictionary<Socket, int> events, List<Socket> sockets, int flag) {
+                foreach (Socket socket in sockets) {
+                    AddEvents(events, socket, flag);
+                }
+            }
+
+            private static void AddEvents(Dictionary<Socket, int> events, Socket socket, int flag) {
+                int cur;
+                events.TryGetValue(socket, out cur);
+                events[socket] = cur | flag;
+            }
+        }
+
+        #endregion
+
+        #region Private implementation
+
+        /// <summary>
+        /// Converts each item of a list passed to select() into a Socket, remembering the
+        /// original items so the ready ones can be returned.
+        /// </summary>
+        private static void GetSockets(object list, out List<object> objs, out List<Socket> sockets) {
+            objs = new List<object>();
+            sockets = new List<Socket>();
+
+            IEnumerator e = Ops.GetEnumerator(list);
+            while (e.MoveNext()) {
+                Socket socket = PythonSocket.SocketObj.HandleToSocket(GetFileNumber(e.Current));
+                if (socket == null) {
+                    throw MakeException(WSAENOTSOCK, "An operation was attempted on something that is not a socket");
+                }
+                objs.Add(e.Current);
+                sockets.Add(socket);
+            }
+        }
+
+        /// <summary>
+        /// Returns the items whose sockets are in ready, in the order they were passed in.
+        /// </summary>
+        private static List GetReady(List<object> objs, List<Socket> sockets, List<Socket> ready) {
+            List res = new List();
+            if (ready.Count == 0) return res;
+
+            Dictionary<Socket, bool> readySet = new Dictionary<Socket, bool>(ready.Count);
+            foreach (Socket socket in ready) {
+                readySet[socket] = true;
+            }
+
+            for (int i = 0; i < objs.Count; i++) {
+                if (readySet.ContainsKey(sockets[i])) res.AddNoLock(objs[i]);
+            }
+            return res;
+        }
+
+        private static long GetFileNumber(object o) {
+            PythonSocket.SocketObj socket = o as PythonSocket.SocketObj;
+            if (socket != null) return socket.GetHandle();
+
+            if (o is int || o is long || o is IronMath.BigInteger) return Converter.ConvertToInt64(o);
+
+            object fileno;
+            if (Ops.TryGetAttr(o, SymbolTable.StringToId("fileno"), out fileno)) {
+                return Converter.ConvertToInt64(Ops.Call(fileno));
+            }
+
+            throw Ops.TypeError("argument must be an int, or have a fileno() method.");
+        }
+
+        private static Exception MakeException(int errno, string message) {
+            return ExceptionConverter.ToClr(Ops.Call(error, Tuple.MakeTuple(errno, message)));
+        }
+
+        #endregion
+    }
+}
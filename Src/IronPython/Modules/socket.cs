@@ -17,6 +17,7 @@ using System;
 using System.Collections;
 using System.Collections.Generic;
 using System.Diagnostics;
+using System.IO;
 using System.Net;
 using System.Net.Sockets;
 using System.Net.Security;
@@ -46,7 +47,8 @@ namespace IronPython.Modules {
             + "details, check the docstrings of the functions mentioned.\n"
             + " - s.accept(), s.connect(), and s.connect_ex() do not support timeouts.\n"
             + " - Timeouts in s.sendall() don't work correctly.\n"
-            + " - makefile() and s.dup() are not implemented.\n"
+            + " - s.dup() is not implemented.\n"
+            + " - Files returned by s.makefile() are always binary mode files.\n"
             + " - getservbyname() and getservbyport() are not implemented.\n"
             + " - SSL support is not implemented."
             + "\n"
@@ -89,6 +91,8 @@ namespace IronPython.Modules {
 
             private Socket socket;
             private WeakRefTracker weakRefTracker = null;
+            private int openFiles;          // files returned by makefile() which haven't been closed
+            private bool closePending;      // close() was called while files were open
 
             #endregion
 
@@ -165,6 +169,17 @@ namespace IronPython.Modules {
             [Documentation("close() -> None\n\nClose the socket. It cannot be used after being closed.")]
             [PythonName("close")]
             public void Close() {
+                lock (this) {
+                    // like CPython, the connection stays open until the files made from it are closed
+                    if (openFiles > 0) {
+                        closePending = true;
+                        return;
+                    }
+                }
+                CloseSocket();
+            }
+
+            private void CloseSocket() {
                 lock (handleToSocket) {
                     List<Socket> sockets;
                     if (handleToSocket.TryGetValue((IntPtr)socket.Handle, out sockets)) {
@@ -317,6 +332,45 @@ namespace IronPython.Modules {
                 }
             }
 
+            [Documentation("makefile([mode[, bufsize]]) -> file object\n\n"
+                + "Return a file object which reads from and writes to the socket. mode and\n"
+                + "bufsize are interpreted like the arguments of the built-in file() function:\n"
+                + " - bufsize 0 means unbuffered, reads never take more data from the socket than\n"
+                + "   they return and every write is sent immediately\n"
+                + " - bufsize 1 means line buffered, writes are sent at the end of each line\n"
+                + " - larger values are the size of the buffers, negative values (the default)\n"
+                + "   use the default size\n"
+                + "Written data is sent when the buffer is full, or when the file is flushed or\n"
+                + "closed. The socket stays open until it and all of its files are closed.\n"
+                + "\n"
+                + "Difference from CPython: the file is always a binary mode file, newlines are\n"
+                + "not translated."
+                )]
+            [PythonName("makefile")]
+            public PythonFile MakeFile([DefaultParameterValue("r")] string mode, [DefaultParameterValue(-1)] int bufsize) {
+                if (!mode.EndsWith("b")) mode += "b";
+
+                int readBufferSize, writeBufferSize;
+                if (bufsize == 0) {
+                    readBufferSize = 1;
+                    writeBufferSize = 0;
+                } else if (bufsize == 1 || bufsize < 0) {
+                    readBufferSize = writeBufferSize = DefaultFileBufferSize;
+                } else {
+                    readBufferSize = writeBufferSize = bufsize;
+                }
+
+                lock (this) {
+                    if (closePending) throw MakeException(error, (int)EBADF, "the socket is closed");
+                    openFiles++;
+                }
+
+                PythonFile res = new PythonFile(new SocketStream(this, writeBufferSize, bufsize == 1), null, "<socket>", mode);
+                res.SetReadBufferSize(readBufferSize);
+                res.FlushOnWrite = false;
+                return res;
+            }
+
             [Documentation("recv(bufsize[, flags]) -> string\n\n"
                 + "Receive data from the socket, up to bufsize bytes. For connection-oriented\n"
                 + "protocols (e.g. SOCK_STREAM), you must first call either connect() or\n"
@@ -328,14 +382,36 @@ namespace IronPython.Modules {
                 )]
             [PythonName("recv")]
             public string Receive(int maxBytes, [DefaultParameterValue(0)] int flags) {
-                int bytesRead;
-                byte[] buffer = new byte[maxBytes];
+                if (maxBytes < 0) throw Ops.ValueError("negative buffersize in recv");
+
+                byte[] buffer = ReceiveBufferPool.Take(maxBytes);
+                try {
+                    int bytesRead;
+                    try {
+                        bytesRead = socket.Receive(buffer, 0, maxBytes, (SocketFlags)flags);
+                    } catch (Exception e) {
+                        throw MakeException(e);
+                    }
+                    return StringOps.FromByteArray(buffer, bytesRead);
+                } finally {
+                    ReceiveBufferPool.Return(buffer);
+                }
+            }
+
+            [Documentation("recv_into(buffer[, nbytes[, flags]]) -> nbytes_read\n\n"
+                + "Receive up to nbytes bytes from the socket into buffer, which must be a\n"
+                + "writable buffer (a CLR byte array). If nbytes is omitted or 0 the size of the\n"
+                + "buffer is used. Returns the number of bytes received; unlike recv() no string\n"
+                + "is created for the data, so the buffer can be reused for each call."
+                )]
+            [PythonName("recv_into")]
+            public int ReceiveInto(object buffer, [DefaultParameterValue(0)] int nbytes, [DefaultParameterValue(0)] int flags) {
+                byte[] bytes = GetReceiveBuffer(buffer, nbytes);
                 try {
-                    bytesRead = socket.Receive(buffer, (SocketFlags)flags);
+                    return socket.Receive(bytes, 0, nbytes == 0 ? bytes.Length : nbytes, (SocketFlags)flags);
                 } catch (Exception e) {
                     throw MakeException(e);
                 }
-                return StringOps.FromByteArray(buffer, bytesRead);
             }
 
             [Documentation("recvfrom(bufsize[, flags]) -> (string, address)\n\n"
@@ -345,18 +421,41 @@ namespace IronPython.Modules {
                 )]
             [PythonName("recvfrom")]
             public Tuple ReceiveFrom(int maxBytes, [DefaultParameterValue(0)] int flags) {
+                if (maxBytes < 0) throw Ops.ValueError("negative buffersize in recvfrom");
+
                 int bytesRead;
-                byte[] buffer = new byte[maxBytes];
-                IPEndPoint remoteIPEP = new IPEndPoint(IPAddress.Any, 0);
-                EndPoint remoteEP = remoteIPEP;
+                string data;
+                EndPoint remoteEP = new IPEndPoint(IPAddress.Any, 0);
+                byte[] buffer = ReceiveBufferPool.Take(maxBytes);
                 try {
-                    bytesRead = socket.ReceiveFrom(buffer, (SocketFlags)flags, ref remoteEP);
+                    try {
+                        bytesRead = socket.ReceiveFrom(buffer, 0, maxBytes, (SocketFlags)flags, ref remoteEP);
+                    } catch (Exception e) {
+                        throw MakeException(e);
+                    }
+                    data = StringOps.FromByteArray(buffer, bytesRead);
+                } finally {
+                    ReceiveBufferPool.Return(buffer);
+                }
+                Tuple remoteAddress = EndPointToTuple((IPEndPoint)remoteEP);
+                return Tuple.MakeTuple(data, remoteAddress);
+            }
+
+            [Documentation("recvfrom_into(buffer[, nbytes[, flags]]) -> (nbytes_read, address)\n\n"
+                + "Like recv_into(), but also returns the address of the socket from which the\n"
+                + "data was received."
+                )]
+            [PythonName("recvfrom_into")]
+            public Tuple ReceiveFromInto(object buffer, [DefaultParameterValue(0)] int nbytes, [DefaultParameterValue(0)] int flags) {
+                int bytesRead;
+                byte[] bytes = GetReceiveBuffer(buffer, nbytes);
+                EndPoint remoteEP = new IPEndPoint(IPAddress.Any, 0);
+                try {
+                    bytesRead = socket.ReceiveFrom(bytes, 0, nbytes == 0 ? bytes.Length : nbytes, (SocketFlags)flags, ref remoteEP);
                 } catch (Exception e) {
                     throw MakeException(e);
                 }
-                string data = StringOps.FromByteArray(buffer, bytesRead);
-                Tuple remoteAddress = EndPointToTuple(remoteIPEP);
-                return Tuple.MakeTuple(data, remoteAddress);
+                return Tuple.MakeTuple(bytesRead, EndPointToTuple((IPEndPoint)remoteEP));
             }
 
             [Documentation("send(string[, flags]) -> bytes_sent\n\n"
@@ -661,6 +760,146 @@ namespace IronPython.Modules {
                 }
             }
 
+            /// <summary>
+            /// Checks the arguments of recv_into() and recvfrom_into(), returning the array to
+            /// receive into.
+            /// </summary>
+            private static byte[] GetReceiveBuffer(object buffer, int nbytes) {
+                byte[] bytes = buffer as byte[];
+                if (bytes == null) {
+                    throw Ops.TypeError("recv_into requires a writable buffer (a byte array), got {0}", Ops.GetPythonTypeName(buffer));
+                }
+                if (nbytes < 0) throw Ops.ValueError("negative buffersize in recv_into");
+                if (nbytes > bytes.Length) throw Ops.ValueError("buffer too small for requested bytes");
+                return bytes;
+            }
+
+            /// <summary>
+            /// Called when a file returned by makefile() is closed, closes the socket if close()
+            /// was called while the file was open.
+            /// </summary>
+            private void ReleaseFile() {
+                lock (this) {
+                    openFiles--;
+                    if (openFiles > 0 || !closePending) return;
+                }
+                CloseSocket();
+            }
+
+            /// <summary>
+            /// The stream under the files returned by makefile().  Reads go straight to the socket
+            /// (the file's reader does the read buffering) and writes are collected in a buffer
+            /// which is sent when it fills, at the end of a line for line buffered files, and when
+            /// the file is flushed or closed.
+            /// </summary>
+            private class SocketStream : Stream {
+                private readonly SocketObj owner;
+                private readonly byte[] writeBuffer;    // null if writes are unbuffered
+                private readonly bool lineBuffered;
+                private int writeCount;
+                private bool closed;
+
+                public SocketStream(SocketObj owner, int writeBufferSize, bool lineBuffered) {
+                    this.owner = owner;
+                    this.lineBuffered = lineBuffered;
+                    if (writeBufferSize > 0) writeBuffer = new byte[writeBufferSize];
+                }
+
+                public override bool CanRead {
+                    get { return !closed; }
+                }
+
+                public override bool CanSeek {
+                    get { return false; }
+                }
+
+                public override bool CanWrite {
+                    get { return !closed; }
+                }
+
+                public override long Length {
+                    get { throw new NotSupportedException(); }
+                }
+
+                public override long Position {
+                    get { throw new NotSupportedException(); }
+                    set { throw new NotSupportedException(); }
+                }
+
+                public override int Read(byte[] buffer, int offset, int count) {
+                    try {
+                        return owner.socket.Receive(buffer, offset, count, SocketFlags.None);
+                    } catch (Exception e) {
+                        throw MakeException(e);
+                    }
+                }
+
+                public override void Write(byte[] buffer, int offset, int count) {
+                    if (writeBuffer == null) {
+                        Send(buffer, offset, count);
+                        return;
+                    }
+
+                    if (writeCount + count > writeBuffer.Length) {
+                        Flush();
+                        if (count >= writeBuffer.Length) {
+                            // too big to buffer
+                            Send(buffer, offset, count);
+                            return;
+                        }
+                    }
+
+                    Array.Copy(buffer, offset, writeBuffer, writeCount, count);
+                    writeCount += count;
+
+                    if (lineBuffered && Array.IndexOf(buffer, (byte)'\n', offset, count) != -1) Flush();
+                }
+
+                public override void Flush() {
+                    if (writeCount > 0) {
+                        // reset the count first so that a failed send doesn't send the data twice
+                        int count = writeCount;
+                        writeCount = 0;
+                        Send(writeBuffer, 0, count);
+                    }
+                }
+
+                public override long Seek(long offset, SeekOrigin origin) {
+                    throw new NotSupportedException();
+                }
+
+                public override void SetLength(long value) {
+                    throw new NotSupportedException();
+                }
+
+                protected override void Dispose(bool disposing) {
+                    try {
+                        if (disposing && !closed) {
+                            closed = true;
+                            try {
+                                Flush();
+                            } finally {
+                                owner.ReleaseFile();
+                            }
+                        }
+                    } finally {
+                        base.Dispose(disposing);
+                    }
+                }
+
+                private void Send(byte[] buffer, int offset, int count) {
+                    try {
+                        while (count > 0) {
+                            int sent = owner.socket.Send(buffer, offset, count, SocketFlags.None);
+                            offset += sent;
+                            count -= sent;
+                        }
+                    } catch (Exception e) {
+                        throw MakeException(e);
+                    }
+                }
+            }
+
             #endregion
 
         }
@@ -682,6 +921,7 @@ namespace IronPython.Modules {
         private const int IPv4AddrBytes = 4;
         private const int IPv6AddrBytes = 16;
         private const double MillisecondsPerSecond = 1000.0;
+        private const int DefaultFileBufferSize = 8192;     // used by makefile() unless a bufsize is given
 
         #endregion
 
@@ -1547,6 +1787,34 @@ namespace IronPython.Modules {
             }
         }
 
+        /// <summary>
+        /// The buffers recv() and recvfrom() receive into before the data is copied into the string
+        /// they return.  Buffers are reused so that each call only allocates the result; receives
+        /// larger than BufferSize use a buffer of their own.
+        /// </summary>
+        private static class ReceiveBufferPool {
+            private const int BufferSize = 8192;
+            private const int MaxBuffers = 16;
+            private static Stack<byte[]> buffers = new Stack<byte[]>();
+
+            public static byte[] Take(int size) {
+                if (size > BufferSize) return new byte[size];
+
+                lock (buffers) {
+                    if (buffers.Count > 0) return buffers.Pop();
+                }
+                return new byte[BufferSize];
+            }
+
+            public static void Return(byte[] buffer) {
+                if (buffer.Length != BufferSize) return;
+
+                lock (buffers) {
+                    if (buffers.Count < MaxBuffers) buffers.Push(buffer);
+                }
+            }
+        }
+
         #endregion
 
     }
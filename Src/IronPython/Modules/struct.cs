@@ -20,6 +20,7 @@ using System.IO;
 
 using IronPython.Runtime;
 using IronPython.Runtime.Exceptions;
+using IronPython.Runtime.Operations;
 using IronMath;
 
 [assembly: PythonModule("struct", typeof(IronPython.Modules.PythonStruct))]
@@ -28,463 +29,456 @@ namespace IronPython.Modules {
     public static class PythonStruct {
 
         #region Public API Surface
+
         [PythonName("pack")]
         public static string Pack(string fmt, params object[] values) {
-            int count = 1;
-            int curObj = 0;
-            StringBuilder res = new StringBuilder();
-            bool fLittleEndian = BitConverter.IsLittleEndian;
-            bool fStandardized = false;
-
-            for (int i = 0; i < fmt.Length; i++) {
-                switch (fmt[i]) {
-                    case 'x': // pad byte
-                        res.Append('\0');
-                        break;
-                    case 'c': // char
-                        for (int j = 0; j < count; j++) res.Append(GetCharValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'b': // signed char
-                        for (int j = 0; j < count; j++) res.Append((char)(byte)GetSByteValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'B': // unsigned char
-                        for (int j = 0; j < count; j++) res.Append((char)GetByteValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'h': // short
-                        for (int j = 0; j < count; j++) WriteShort(res, fLittleEndian, GetShortValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'H': // unsigned short
-                        for (int j = 0; j < count; j++) WriteUShort(res, fLittleEndian, GetUShortValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'i': // int
-                    case 'l': // long
-                        for (int j = 0; j < count; j++) WriteInt(res, fLittleEndian, GetIntValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'I': // unsigned int
-                    case 'L': // unsigned long
-                        for (int j = 0; j < count; j++) WriteUInt(res, fLittleEndian, GetUIntValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'q': // long long
-                        for (int j = 0; j < count; j++) WriteLong(res, fLittleEndian, GetLongValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'Q': // unsigned long long
-                        for (int j = 0; j < count; j++) WriteULong(res, fLittleEndian, GetULongValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'f': // float                        
-                        for (int j = 0; j < count; j++) WriteFloat(res, fLittleEndian, (float)GetDoubleValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'd': // double
-                        for (int j = 0; j < count; j++) WriteDouble(res, fLittleEndian, GetDoubleValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 's': // char[]
-                        WriteString(res, count, GetStringValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'p': // char[]
-                        WritePascalString(res, count - 1, GetStringValue(curObj++, values));
-                        count = 1;
-                        break;
-                    case 'P': // void *
-                        if (IntPtr.Size == 4) goto case 'I';
-                        goto case 'Q';
-                    case ' ':   // white space, ignore
-                    case '\t':
-                        break;
-                    case '=': // native
-                        if (i != 0) Error("unexpected byte order");
-                        fStandardized = true;
-                        break;
-                    case '@': // native
-                        if (i != 0) Error("unexpected byte order");
-                        break;
-                    case '<': // little endian
-                        if (i != 0) Error("unexpected byte order");
-                        fLittleEndian = true;
-                        fStandardized = true;
-                        break;
-                    case '>': // big endian
-                    case '!': // big endian
-                        if (i != 0) Error("unexpected byte order");
-                        fLittleEndian = false;
-                        fStandardized = true;
-                        break;
-                    default:
-                        if (Char.IsDigit(fmt[i])) {
-                            count = 0;
-                            while (Char.IsDigit(fmt[i])) {
-                                count = count * 10 + (fmt[i] - '0');
-                                i++;
-                            }
-                            if (Char.IsWhiteSpace(fmt[i])) Error("white space not allowed between count and format");
-                            i--;
+            return GetStruct(fmt).Pack(values);
+        }
+
+        [PythonName("unpack")]
+        public static Tuple Unpack(string fmt, object @string) {
+            return GetStruct(fmt).Unpack(@string);
+        }
+
+        [PythonName("pack_into")]
+        public static void PackInto(string fmt, object buffer, int offset, params object[] values) {
+            GetStruct(fmt).PackInto(buffer, offset, values);
+        }
+
+        [PythonName("unpack_from")]
+        public static Tuple UnpackFrom(string fmt, object buffer) {
+            return GetStruct(fmt).UnpackFrom(buffer, 0);
+        }
+
+        [PythonName("unpack_from")]
+        public static Tuple UnpackFrom(string fmt, object buffer, int offset) {
+            return GetStruct(fmt).UnpackFrom(buffer, offset);
+        }
+
+        [PythonName("calcsize")]
+        public static int CalculateSize(string fmt) {
+            return GetStruct(fmt).Size;
+        }
+
+        public static object error = ExceptionConverter.CreatePythonException("error", "struct");
+
+        /// <summary>
+        /// A format string which has been parsed once into a list of operations so that it can
+        /// be used to pack and unpack many values.  Data is read from strings (w/ a byte stored
+        /// in each character), buffers over strings and CLR byte arrays, and written to strings
+        /// or byte arrays.
+        /// </summary>
+        [PythonType("Struct")]
+        public class Struct {
+            private readonly string format;
+            private readonly Operation[] ops;
+            private readonly bool littleEndian;
+            private readonly int size;          // number of bytes packed
+            private readonly int valueCount;    // number of values packed
+
+            public Struct(string format) {
+                if (format == null) throw Ops.TypeError("Struct() argument 1 must be string, not None");
+
+                this.format = format;
+                this.littleEndian = BitConverter.IsLittleEndian;
+
+                List<Operation> ops = new List<Operation>();
+                int count = 1;
+                bool haveCount = false;
+                for (int i = 0; i < format.Length; i++) {
+                    char c = format[i];
+                    switch (c) {
+                        case ' ':   // white space, ignore
+                        case '\t':
+                            if (haveCount) throw Error("white space not allowed between count and format");
+                            continue;
+                        case '=': // native
+                        case '@': // native
+                            if (i != 0) throw Error("unexpected byte order");
+                            continue;
+                        case '<': // little endian
+                            if (i != 0) throw Error("unexpected byte order");
+                            littleEndian = true;
+                            continue;
+                        case '>': // big endian
+                        case '!': // big endian
+                            if (i != 0) throw Error("unexpected byte order");
+                            littleEndian = false;
+                            continue;
+                        case 'P': // void *
+                            c = IntPtr.Size == 4 ? 'I' : 'Q';
                             break;
-                        }
+                        case 'l': // long
+                            c = 'i';
+                            break;
+                        case 'L': // unsigned long
+                            c = 'I';
+                            break;
+                        case 'x': case 'c': case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
+                        case 'q': case 'Q': case 'f': case 'd': case 's': case 'p':
+                            break;
+                        default:
+                            if (c >= '0' && c <= '9') {
+                                count = haveCount ? checked(count * 10 + (c - '0')) : c - '0';
+                                haveCount = true;
+                                continue;
+                            }
+                            throw Error("bad format string");
+                    }
+
+                    Operation op = new Operation(c, count);
+                    ops.Add(op);
+                    size += op.Size;
+                    valueCount += op.ValueCount;
+                    count = 1;
+                    haveCount = false;
+                }
+                if (haveCount) throw Error("repeat count given without format specifier");
+
+                this.ops = ops.ToArray();
+            }
 
-                        throw Error("bad format string");
+            public string Format {
+                [PythonName("format")]
+                get {
+                    return format;
                 }
             }
 
-            if (curObj != values.Length) throw Error("not all arguments used");
+            public int Size {
+                [PythonName("size")]
+                get {
+                    return size;
+                }
+            }
 
-            if (fStandardized) return res.ToString();
-            return res.ToString();
-        }
+            [PythonName("pack")]
+            public string Pack(params object[] values) {
+                char[] res = new char[size];
+                Write(values, res, null, 0);
+                return new string(res);
+            }
 
-        [PythonName("unpack")]
-        public static Tuple Unpack(string fmt, string @string) {
-            string data = @string;
-            int count = 1;              // formats can be pre-pended w/ a repeat count, this is that count
-            int curIndex = 0;           // current index into the output string.
-            List<object> res = new List<object>();
-            bool fLittleEndian = BitConverter.IsLittleEndian;
-            bool fStandardized = false;
-
-
-            for (int i = 0; i < fmt.Length; i++) {
-                switch (fmt[i]) {
-                    case 'x': // pad byte
-                        curIndex+=count;
-                        count = 1;
-                        break;
-                    case 'c': // char
-                        for (int j = 0; j < count; j++) res.Add(CreateCharValue(ref curIndex, data).ToString());
-                        count = 1;
-                        break;
-                    case 'b': // signed char
-                        for (int j = 0; j < count; j++) res.Add((int)(sbyte)CreateCharValue(ref curIndex, data));
-                        count = 1;
-                        break;
-                    case 'B': // unsigned char
-                        for (int j = 0; j < count; j++) res.Add((int)CreateCharValue(ref curIndex, data));
-                        count = 1;
-                        break;
-                    case 'h': // short
-                        for (int j = 0; j < count; j++) res.Add((int)CreateShortValue(ref curIndex, fLittleEndian, data));
-                        count = 1;
-                        break;
-                    case 'H': // unsigned short
-                        for (int j = 0; j < count; j++) res.Add((int)CreateUShortValue(ref curIndex, fLittleEndian, data));
-                        count = 1;
-                        break;
-                    case 'i': // int
-                    case 'l': // long
-                        for (int j = 0; j < count; j++) res.Add(CreateIntValue(ref curIndex, fLittleEndian, data));
-                        count = 1;
-                        break;
-                    case 'I': // unsigned int
-                    case 'L': // unsigned long
-                        for (int j = 0; j < count; j++) res.Add(BigInteger.Create(CreateUIntValue(ref curIndex, fLittleEndian, data)));
-                        count = 1;
-                        break;
-                    case 'q': // long long
-                        for (int j = 0; j < count; j++) res.Add(BigInteger.Create(CreateLongValue(ref curIndex, fLittleEndian, data)));
-                        count = 1;
-                        break;
-                    case 'Q': // unsigned long long
-                        for (int j = 0; j < count; j++) res.Add(BigInteger.Create(CreateULongValue(ref curIndex, fLittleEndian, data)));
-                        count = 1;
-                        break;
-                    case 'f': // float                        
-                        for (int j = 0; j < count; j++) res.Add((double)CreateFloatValue(ref curIndex, fLittleEndian, data));
-                        count = 1;
-                        break;
-                    case 'd': // double
-                        for (int j = 0; j < count; j++) res.Add(CreateDoubleValue(ref curIndex, fLittleEndian, data));
-                        count = 1;
-                        break;
-                    case 's': // char[]
-                        res.Add(CreateString(ref curIndex, count, data));
-                        count = 1;
-                        break;
-                    case 'p': // char[]
-                        res.Add(CreatePascalString(ref curIndex, count - 1, data));
-                        count = 1;
-                        break;
-                    case 'P': // void *
-                        if (IntPtr.Size == 4) goto case 'I';
-                        goto case 'Q';
-                    case ' ':   // white space, ignore
-                    case '\t':
-                        break;
-                    case '=': // native
-                        if (i != 0) Error("unexpected byte order");
-                        fStandardized = true;
-                        break;
-                    case '@': // native
-                        if (i != 0) Error("unexpected byte order");
-                        break;
-                    case '<': // little endian
-                        if (i != 0) Error("unexpected byte order");
-                        fLittleEndian = true;
-                        fStandardized = true;
-                        break;
-                    case '>': // big endian
-                    case '!': // big endian
-                        if (i != 0) Error("unexpected byte order");
-                        fLittleEndian = false;
-                        fStandardized = true;
-                        break;
-                    default:
-                        if (Char.IsDigit(fmt[i])) {
-                            count = 0;
-                            while (Char.IsDigit(fmt[i])) {
-                                count = count * 10 + (fmt[i] - '0');
-                                i++;
-                            }
-                            if (Char.IsWhiteSpace(fmt[i])) Error("white space not allowed between count and format");
-                            i--;
-                            break;
-                        }
+            [PythonName("pack_into")]
+            public void PackInto(object buffer, int offset, params object[] values) {
+                byte[] bytes = buffer as byte[];
+                if (bytes == null) throw Ops.TypeError("pack_into requires a writable buffer (a byte array), got {0}", Ops.GetPythonTypeName(buffer));
 
-                        throw Error("bad format string");
+                if (offset < 0) offset += bytes.Length;
+                if (offset < 0 || bytes.Length - offset < size) {
+                    throw Error(String.Format("pack_into requires a buffer of at least {0} bytes", size));
                 }
+
+                Write(values, null, bytes, offset);
             }
 
-            if (curIndex != data.Length) throw Error("not all data used");
-            if (fStandardized)
-                return new Tuple(res);
-            return new Tuple(res);
-        }
+            [PythonName("unpack")]
+            public Tuple Unpack(object @string) {
+                string str;
+                byte[] bytes;
+                int offset, length;
+                GetData(@string, out str, out bytes, out offset, out length);
 
-        [PythonName("calcsize")]
-        public static int CalculateSize(string fmt) {
-            int len = 0;
-            int count = 1;
-            for (int i = 0; i < fmt.Length; i++) {
-                switch (fmt[i]) {
-                    case 'x': // pad byte
-                    case 'c': // char
-                    case 'b': // signed char
-                    case 'B': // unsigned char
-                    case 's': // char[]
-                        len += (count);
-                        count = 1;
-                        break;
-                    case 'h': // short
-                    case 'H': // unsigned short
-                        len += 2 * count;
-                        count = 1;
-                        break;
-                    case 'i': // int
-                    case 'I': // unsigned int
-                    case 'l': // long
-                    case 'L': // unsigned long
-                        len += 4 * count;
-                        count = 1;
-                        break;
-                    case 'q': // long long
-                    case 'Q': // unsigned long long
-                        len += 8 * count;
-                        count = 1;
-                        break;
-                    case 'f': // float
-                        len += 4 * count;
-                        count = 1;
-                        break;
-                    case 'd': // double
-                        len += 8 * count;
-                        count = 1;
-                        break;
-                    case 'p': // char[]
-                        len += count + 1;
-                        break;
-                    case 'P': // void *
-                        len += IntPtr.Size;
-                        break;
-                    case ' ':
-                    case '\t':
-                        break;
-                    case '=': // native
-                    case '@': // native
-                    case '<': // little endian
-                    case '>': // big endian
-                    case '!': // big endian
-                        if (i != 0) ExceptionConverter.CreateThrowable(error, "unexpected byte order");
-                        break;
-                    default:
-                        if (Char.IsDigit(fmt[i])) {
-                            count = 0;
-                            while (Char.IsDigit(fmt[i])) {
-                                count = count * 10 + (fmt[i] - '0');
-                                i++;
-                            }
-                            i--;
-                            break;
-                        }
+                if (length != size) throw Error(String.Format("unpack requires a string argument of length {0}", size));
+
+                return Read(str, bytes, offset);
+            }
+
+            [PythonName("unpack_from")]
+            public Tuple UnpackFrom(object buffer) {
+                return UnpackFrom(buffer, 0);
+            }
 
-                        throw Error("bad format string");
+            [PythonName("unpack_from")]
+            public Tuple UnpackFrom(object buffer, int offset) {
+                string str;
+                byte[] bytes;
+                int start, length;
+                GetData(buffer, out str, out bytes, out start, out length);
+
+                if (offset < 0) offset += length;
+                if (offset < 0 || length - offset < size) {
+                    throw Error(String.Format("unpack_from requires a buffer of at least {0} bytes", size));
                 }
+
+                return Read(str, bytes, start + offset);
             }
-            return len;
-        }
 
-        public static object error = ExceptionConverter.CreatePythonException("error", "struct");
+            /// <summary>
+            /// Gets the string or byte array holding the data of obj along w/ the range of the
+            /// data in it.  Buffers are read in place.
+            /// </summary>
+            private static void GetData(object obj, out string str, out byte[] bytes, out int offset, out int length) {
+                offset = 0;
+                PythonBuffer buffer = obj as PythonBuffer;
+                if (buffer != null) {
+                    obj = buffer.Object;
+                    offset = buffer.Offset;
+                }
 
-        #endregion
+                str = obj as string;
+                bytes = obj as byte[];
+                if (str == null && bytes == null) {
+                    ExtensibleString es = obj as ExtensibleString;
+                    if (es == null) throw Error("unpack requires a string, buffer or byte array argument");
+                    str = es.Value;
+                }
 
-        #region Write Helpers
+                length = (str != null ? str.Length : bytes.Length) - offset;
+                if (buffer != null && buffer.Size < length) length = buffer.Size;
+            }
 
-        private static void WriteShort(StringBuilder res, bool fLittleEndian, short val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-            } else {
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            #region Packing
+
+            // values are stored into chars if packing into a string, otherwise bytes.
+            private void Write(object[] values, char[] chars, byte[] bytes, int index) {
+                if (values.Length != valueCount) {
+                    throw Error(values.Length < valueCount ? "not enough arguments" : "not all arguments used");
+                }
+
+                int curObj = 0;
+                for (int i = 0; i < ops.Length; i++) {
+                    int count = ops[i].Count;
+                    switch (ops[i].Code) {
+                        case 'x': // pad byte
+                            for (int j = 0; j < count; j++) WriteByte(chars, bytes, ref index, 0);
+                            break;
+                        case 'c': // char
+                            for (int j = 0; j < count; j++) WriteChar(chars, bytes, ref index, GetCharValue(curObj++, values));
+                            break;
+                        case 'b': // signed char
+                            for (int j = 0; j < count; j++) WriteByte(chars, bytes, ref index, (byte)GetSByteValue(curObj++, values));
+                            break;
+                        case 'B': // unsigned char
+                            for (int j = 0; j < count; j++) WriteByte(chars, bytes, ref index, GetByteValue(curObj++, values));
+                            break;
+                        case 'h': // short
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 2, (ulong)GetShortValue(curObj++, values));
+                            break;
+                        case 'H': // unsigned short
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 2, GetUShortValue(curObj++, values));
+                            break;
+                        case 'i': // int
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 4, (ulong)GetIntValue(curObj++, values));
+                            break;
+                        case 'I': // unsigned int
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 4, GetUIntValue(curObj++, values));
+                            break;
+                        case 'q': // long long
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 8, (ulong)GetLongValue(curObj++, values));
+                            break;
+                        case 'Q': // unsigned long long
+                            for (int j = 0; j < count; j++) WriteInteger(chars, bytes, ref index, 8, GetULongValue(curObj++, values));
+                            break;
+                        case 'f': // float
+                            for (int j = 0; j < count; j++) {
+                                WriteInteger(chars, bytes, ref index, 4, (uint)BitConverter.ToInt32(BitConverter.GetBytes((float)GetDoubleValue(curObj++, values)), 0));
+                            }
+                            break;
+                        case 'd': // double
+                            for (int j = 0; j < count; j++) {
+                                WriteInteger(chars, bytes, ref index, 8, (ulong)BitConverter.DoubleToInt64Bits(GetDoubleValue(curObj++, values)));
+                            }
+                            break;
+                        case 's': // char[]
+                            WriteString(chars, bytes, ref index, count, GetStringValue(curObj++, values));
+                            break;
+                        case 'p': // pascal string
+                            string val = GetStringValue(curObj++, values);
+                            if (count > 0) {
+                                WriteByte(chars, bytes, ref index, (byte)Math.Min(255, Math.Min(val.Length, count - 1)));
+                                WriteString(chars, bytes, ref index, count - 1, val);
+                            }
+                            break;
+                    }
+                }
             }
-        }
 
-        private static void WriteUShort(StringBuilder res, bool fLittleEndian, ushort val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-            } else {
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            private void WriteInteger(char[] chars, byte[] bytes, ref int index, int length, ulong val) {
+                if (littleEndian) {
+                    for (int i = 0; i < length; i++) {
+                        WriteByte(chars, bytes, ref index, (byte)(val >> (i * 8)));
+                    }
+                } else {
+                    for (int i = length - 1; i >= 0; i--) {
+                        WriteByte(chars, bytes, ref index, (byte)(val >> (i * 8)));
+                    }
+                }
             }
-        }
 
-        private static void WriteInt(StringBuilder res, bool fLittleEndian, int val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-            } else {
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            private static void WriteString(char[] chars, byte[] bytes, ref int index, int len, string val) {
+                for (int i = 0; i < len; i++) {
+                    WriteChar(chars, bytes, ref index, i < val.Length ? val[i] : '\0');
+                }
             }
-        }
 
-        private static void WriteUInt(StringBuilder res, bool fLittleEndian, uint val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-            } else {
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            private static void WriteChar(char[] chars, byte[] bytes, ref int index, char val) {
+                if (chars != null) chars[index++] = val;
+                else bytes[index++] = (byte)val;
             }
-        }
 
-        private static void WriteFloat(StringBuilder res, bool fLittleEndian, float val) {
-            byte[] bytes = BitConverter.GetBytes(val);
-            if (fLittleEndian) {
-                res.Append((char)bytes[0]);
-                res.Append((char)bytes[1]);
-                res.Append((char)bytes[2]);
-                res.Append((char)bytes[3]);
-            } else {
-                res.Append((char)bytes[3]);
-                res.Append((char)bytes[2]);
-                res.Append((char)bytes[1]);
-                res.Append((char)bytes[0]);
+            private static void WriteByte(char[] chars, byte[] bytes, ref int index, byte val) {
+                if (chars != null) chars[index++] = (char)val;
+                else bytes[index++] = val;
             }
-        }
 
-        private static void WriteLong(StringBuilder res, bool fLittleEndian, long val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 32) & 0xff));
-                res.Append((char)((val >> 40) & 0xff));
-                res.Append((char)((val >> 48) & 0xff));
-                res.Append((char)((val >> 56) & 0xff));
-            } else {
-                res.Append((char)((val >> 56) & 0xff));
-                res.Append((char)((val >> 48) & 0xff));
-                res.Append((char)((val >> 40) & 0xff));
-                res.Append((char)((val >> 32) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            #endregion
+
+            #region Unpacking
+
+            // reads size bytes starting at index from either str or bytes, the caller checks
+            // there's enough data.
+            private Tuple Read(string str, byte[] bytes, int index) {
+                object[] res = new object[valueCount];
+                int curObj = 0;
+                for (int i = 0; i < ops.Length; i++) {
+                    int count = ops[i].Count;
+                    switch (ops[i].Code) {
+                        case 'x': // pad byte
+                            index += count;
+                            break;
+                        case 'c': // char
+                            for (int j = 0; j < count; j++) res[curObj++] = Ops.Char2String(ReadChar(str, bytes, ref index));
+                            break;
+                        case 'b': // signed char
+                            for (int j = 0; j < count; j++) res[curObj++] = (int)(sbyte)ReadChar(str, bytes, ref index);
+                            break;
+                        case 'B': // unsigned char
+                            for (int j = 0; j < count; j++) res[curObj++] = (int)(byte)ReadChar(str, bytes, ref index);
+                            break;
+                        case 'h': // short
+                            for (int j = 0; j < count; j++) res[curObj++] = (int)(short)ReadInteger(str, bytes, ref index, 2);
+                            break;
+                        case 'H': // unsigned short
+                            for (int j = 0; j < count; j++) res[curObj++] = (int)(ushort)ReadInteger(str, bytes, ref index, 2);
+                            break;
+                        case 'i': // int
+                            for (int j = 0; j < count; j++) res[curObj++] = (int)ReadInteger(str, bytes, ref index, 4);
+                            break;
+                        case 'I': // unsigned int
+                            for (int j = 0; j < count; j++) res[curObj++] = BigInteger.Create((uint)ReadInteger(str, bytes, ref index, 4));
+                            break;
+                        case 'q': // long long
+                            for (int j = 0; j < count; j++) res[curObj++] = BigInteger.Create((long)ReadInteger(str, bytes, ref index, 8));
+                            break;
+                        case 'Q': // unsigned long long
+                            for (int j = 0; j < count; j++) res[curObj++] = BigInteger.Create(ReadInteger(str, bytes, ref index, 8));
+                            break;
+                        case 'f': // float
+                            for (int j = 0; j < count; j++) {
+                                res[curObj++] = (double)BitConverter.ToSingle(BitConverter.GetBytes((int)ReadInteger(str, bytes, ref index, 4)), 0);
+                            }
+                            break;
+                        case 'd': // double
+                            for (int j = 0; j < count; j++) res[curObj++] = BitConverter.Int64BitsToDouble((long)ReadInteger(str, bytes, ref index, 8));
+                            break;
+                        case 's': // char[]
+                            res[curObj++] = ReadString(str, bytes, index, count);
+                            index += count;
+                            break;
+                        case 'p': // pascal string
+                            if (count > 0) {
+                                int len = Math.Min((byte)ReadChar(str, bytes, ref index), count - 1);
+                                res[curObj++] = ReadString(str, bytes, index, len);
+                                index += count - 1;
+                            } else {
+                                res[curObj++] = String.Empty;
+                            }
+                            break;
+                    }
+                }
+                return new Tuple(false, res);
             }
-        }
 
-        private static void WriteULong(StringBuilder res, bool fLittleEndian, ulong val) {
-            if (fLittleEndian) {
-                res.Append((char)(val & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 32) & 0xff));
-                res.Append((char)((val >> 40) & 0xff));
-                res.Append((char)((val >> 48) & 0xff));
-                res.Append((char)((val >> 56) & 0xff));
-            } else {
-                res.Append((char)((val >> 56) & 0xff));
-                res.Append((char)((val >> 48) & 0xff));
-                res.Append((char)((val >> 40) & 0xff));
-                res.Append((char)((val >> 32) & 0xff));
-                res.Append((char)((val >> 24) & 0xff));
-                res.Append((char)((val >> 16) & 0xff));
-                res.Append((char)((val >> 8) & 0xff));
-                res.Append((char)(val & 0xff));
+            private ulong ReadInteger(string str, byte[] bytes, ref int index, int length) {
+                ulong res = 0;
+                if (littleEndian) {
+                    for (int i = 0; i < length; i++) {
+                        res |= (ulong)(byte)ReadChar(str, bytes, ref index) << (i * 8);
+                    }
+                } else {
+                    for (int i = 0; i < length; i++) {
+                        res = (res << 8) | (byte)ReadChar(str, bytes, ref index);
+                    }
+                }
+                return res;
             }
-        }
 
-        private static void WriteDouble(StringBuilder res, bool fLittleEndian, double val) {
-            byte[] bytes = BitConverter.GetBytes(val);
-            if (fLittleEndian) {
-                res.Append((char)bytes[0]);
-                res.Append((char)bytes[1]);
-                res.Append((char)bytes[2]);
-                res.Append((char)bytes[3]);
-                res.Append((char)bytes[4]);
-                res.Append((char)bytes[5]);
-                res.Append((char)bytes[6]);
-                res.Append((char)bytes[7]);
-            } else {
-                res.Append((char)bytes[7]);
-                res.Append((char)bytes[6]);
-                res.Append((char)bytes[5]);
-                res.Append((char)bytes[4]);
-                res.Append((char)bytes[3]);
-                res.Append((char)bytes[2]);
-                res.Append((char)bytes[1]);
-                res.Append((char)bytes[0]);
+            private static string ReadString(string str, byte[] bytes, int index, int length) {
+                if (str != null) return str.Substring(index, length);
+
+                char[] res = new char[length];
+                for (int i = 0; i < length; i++) {
+                    res[i] = (char)bytes[index + i];
+                }
+                return new string(res);
             }
-        }
 
-        private static void WriteString(StringBuilder res, int len, string val) {
-            for (int i = 0; i < val.Length && i < len; i++) {
-                res.Append(val[i]);
+            private static char ReadChar(string str, byte[] bytes, ref int index) {
+                if (str != null) return str[index++];
+                return (char)bytes[index++];
             }
-            for (int i = val.Length; i < len; i++) {
-                res.Append('\0');
+
+            #endregion
+
+            /// <summary>
+            /// A format character w/ its repeat count.  For 's' and 'p' the count is the length
+            /// of the string.
+            /// </summary>
+            private struct Operation {
+                public readonly char Code;
+                public readonly int Count;
+
+                public Operation(char code, int count) {
+                    Code = code;
+                    Count = count;
+                }
+
+                public int Size {
+                    get {
+                        switch (Code) {
+                            case 'h': case 'H': return 2 * Count;
+                            case 'i': case 'I': case 'f': return 4 * Count;
+                            case 'q': case 'Q': case 'd': return 8 * Count;
+                            default: return Count;
+                        }
+                    }
+                }
+
+                public int ValueCount {
+                    get {
+                        switch (Code) {
+                            case 'x': return 0;
+                            case 's': case 'p': return 1;
+                            default: return Count;
+                        }
+                    }
+                }
             }
         }
 
-        private static void WritePascalString(StringBuilder res, int len, string val) {
-            int lenByte = Math.Min(255, Math.Min(val.Length, len));
-            res.Append((char)lenByte);
+        #endregion
 
-            for (int i = 0; i < val.Length && i < len; i++) {
-                res.Append(val[i]);
-            }
-            for (int i = val.Length; i < len; i++) {
-                res.Append('\0');
+        #region Format cache
+
+        private const int MaxCacheSize = 100;
+        private static LruCache<string, Struct> cache = new LruCache<string, Struct>(MaxCacheSize);
+
+        /// <summary>
+        /// Returns the parsed format for the module level functions, which are usually called
+        /// w/ the same few formats over and over.
+        /// </summary>
+        private static Struct GetStruct(string fmt) {
+            if (fmt == null) throw Ops.TypeError("expected string for format, got None");
+
+            Struct res;
+            if (!cache.TryGetValue(fmt, out res)) {
+                res = new Struct(fmt);
+                cache.Add(fmt, res);
             }
+            return res;
         }
+
         #endregion
 
         #region Data getter helpers
@@ -346,7 +346,8 @@ namespace IronPython.Runtime {
             } else if (o is IEnumerable) {
                 e = ((IEnumerable)o).GetEnumerator();
                 return true;
-            } else if (o is IEnumerator) {
+            } else if (o is IEnumerator && !(o is ISuperDynamicObject)) {
+                // subclasses (of file) may override __iter__ or next
                 e = (IEnumerator)o;
                 return true;
             }
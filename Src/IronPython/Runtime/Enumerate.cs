@@ -168,6 +168,7 @@ namespace IronPython.Runtime {
     internal class PythonEnumerator : IEnumerator {
         private readonly object baseObject;
         private object nextMethod;
+        private bool canStop;           // nextMethod can end the iteration w/o raising StopIteration
         private object current = null;
 
         public static bool TryCreate(object baseEnumerator, out IEnumerator enumerator) {
@@ -175,7 +176,7 @@ namespace IronPython.Runtime {
 
             if (Ops.TryGetAttr(baseEnumerator, SymbolTable.Iterator, out iter)) {
                 object iterator = Ops.Call(iter);
-                enumerator = new PythonEnumerator(iterator);
+                enumerator = Create(iterator);
                 return true;
             } else {
                 enumerator = null;
@@ -183,6 +184,22 @@ namespace IronPython.Runtime {
             }
         }
 
+        /// <summary>
+        /// Returns an enumerator for the object returned from __iter__.  Generators and the
+        /// built-in iterators are used directly: their MoveNext reports the end of the iteration
+        /// by returning false, while calling their next method throws StopIteration.  Instances
+        /// of user types always go through next in case it's been overridden.  If next raises
+        /// StopIteration itself it's called through Ops.CallIterationMethod, so the end of the
+        /// iteration doesn't throw either.
+        /// </summary>
+        internal static IEnumerator Create(object iterator) {
+            IEnumerator ie = iterator as IEnumerator;
+            if (ie != null && !(iterator is ISuperDynamicObject)) {
+                return ie;
+            }
+            return new PythonEnumerator(iterator);
+        }
+
         public PythonEnumerator(object iter) {
             this.baseObject = iter;
         }
@@ -205,14 +222,20 @@ namespace IronPython.Runtime {
                 if (!Ops.TryGetAttr(baseObject, SymbolTable.GeneratorNext, out nextMethod) || nextMethod == null) {
                     throw Ops.TypeError("instance has no next() method");
                 }
+                canStop = Ops.CanStopIteration(nextMethod);
             }
 
             try {
-                current = Ops.Call(nextMethod);
-                return true;
+                current = canStop ? Ops.CallIterationMethod(nextMethod) : Ops.Call(nextMethod);
             } catch (StopIterationException) {
                 return false;
             }
+
+            if (current == Ops.IterationStopped) {
+                current = null;
+                return false;
+            }
+            return true;
         }
 
         #endregion
@@ -247,7 +270,7 @@ namespace IronPython.Runtime {
 
         [PythonName("__iter__")]
         public IEnumerator GetEnumerator() {
-            return new PythonEnumerator(iterator);
+            return PythonEnumerator.Create(iterator);
         }
 
         #endregion
@@ -255,6 +278,7 @@ namespace IronPython.Runtime {
 
     internal class ItemEnumerator : IEnumerator {
         private readonly object getItemMethod;
+        private readonly bool canStop;  // getItemMethod can end the iteration w/o raising IndexError
         private object current = null;
         private int index = 0;
 
@@ -272,6 +296,7 @@ namespace IronPython.Runtime {
 
         internal ItemEnumerator(object getItemMethod) {
             this.getItemMethod = getItemMethod;
+            this.canStop = Ops.CanStopIteration(getItemMethod);
         }
 
         #region IEnumerator members
@@ -288,7 +313,12 @@ namespace IronPython.Runtime {
             }
 
             try {
-                current = Ops.Call(getItemMethod, index);
+                current = canStop ? Ops.CallIterationMethod(getItemMethod, index) : Ops.Call(getItemMethod, index);
+                if (current == Ops.IterationStopped) {
+                    current = null;
+                    index = -1;     // this is the end
+                    return false;
+                }
                 index++;
                 return true;
             } catch (IndexOutOfRangeException) {
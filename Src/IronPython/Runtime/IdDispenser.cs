@@ -79,7 +79,10 @@ namespace IronPython.Runtime {
         // The one and only comparer instance.
         static readonly IEqualityComparer comparer = new WrapperComparer();
 
-        static Hashtable hashtable = new Hashtable(comparer);
+        // Both tables are only updated while holding synchObject.  Hashtable is thread safe for
+        // multiple readers and a single writer so lookups in either direction don't take the lock.
+        static Hashtable hashtable = new Hashtable(comparer);   // Wrapper -> Wrapper
+        static Hashtable idtable = new Hashtable();             // boxed Id -> Wrapper
 
         // The one and only global lock instance.
         static readonly Object synchObject = new Object();
@@ -105,28 +108,28 @@ namespace IronPython.Runtime {
                     emptyCount++;
             }
 
-            // Rehash the table if there is a significant number of empty slots
+            // Rehash the tables if there is a significant number of empty slots
             if (emptyCount > liveCount / 4) {
                 Hashtable newtable = new Hashtable(liveCount + liveCount / 4, 1.0f, comparer);
+                Hashtable newidtable = new Hashtable(liveCount + liveCount / 4, 1.0f);
 
                 foreach (Wrapper w in hashtable.Keys) {
-                    if (w.Target != null)
+                    if (w.Target != null) {
                         newtable[w] = w;
+                        newidtable[w.Id] = w;
+                    }
                 }
 
                 hashtable = newtable;
+                idtable = newidtable;
             }
         }
 
         public static object GetObject(long id) {
-            lock (synchObject) {
-                foreach (Wrapper w in hashtable.Keys) {
-                    if (w.Target != null) {
-                        if (w.Id == id) return w.Target;
-                    }
-                }
-                return null;
-            }
+            Wrapper w = (Wrapper)idtable[id];
+            if (w != null)
+                return w.Target;
+            return null;
         }
 
         public static long GetId(Object o) {
@@ -166,8 +169,9 @@ namespace IronPython.Runtime {
                     }
                 }
 
-                w = new Wrapper(o, uniqueId);
-                hashtable[w] = w;
+                Wrapper wrapper = new Wrapper(o, uniqueId);
+                idtable[uniqueId] = wrapper;
+                hashtable[wrapper] = wrapper;
 
                 return uniqueId;
             }
@@ -400,11 +400,27 @@ namespace IronPython.Runtime {
         }
 
         private static PythonModule LoadFromSource(SystemState state, string fullName, string fileName) {
-            CompilerContext context = new CompilerContext(fileName);
-            Parser parser = Parser.FromFile(state, context);
-            Statement s = parser.ParseFileInput();
+            PythonModule pmod = null;
+            string cacheFile = null;
 
-            PythonModule pmod = OutputGenerator.GenerateModule(state, context, s, fullName);
+            if (Options.CacheCompiledModules && !Options.GenerateModulesAsSnippets) {
+                cacheFile = ModuleCache.GetCacheFile(fullName, fileName);
+                if (cacheFile != null) {
+                    pmod = ModuleCache.TryLoad(state, fullName, cacheFile);
+                }
+            }
+
+            if (pmod == null) {
+                CompilerContext context = new CompilerContext(fileName);
+                Parser parser = Parser.FromFile(state, context);
+                Statement s = parser.ParseFileInput();
+
+                if (cacheFile != null) {
+                    pmod = OutputGenerator.GenerateCachedModule(state, context, s, fullName, cacheFile);
+                } else {
+                    pmod = OutputGenerator.GenerateModule(state, context, s, fullName);
+                }
+            }
 
             pmod.Filename = fileName;
             pmod.ModuleName = fullName;
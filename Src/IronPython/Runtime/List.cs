@@ -648,13 +648,6 @@ namespace IronPython.Runtime {
             public DefaultPythonComparer() { }
 
             public int Compare(object x, object y) {
-                //??? Putting this optimization here is awfully special case, but comes close to halving sort time for int lists
-                //				if (x is int && y is int) {
-                //					int xi = (int)x;
-                //					int yi = (int)y;
-                //					return xi == yi ? 0 : (xi < yi ? -1 : +1);
-                //				}
-
                 return Ops.Compare(x, y);
             }
         }
@@ -710,17 +703,52 @@ namespace IronPython.Runtime {
                     data = Ops.EMPTY;
                     size = 0;
 
+                    // the default comparison of ints, floats and strings can't run any Python code,
+                    // so when all of the keys are of one of those types they're compared directly.
+                    bool typed = cmp == DefaultPythonComparer.Instance;
+
                     if (key != null) {
-                        object[] keys = new object[sortSize];
-                        for (int i = 0; i < sortSize; i++) {
+                        SortItem[] items = new SortItem[count];
+                        Type keyType = null;
+                        for (int i = 0; i < count; i++) {
                             Debug.Assert(data.Length == 0);
-                            keys[i] = Ops.Call(key, sortData[i]);
+                            object value = sortData[index + i];
+                            items[i] = new SortItem(Ops.Call(key, value), value);
                             if (data.Length != 0) throw Ops.ValueError("list mutated while determing keys");
+
+                            if (typed) typed = UpdateKeyType(ref keyType, items[i].Key);
                         }
 
-                        sortData = ListMergeSort(sortData, keys, cmp, index, count, reverse);
+                        try {
+                            if (!typed) {
+                                SortRange(items, 0, count, new KeyComparer<PythonComparer>(new PythonComparer(this, cmp)), reverse);
+                            } else if (keyType == typeof(int)) {
+                                SortRange(items, 0, count, new KeyComparer<IntComparer>(new IntComparer()), reverse);
+                            } else if (keyType == typeof(double)) {
+                                SortRange(items, 0, count, new KeyComparer<DoubleComparer>(new DoubleComparer()), reverse);
+                            } else {
+                                SortRange(items, 0, count, new KeyComparer<StringComparer>(new StringComparer()), reverse);
+                            }
+                        } finally {
+                            for (int i = 0; i < count; i++) {
+                                sortData[index + i] = items[i].Value;
+                            }
+                        }
                     } else {
-                        sortData = ListMergeSort(sortData, cmp, index, count, reverse);
+                        Type keyType = null;
+                        for (int i = 0; i < count && typed; i++) {
+                            typed = UpdateKeyType(ref keyType, sortData[index + i]);
+                        }
+
+                        if (!typed) {
+                            SortRange(sortData, index, count, new PythonComparer(this, cmp), reverse);
+                        } else if (keyType == typeof(int)) {
+                            SortRange(sortData, index, count, new IntComparer(), reverse);
+                        } else if (keyType == typeof(double)) {
+                            SortRange(sortData, index, count, new DoubleComparer(), reverse);
+                        } else {
+                            SortRange(sortData, index, count, new StringComparer(), reverse);
+                        }
                     }
                 } finally {
                     // restore the list to it's old data & size (which is now supported appropriately)
@@ -731,128 +759,97 @@ namespace IronPython.Runtime {
             }
         }
 
-        internal object[] ListMergeSort(object[] sortData, IComparer cmp, int index, int count, bool reverse) {
-            return ListMergeSort(sortData, null, cmp, index, count, reverse);
+        /// <summary>
+        /// Sorts the range, sorting in reverse like CPython: by reversing the range before and after
+        /// the sort, so that equal elements stay in their original order.
+        /// </summary>
+        private static void SortRange<T, TComparer>(T[] items, int index, int count, TComparer comparer, bool reverse)
+            where TComparer : struct, IComparer<T> {
+            if (reverse) Array.Reverse(items, index, count);
+            try {
+                TimSort<T, TComparer>.Sort(items, index, count, comparer);
+            } finally {
+                if (reverse) Array.Reverse(items, index, count);
+            }
         }
 
-        internal object[] ListMergeSort(object[] sortData, object[] keys, IComparer cmp, int index, int count, bool reverse) {
-            if (count - index < 2) return sortData;  // 1 or less items, we're sorted, quit now...
+        /// <summary>
+        /// Tracks whether the keys seen so far are all ints, all floats (other than NaN, which
+        /// doesn't order consistently) or all strings.  Returns false once they aren't.
+        /// </summary>
+        private static bool UpdateKeyType(ref Type keyType, object key) {
+            Type type;
+            if (key is int) type = typeof(int);
+            else if (key is string) type = typeof(string);
+            else if (key is double && !Double.IsNaN((double)key)) type = typeof(double);
+            else return false;
 
-            if (keys == null) keys = sortData;
-            // list merge sort - stable sort w/ a minimum # of comparisons.
+            if (keyType == null) keyType = type;
+            return keyType == type;
+        }
 
-            int len = count - index;
-            // prepare the two lists.
-            int[] lists = new int[len + 2];    //0 and count + 1 are auxillary fields
+        private struct SortItem {
+            public readonly object Key;
+            public readonly object Value;
 
-            lists[0] = 1;
-            lists[len + 1] = 2;
-            for (int i = 1; i <= len - 2; i++) {
-                lists[i] = -(i + 2);
+            public SortItem(object key, object value) {
+                Key = key;
+                Value = value;
             }
+        }
 
-            lists[len - 1] = lists[len] = 0;
-
-            // new pass
-            for (; ; ) {
-                // p & q  traverse the lists during each pass.  
-                //  s is usually the most most recently processed record of the current sublist
-                //  t points to the end of the previously output sublist
-                int s = 0;
-                int t = len + 1;
-                int p = lists[s];
-                int q = lists[t];
-
-                if (q == 0) break;  // we're done
-                for (; ; ) {
-                    // Indexes into the array here are 1 based.  0 is a 
-                    // virtual element and so is (len - 1) - they only exist in
-                    // the length array.
-
-                    if ((p < 1) || (q <= len && DoCompare(keys, cmp, p + index - 1, q + index - 1, reverse))) {
-                        // advance p
-                        if (lists[s] < 0) lists[s] = Math.Abs(p) * -1;
-                        else lists[s] = Math.Abs(p);
-
-                        s = p;
-                        p = lists[p];
-
-                        if (p > 0) continue;
-
-                        // complete the sublist
-                        lists[s] = q;
-                        s = t;
-                        do {
-                            t = q;
-                            q = lists[q];
-                        } while (q > 0);
-                    } else {
-                        // advance q
-                        if (lists[s] < 0) lists[s] = Math.Abs(q) * -1;
-                        else lists[s] = Math.Abs(q);
-
-                        s = q;
-                        q = lists[q];
-
-                        if (q > 0) continue;
+        /// <summary>
+        /// Compares w/ the sort's comparer (the default Python comparison or a cmp function) and
+        /// checks that the comparison didn't modify the list.
+        /// </summary>
+        private struct PythonComparer : IComparer<object> {
+            private readonly List list;
+            private readonly IComparer cmp;
 
-                        // Complete the sublist
-                        lists[s] = p;
-                        s = t;
+            public PythonComparer(List list, IComparer cmp) {
+                this.list = list;
+                this.cmp = cmp;
+            }
 
-                        do {
-                            t = p;
-                            p = lists[p];
-                        } while (p > 0);
-                    }
+            public int Compare(object x, object y) {
+                Debug.Assert(list.data.Length == 0);
 
-                    Debug.Assert(p <= 0);
-                    Debug.Assert(q <= 0);
-                    p *= -1;
-                    q *= -1;
-
-                    if (q == 0) {
-                        if (lists[s] < 0) lists[s] = Math.Abs(p) * -1;
-                        else lists[s] = Math.Abs(p);
-                        lists[t] = 0;
-                        // go back to new pass
-                        break;
-                    } // else keep going
-                }
+                int res = cmp.Compare(x, y);
+                if (list.data.Length != 0) throw Ops.ValueError("list mutated during sort");
+                return res;
             }
+        }
 
-            // use the resulting indicies to
-            // extract the order.
-            object[] newData = new object[len];
-            int start = lists[0];
-            int outIndex = 0;
-            while (start != 0) {
-                newData[outIndex++] = sortData[start + index - 1];
-                start = lists[start];
+        private struct IntComparer : IComparer<object> {
+            public int Compare(object x, object y) {
+                int xi = (int)x, yi = (int)y;
+                return xi == yi ? 0 : (xi < yi ? -1 : 1);
             }
+        }
 
-            if (sortData.Length != count || index != 0) {
-                for (int j = 0; j < count; j++) {
-                    sortData[j + index] = newData[j];
-                }
-            } else {
-                sortData = newData;
+        private struct DoubleComparer : IComparer<object> {
+            public int Compare(object x, object y) {
+                double xd = (double)x, yd = (double)y;
+                return xd == yd ? 0 : (xd < yd ? -1 : 1);
             }
+        }
 
-            return sortData;
+        private struct StringComparer : IComparer<object> {
+            public int Compare(object x, object y) {
+                return String.CompareOrdinal((string)x, (string)y);
+            }
         }
 
-        /// <summary>
-        /// Compares the two specified keys
-        /// </summary>
-        private bool DoCompare(object[] keys, IComparer cmp, int p, int q, bool reverse) {
-            Debug.Assert(data.Length == 0);
+        private struct KeyComparer<TComparer> : IComparer<SortItem> where TComparer : struct, IComparer<object> {
+            private TComparer comparer;
 
-            int result = cmp.Compare(keys[p], keys[q]);
-            bool ret = reverse ? (result >= 0) : (result <= 0);
+            public KeyComparer(TComparer comparer) {
+                this.comparer = comparer;
+            }
 
-            if (data.Length != 0) throw Ops.ValueError("list mutated during sort");
-            return ret;
+            public int Compare(SortItem x, SortItem y) {
+                return comparer.Compare(x.Key, y.Key);
+            }
         }
 
         internal int BinarySearch(int index, int count, object value, IComparer comparer) {
@@ -327,31 +327,15 @@ namespace IronPython.Runtime {
 
         public static BigInteger ParseBigInteger(string text, int b) {
             if (b == 0) b = DetectRadix(ref text);
-            BigInteger ret = BigInteger.Zero;
-            BigInteger m = BigInteger.One;
 
-            int i = text.Length - 1;
-            if (text[i] == 'l' || text[i] == 'L') i -= 1;
+            int length = text.Length;
+            if (text[length - 1] == 'l' || text[length - 1] == 'L') length -= 1;
 
-            int groupMax = 7;
-            if (b <= 10) groupMax = 9;// 2 147 483 647
-
-            while (i >= 0) {
-                // extract digits in a batch
-                int smallMultiplier = 1;
-                uint uval = 0;
-
-                for (int j = 0; j < groupMax && i >= 0; j++) {
-                    uval = (uint)(CharValue(text[i--], b) * smallMultiplier + uval);
-                    smallMultiplier *= b;
-                }
-
-                // this is more generous than needed
-                ret += m * BigInteger.Create(uval);
-                if (i >= 0) m = m * (smallMultiplier);
+            for (int i = 0; i < length; i++) {
+                CharValue(text[i], b);
             }
 
-            return ret;
+            return ParseBigIntegerDigits(text, 0, length, b);
         }
 
         public static BigInteger ParseBigIntegerSign(string text, int b) {
@@ -364,7 +348,7 @@ namespace IronPython.Runtime {
 
             ParseIntegerStart(text, ref b, ref start, end, ref sign);
 
-            BigInteger ret = BigInteger.Zero;
+            int digitStart = start;
             for (; ; ) {
                 int digit;
                 if (start >= end) break;
@@ -372,9 +356,9 @@ namespace IronPython.Runtime {
                 if (!(digit < b)) {
                     throw new ArgumentException("Invalid integer literal");
                 }
-                ret = ret * b + digit;
                 start++;
             }
+            BigInteger ret = ParseBigIntegerDigits(text, digitStart, start - digitStart, b);
 
             if (start < end && (text[start] == 'l' || text[start] == 'L')) {
                 start++;
@@ -386,6 +370,24 @@ namespace IronPython.Runtime {
         }
 
 
+        /// <summary>
+        /// Parses digits which have already been checked w/ BigInteger.Parse, replacing any
+        /// Arabic-Indic digits w/ ASCII ones first.
+        /// </summary>
+        private static BigInteger ParseBigIntegerDigits(string text, int start, int length, int b) {
+            int end = start + length;
+            for (int i = start; i < end; i++) {
+                if (text[i] > '\x7f') {
+                    StringBuilder digits = new StringBuilder(length);
+                    for (i = start; i < end; i++) {
+                        digits.Append("0123456789abcdef"[HexValue(text[i])]);
+                    }
+                    return BigInteger.Parse(digits.ToString(), 0, length, (uint)b);
+                }
+            }
+            return BigInteger.Parse(text, start, length, (uint)b);
+        }
+
         public static double ParseFloat(string text) {
             try {
                 //
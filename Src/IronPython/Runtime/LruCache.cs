@@ -0,0 +1,128 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+using System.Collections.Generic;
+
+namespace IronPython.Runtime {
+    /// <summary>
+    /// A thread-safe dictionary which holds at most Capacity entries.  When a new entry is added
+    /// to a full cache the least recently used entry is discarded.  The cache keeps counts of
+    /// its hits, misses and evictions.
+    /// </summary>
+    class LruCache<TKey, TValue> {
+        private readonly int capacity;
+        private readonly Dictionary<TKey, LinkedListNode<KeyValuePair<TKey, TValue>>> dict;
+        private readonly LinkedList<KeyValuePair<TKey, TValue>> list = new LinkedList<KeyValuePair<TKey, TValue>>();   // most recently used first
+        private long hits, misses, evictions;
+
+        public LruCache(int capacity)
+            : this(capacity, null) {
+        }
+
+        public LruCache(int capacity, IEqualityComparer<TKey> comparer) {
+            if (capacity <= 0) throw new ArgumentOutOfRangeException("capacity");
+
+            this.capacity = capacity;
+            this.dict = new Dictionary<TKey, LinkedListNode<KeyValuePair<TKey, TValue>>>(comparer);
+        }
+
+        public int Capacity {
+            get { return capacity; }
+        }
+
+        public int Count {
+            get {
+                lock (this) return dict.Count;
+            }
+        }
+
+        public long Hits {
+            get { return hits; }
+        }
+
+        public long Misses {
+            get { return misses; }
+        }
+
+        public long Evictions {
+            get { return evictions; }
+        }
+
+        public bool TryGetValue(TKey key, out TValue value) {
+            lock (this) {
+                LinkedListNode<KeyValuePair<TKey, TValue>> node;
+                if (dict.TryGetValue(key, out node)) {
+                    if (node != list.First) {
+                        list.Remove(node);
+                        list.AddFirst(node);
+                    }
+                    hits++;
+                    value = node.Value.Value;
+                    return true;
+                }
+
+                misses++;
+                value = default(TValue);
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Adds or replaces the entry for key, evicting the least recently used entry if
+        /// the cache is full.
+        /// </summary>
+        public void Add(TKey key, TValue value) {
+            lock (this) {
+                LinkedListNode<KeyValuePair<TKey, TValue>> node;
+                if (dict.TryGetValue(key, out node)) {
+                    list.Remove(node);
+                } else if (dict.Count == capacity) {
+                    LinkedListNode<KeyValuePair<TKey, TValue>> last = list.Last;
+                    list.RemoveLast();
+                    dict.Remove(last.Value.Key);
+                    evictions++;
+                }
+
+                node = list.AddFirst(new KeyValuePair<TKey, TValue>(key, value));
+                dict[key] = node;
+            }
+        }
+
+        /// <summary>
+        /// Returns the values in the cache, most recently used first.
+        /// </summary>
+        public List<TValue> GetValues() {
+            lock (this) {
+                List<TValue> res = new List<TValue>(list.Count);
+                foreach (KeyValuePair<TKey, TValue> entry in list) {
+                    res.Add(entry.Value);
+                }
+                return res;
+            }
+        }
+
+        /// <summary>
+        /// Removes all of the entries from the cache and resets the statistics.
+        /// </summary>
+        public void Clear() {
+            lock (this) {
+                dict.Clear();
+                list.Clear();
+                hits = misses = evictions = 0;
+            }
+        }
+    }
+}
@@ -316,18 +316,7 @@ namespace IronPython.Runtime.Operations {
             if (y < 0) {
                 throw Ops.TypeError("power", y, "power must be >= 0");
             }
-            if (z == BigInteger.Zero) {
-                throw Ops.ZeroDivisionError();
-            }
-
-            BigInteger result = x.ModPow(y, z);
-
-            if (result >= BigInteger.Zero) {
-                if (z < BigInteger.Zero) return result + z;
-            } else {
-                if (z > BigInteger.Zero) return result + z;
-            }
-            return result;
+            return PowerMod(x, BigInteger.Create(y), z);
         }
 
         private static object PowerMod(BigInteger x, BigInteger y, BigInteger z) {
@@ -338,11 +327,13 @@ namespace IronPython.Runtime.Operations {
                 throw Ops.ZeroDivisionError();
             }
 
+            // ModPow uses sliding window exponentiation w/ Montgomery reduction for odd moduli,
+            // the result has the sign of x ** y
             BigInteger result = x.ModPow(y, z);
 
-            if (result >= BigInteger.Zero) {
+            if (result > BigInteger.Zero) {
                 if (z < BigInteger.Zero) return result + z;
-            } else {
+            } else if (result < BigInteger.Zero) {
                 if (z > BigInteger.Zero) return result + z;
             }
             return result;
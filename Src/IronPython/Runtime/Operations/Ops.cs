@@ -1210,6 +1210,37 @@ namespace IronPython.Runtime.Operations {
             return ie;
         }
 
+        private static object builtinRange;
+
+        /// <summary>
+        /// Called from the code generated for "for x in range(...)" and "for x in xrange(...)".
+        /// Returns true if func is still the built-in range or xrange and all of the arguments
+        /// are ints, in which case the loop is run w/ a counter.  Otherwise the caller calls func
+        /// and iterates over the result, which also reports any errors.
+        /// </summary>
+        public static bool IsCountedRange(object func, object stop) {
+            return IsBuiltinRange(func) && stop is int;
+        }
+
+        public static bool IsCountedRange(object func, object start, object stop) {
+            return IsBuiltinRange(func) && start is int && stop is int;
+        }
+
+        public static bool IsCountedRange(object func, object start, object stop, object step) {
+            return IsBuiltinRange(func) && start is int && stop is int && step is int && (int)step != 0;
+        }
+
+        private static bool IsBuiltinRange(object func) {
+            if (func == Builtin.xrange) return true;
+
+            if (builtinRange == null) {
+                object range;
+                if (!TypeCache.Builtin.TryGetSlot(DefaultContext.Default, SymbolTable.StringToId("range"), out range)) return false;
+                builtinRange = Ops.GetDescriptor(range, null, TypeCache.Builtin);
+            }
+            return func == builtinRange;
+        }
+
         /// <summary>
         /// Returns the number of elements in the collection, and the element values
         /// </summary>
@@ -1644,6 +1675,90 @@ namespace IronPython.Runtime.Operations {
             return GetDynamicType(o).GetAttr(context, o, name);
         }
 
+        /// <summary>
+        /// Called from the code generated for "o.name(args)".  If o.name would produce a bound
+        /// method of a Python function or a built-in method, returns the unbound function and sets
+        /// self to o so that InvokeMethod can call it w/o creating the bound method.  Otherwise
+        /// returns the value of o.name and sets self to null.
+        /// </summary>
+        public static object GetMethodForCall(ICallerContext context, object o, SymbolId name, out object self) {
+            FastCallable func = TryGetUnboundMethod(context, o, name);
+            if (func != null) {
+                self = o;
+                return func;
+            }
+
+            self = null;
+            return GetAttr(context, o, name);
+        }
+
+        private static FastCallable TryGetUnboundMethod(ICallerContext context, object o, SymbolId name) {
+            if (o == null || !GetAttrSite.IsCacheableName(name)) return null;
+
+            object slot;
+            OldInstance oi = o as OldInstance;
+            if (oi != null) {
+                if (!oi.TryLookupClassSlot(name, out slot)) return null;
+                return slot as PythonFunction;
+            }
+
+            if (o is ICustomAttributes) return null;
+
+            DynamicType dt = GetDynamicType(o);
+            if (!dt.IsAttributeLookupCacheable || !dt.TryLookupSlot(context, name, out slot)) return null;
+
+            BuiltinMethodDescriptor bmd = slot as BuiltinMethodDescriptor;
+            if (bmd != null) {
+                // the slot came from o's MRO so there's no need to check self
+                return bmd.template;
+            }
+
+            PythonFunction func = slot as PythonFunction;
+            if (func == null) return null;
+
+            if (dt is UserType) {
+                // functions don't override the instance dictionary
+                IAttributesDictionary dict = ((ISuperDynamicObject)o).GetDict();
+                if (dict != null && dict.ContainsKey(name)) return null;
+            }
+            return func;
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self);
+            return CallWithContext(context, func);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object arg0) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, arg0);
+            return CallWithContext(context, func, arg0);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object arg0, object arg1) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, arg0, arg1);
+            return CallWithContext(context, func, arg0, arg1);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object arg0, object arg1, object arg2) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, arg0, arg1, arg2);
+            return CallWithContext(context, func, arg0, arg1, arg2);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object arg0, object arg1, object arg2, object arg3) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, arg0, arg1, arg2, arg3);
+            return CallWithContext(context, func, arg0, arg1, arg2, arg3);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object arg0, object arg1, object arg2, object arg3, object arg4) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, arg0, arg1, arg2, arg3, arg4);
+            return CallWithContext(context, func, arg0, arg1, arg2, arg3, arg4);
+        }
+
+        public static object InvokeMethod(ICallerContext context, object func, object self, object[] args) {
+            if (self != null) return ((FastCallable)func).CallInstance(context, self, args);
+            return CallWithContext(context, func, args);
+        }
+
         public static void SetAttr(ICallerContext context, object o, SymbolId name, object value) {
             ICustomAttributes ids = o as ICustomAttributes;
 
@@ -2126,6 +2241,95 @@ namespace IronPython.Runtime.Operations {
             throw throwable;
         }
 
+        #region Ending iterations without StopIteration
+
+        // The exceptions a user defined next or __getitem__ method may report by returning
+        // IterationStopped instead of raising them.  iterationStops is only set while
+        // CallIterationMethod calls straight into a function which can do that, and the function
+        // takes it before running any other code.
+        internal const int StopIterationStop = 0x01;
+        internal const int IndexErrorStop = 0x02;
+
+        [ThreadStatic]
+        private static int iterationStops;
+
+        internal static readonly object IterationStopped = new object();
+
+        /// <summary>
+        /// Called by generated code on entry to a function which raises StopIteration or IndexError
+        /// outside of any try or with block.  Returns the exceptions the function may report by
+        /// returning IterationStopped, which are none unless it's been called by an iterator.
+        /// </summary>
+        public static int TakeIterationStops() {
+            int res = iterationStops;
+            if (res != 0) iterationStops = 0;
+            return res;
+        }
+
+        /// <summary>
+        /// Called by generated code for raise StopIteration and raise IndexError in functions which
+        /// call TakeIterationStops.  Returns IterationStopped if the exception is one of stops,
+        /// otherwise raises it.
+        /// </summary>
+        public static object RaiseOrStopIteration(object type, object value, object traceback, int stops) {
+            if (((stops & StopIterationStop) != 0 && IsExceptionOrInstance(type, "StopIteration")) ||
+                ((stops & IndexErrorStop) != 0 && IsExceptionOrInstance(type, "IndexError"))) {
+                return IterationStopped;
+            }
+
+            Raise(type, value, traceback);
+            return null;
+        }
+
+        private static bool IsExceptionOrInstance(object type, string name) {
+            IPythonType exception = ExceptionConverter.GetPythonException(name);
+            return type == exception || Builtin.IsInstance(type, exception);
+        }
+
+        /// <summary>
+        /// True if method can report the end of an iteration by returning IterationStopped.  That's
+        /// a bound method (or a function) whose code raises StopIteration or IndexError directly.
+        /// </summary>
+        internal static bool CanStopIteration(object method) {
+            Method m = method as Method;
+            if (m != null) {
+                if (m.Self == null) return false;
+                method = m.Function;
+            }
+
+            PythonFunction f = method as PythonFunction;
+            return f != null && f.CanStopIteration;
+        }
+
+        /// <summary>
+        /// Calls the next method of a user defined iterator, which CanStopIteration has accepted.
+        /// Returns IterationStopped if it reported the end of the iteration w/o raising StopIteration.
+        /// </summary>
+        internal static object CallIterationMethod(object method) {
+            iterationStops = StopIterationStop;
+            try {
+                return Call(method);
+            } finally {
+                iterationStops = 0;
+            }
+        }
+
+        /// <summary>
+        /// Calls the __getitem__ method of a user defined sequence, which CanStopIteration has
+        /// accepted.  Returns IterationStopped if it reported the end of the sequence w/o raising
+        /// IndexError or StopIteration.
+        /// </summary>
+        internal static object CallIterationMethod(object method, object index) {
+            iterationStops = StopIterationStop | IndexErrorStop;
+            try {
+                return Call(method, index);
+            } finally {
+                iterationStops = 0;
+            }
+        }
+
+        #endregion
+
         public static object ExtractException(Exception e, ICallerContext context) {
             return ExtractException(e, context.SystemState);
         }
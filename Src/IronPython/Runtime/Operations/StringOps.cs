@@ -165,8 +165,8 @@ namespace IronPython.Runtime.Operations {
 
         [PythonName("__contains__")]
         public virtual bool ContainsValue(object value) {
-            if (value is string) return self.Contains((string)value);
-            else if (value is ExtensibleString) return self.Contains(((ExtensibleString)value).self);
+            if (value is string) return StringOps.Contains(self, (string)value);
+            else if (value is ExtensibleString) return StringOps.Contains(self, ((ExtensibleString)value).self);
 
             throw Ops.TypeErrorForBadInstance("expected string, got {0}", value);
         }
@@ -267,7 +267,7 @@ namespace IronPython.Runtime.Operations {
 
         [PythonName("__contains__")]
         public static bool Contains(string s, string item) {
-            return s.Contains(item);
+            return IndexOf(s, item, 0, s.Length) != -1;
         }
 
         [PythonName("__contains__")]
@@ -394,21 +394,11 @@ namespace IronPython.Runtime.Operations {
         [PythonName("count")]
         public static int Count(string self, string ssub, int start, int end) {
             if (ssub == null) throw Ops.TypeError("expected string for 'sub' argument, got NoneType");
-            string v = self;
-            if (v.Length == 0) return 0;
 
             start = Ops.FixSliceIndex(start, self.Length);
             end = Ops.FixSliceIndex(end, self.Length);
 
-            int count = 0;
-            while (true) {
-                if (end <= start) break;
-                int index = v.IndexOf(ssub, start, end - start);
-                if (index == -1) break;
-                count++;
-                start = index + ssub.Length;
-            }
-            return count;
+            return CountOf(self, ssub, start, end);
         }
 
         [PythonName("decode")]
@@ -486,16 +476,13 @@ namespace IronPython.Runtime.Operations {
         [PythonName("find")]
         public static int Find(string self, string sub) {
             if (sub == null) throw Ops.TypeError("expected string, got NoneType");
-            if (sub.Length == 1) return self.IndexOf(sub[0]);
-            CompareInfo c = CultureInfo.InvariantCulture.CompareInfo;
-            return c.IndexOf(self, sub, CompareOptions.Ordinal);
-
+            return IndexOf(self, sub, 0, self.Length);
         }
 
         [PythonName("find")]
         public static int Find(string self, string sub, int start) {
             if (sub == null) throw Ops.TypeError("expected string, got NoneType");
-            return self.IndexOf(sub, Ops.FixSliceIndex(start, self.Length));
+            return IndexOf(self, sub, Ops.FixSliceIndex(start, self.Length), self.Length);
         }
 
         [PythonName("find")]
@@ -504,7 +491,7 @@ namespace IronPython.Runtime.Operations {
             start = Ops.FixSliceIndex(start, self.Length);
             end = Ops.FixSliceIndex(end, self.Length);
 
-            return self.IndexOf(sub, start, end - start);
+            return IndexOf(self, sub, start, end);
         }
 
         [PythonName("index")]
@@ -735,28 +722,27 @@ namespace IronPython.Runtime.Operations {
         public static string Replace(string self, string old, string new_) {
             if (old == null) throw Ops.TypeError("expected string for 'old' argument, got NoneType");
             if (old.Length == 0) return ReplaceEmpty(self, new_, self.Length + 1);
-            return self.Replace(old, new_);
+            return Replace(self, old, new_, -1);
         }
 
         [PythonName("replace")]
         public static string Replace(string self, string old, string new_, int maxsplit) {
             if (old == null) throw Ops.TypeError("expected string for 'old' argument, got NoneType");
-            if (maxsplit == -1) return Replace(self, old, new_);
-            if (old.Length == 0) return ReplaceEmpty(self, new_, maxsplit);
+            if (old.Length == 0) return ReplaceEmpty(self, new_, maxsplit < 0 ? self.Length + 1 : maxsplit);
 
-            string v = self;
-            StringBuilder ret = new StringBuilder(v.Length);
+            // a negative count replaces every occurrence
+            int[] shifts = null;
+            int index = IndexOf(self, old, 0, self.Length, ref shifts);
+            if (index == -1 || maxsplit == 0) return self;
 
-            int index;
+            StringBuilder ret = new StringBuilder(self.Length);
             int start = 0;
-
-            while (maxsplit > 0 && (index = v.IndexOf(old, start)) != -1) {
-                ret.Append(v.Substring(start, index - start));
+            do {
+                ret.Append(self, start, index - start);
                 ret.Append(new_);
                 start = index + old.Length;
-                maxsplit--;
-            }
-            ret.Append(v.Substring(start));
+            } while (--maxsplit != 0 && (index = IndexOf(self, old, start, self.Length, ref shifts)) != -1);
+            ret.Append(self, start, self.Length - start);
 
             return ret.ToString();
         }
@@ -780,11 +766,7 @@ namespace IronPython.Runtime.Operations {
             start = Ops.FixSliceIndex(start, self.Length);
             end = Ops.FixSliceIndex(end, self.Length);
 
-            if (start > end) return -1;     // can't possibly match anything, not even an empty string
-            if (sub.Length == 0) return end;    // match at the end
-            if (end == 0) return -1;    // can't possibly find anything
-
-            return self.LastIndexOf(sub, end - 1, end - start);
+            return LastIndexOf(self, sub, start, end);
         }
 
         [PythonName("rindex")]
@@ -849,13 +831,29 @@ namespace IronPython.Runtime.Operations {
             return Split(self, (char[])null, -1);
         }
 
+        //  a separator can overlap itself so it's still searched for from the right
         [PythonName("rsplit")]
         public static List RSplit(string self, string sep) {
-            return Split(self, sep, -1);
+            if (sep == null) return Split(self, (char[])null, -1);
+            return RSplit(self, sep, -1);
         }
 
         [PythonName("rsplit")]
         public static List RSplit(string self, string sep, int maxsplit) {
+            if (sep != null) {
+                if (sep.Length == 0) throw Ops.ValueError("empty separator");
+
+                List res = new List();
+                int end = self.Length, index;
+                while (maxsplit != 0 && (index = LastIndexOf(self, sep, 0, end)) != -1) {
+                    res.AddNoLock(self.Substring(index + sep.Length, end - index - sep.Length));
+                    end = index;
+                    maxsplit--;
+                }
+                res.AddNoLock(self.Substring(0, end));
+                res.Reverse();
+                return res;
+            }
 
             //  rsplit works like split but needs to split from the right;
             //  reverse the original string (and the sep), split, reverse 
@@ -897,13 +895,18 @@ namespace IronPython.Runtime.Operations {
         public static List Split(string self, string sep, int maxsplit) {
             if (sep == null) return Split(self, (char[])null, maxsplit);
 
-            if (sep.Length == 0) {
-                throw Ops.ValueError("empty separator");
-            } else if (sep.Length == 1) {
-                return Split(self, new char[] { sep[0] }, maxsplit);
-            } else {
-                return Split(self, new string[] { sep }, maxsplit);
+            if (sep.Length == 0) throw Ops.ValueError("empty separator");
+
+            List ret = new List();
+            int start = 0, index;
+            int[] shifts = null;
+            while (maxsplit != 0 && (index = IndexOf(self, sep, start, self.Length, ref shifts)) != -1) {
+                ret.AddNoLock(self.Substring(start, index - start));
+                start = index + sep.Length;
+                maxsplit--;
             }
+            ret.AddNoLock(self.Substring(start));
+            return ret;
         }
 
         [PythonName("splitlines")]
@@ -1049,7 +1052,7 @@ namespace IronPython.Runtime.Operations {
             if (self.Length == 0) return self;
             StringBuilder ret = new StringBuilder();
             for (int i = 0, idx = 0; i < self.Length; i++) {
-                if (deletechars == null || !deletechars.Contains(Char.ToString(self[i]))) {
+                if (deletechars == null || deletechars.IndexOf(self[i]) == -1) {
                     idx = (int)self[i];
                     if (idx >= 0 && idx < 256) ret.Append(table[idx]);
                 }
@@ -1232,6 +1235,158 @@ namespace IronPython.Runtime.Operations {
 
         #endregion
 
+        #region Ordinal substring search
+
+        // long substrings are looked for in long strings w/ Horspool's shift table, which is
+        // worth building when the search can skip a long way.
+        private const int HorspoolMinLength = 1024;
+        private const int HorspoolMinSubstring = 8;
+
+        /// <summary>
+        /// Returns the index of the first occurrence of sub in s[start, end), or -1.  All of the
+        /// string methods which look for substrings go through here or LastIndexOf, comparing
+        /// characters ordinally.
+        ///
+        /// Single characters are found w/ String.IndexOf(char).  Longer substrings are found
+        /// w/ a Boyer-Moore-Horspool variant like CPython's fastsearch: the last character of
+        /// sub is compared first, and after a mismatch the character just past the window is
+        /// looked up in a bloom filter of the characters in sub.  If it's not in sub the
+        /// search skips past it.  Long substrings in long strings use Horspool's full shift
+        /// table instead.
+        /// </summary>
+        internal static int IndexOf(string s, string sub, int start, int end) {
+            int[] shifts = null;
+            return IndexOf(s, sub, start, end, ref shifts);
+        }
+
+        /// <summary>
+        /// IndexOf for callers which look for the same substring repeatedly: they pass the
+        /// same shifts variable, initially null, so the Horspool table is only built once.
+        /// </summary>
+        private static int IndexOf(string s, string sub, int start, int end, ref int[] shifts) {
+            int m = sub.Length;
+            if (m == 0) return start <= end ? start : -1;
+            if (end - start < m) return -1;
+            if (m == 1) return s.IndexOf(sub[0], start, end - start);
+
+            int mlast = m - 1;
+            char lastChar = sub[mlast];
+            int last = end - m;         // the last index the substring can start at
+
+            if (shifts != null || (m >= HorspoolMinSubstring && end - start >= HorspoolMinLength)) {
+                if (shifts == null) shifts = GetHorspoolShifts(sub);
+
+                for (int i = start; i <= last; ) {
+                    char ch = s[i + mlast];
+                    if (ch == lastChar && MatchesAt(s, i, sub, mlast)) return i;
+                    i += shifts[ch & 0xff];
+                }
+                return -1;
+            }
+
+            // skip is how far the window can move when its last character matches but the
+            // window doesn't, mask holds the characters of sub.
+            int skip = mlast - 1;
+            ulong mask = 0;
+            for (int i = 0; i < mlast; i++) {
+                mask |= 1UL << (sub[i] & 63);
+                if (sub[i] == lastChar) skip = mlast - i - 1;
+            }
+            mask |= 1UL << (lastChar & 63);
+
+            for (int i = start; i <= last; i++) {
+                if (s[i + mlast] == lastChar) {
+                    if (MatchesAt(s, i, sub, mlast)) return i;
+
+                    if (i < last && (mask & (1UL << (s[i + m] & 63))) == 0) {
+                        i += m;
+                    } else {
+                        i += skip;
+                    }
+                } else if (i < last && (mask & (1UL << (s[i + m] & 63))) == 0) {
+                    i += m;
+                }
+            }
+            return -1;
+        }
+
+        /// <summary>
+        /// Returns the index of the last occurrence of sub in s[start, end), or -1.  This is
+        /// IndexOf mirrored, comparing the first character of sub first and looking at the
+        /// character just before the window after a mismatch.
+        /// </summary>
+        internal static int LastIndexOf(string s, string sub, int start, int end) {
+            int m = sub.Length;
+            if (m == 0) return start <= end ? end : -1;
+            if (end - start < m) return -1;
+            if (m == 1) return s.LastIndexOf(sub[0], end - 1, end - start);
+
+            char first = sub[0];
+            int skip = m - 2;
+            ulong mask = 0;
+            for (int i = m - 1; i > 0; i--) {
+                mask |= 1UL << (sub[i] & 63);
+                if (sub[i] == first) skip = i - 1;
+            }
+            mask |= 1UL << (first & 63);
+
+            for (int i = end - m; i >= start; i--) {
+                if (s[i] == first) {
+                    if (MatchesAt(s, i, sub, m)) return i;
+
+                    if (i > start && (mask & (1UL << (s[i - 1] & 63))) == 0) {
+                        i -= m;
+                    } else {
+                        i -= skip;
+                    }
+                } else if (i > start && (mask & (1UL << (s[i - 1] & 63))) == 0) {
+                    i -= m;
+                }
+            }
+            return -1;
+        }
+
+        /// <summary>
+        /// Counts the non-overlapping occurrences of sub in s[start, end).
+        /// </summary>
+        private static int CountOf(string s, string sub, int start, int end) {
+            if (sub.Length == 0) return start <= end ? end - start + 1 : 0;
+
+            int count = 0;
+            int[] shifts = null;
+            while ((start = IndexOf(s, sub, start, end, ref shifts)) != -1) {
+                count++;
+                start += sub.Length;
+            }
+            return count;
+        }
+
+        /// <summary>
+        /// Returns the Horspool shifts for sub, indexed by the low byte of a character: how far
+        /// the window can move when that character is the last one in the window.  Characters
+        /// which share their low byte share the smallest of their shifts.
+        /// </summary>
+        private static int[] GetHorspoolShifts(string sub) {
+            int m = sub.Length;
+            int[] shifts = new int[256];
+            for (int i = 0; i < shifts.Length; i++) shifts[i] = m;
+            for (int i = 0; i < m - 1; i++) shifts[sub[i] & 0xff] = m - 1 - i;
+            return shifts;
+        }
+
+        /// <summary>
+        /// Returns true if s[index, index + sub.Length) equals sub, not comparing the character
+        /// at the offset which has already been checked.
+        /// </summary>
+        private static bool MatchesAt(string s, int index, string sub, int checkedOffset) {
+            for (int j = 0; j < sub.Length; j++) {
+                if (j != checkedOffset && s[index + j] != sub[j]) return false;
+            }
+            return true;
+        }
+
+        #endregion
+
         #region Private implementation details
 
         private static void AppendJoin(object value, int index, StringBuilder sb) {
@@ -1503,18 +1658,6 @@ namespace IronPython.Runtime.Operations {
             }
         }
 
-        private static List Split(string self, string[] seps, int maxsplit) {
-            if (self == String.Empty) {
-                return SplitEmptyString(seps != null);
-            } else {
-                string[] r = maxsplit == -1 ? self.Split(seps, StringSplitOptions.None)
-                                            : self.Split(seps, maxsplit + 1, StringSplitOptions.None);
-                List ret = List.MakeEmptyList(r.Length);
-                foreach (string s in r) ret.AddNoLock(s);
-                return ret;
-            }
-        }
-
         private static void TryStringOrTuple(object prefix) {
             if (Options.Python25 == true) {
                 if (prefix == null) throw Ops.TypeError("expected string or Tuple, got NoneType");
@@ -1536,7 +1679,7 @@ namespace IronPython.Runtime.Operations {
         }
 
         private static object EndsWith(string self, string suffix) {
-            return Ops.Bool2Object(self.EndsWith(suffix));
+            return Ops.Bool2Object(self.EndsWith(suffix, StringComparison.Ordinal));
         }
 
         //  Indexing is 0-based. Need to deal with negative indices
@@ -1555,7 +1698,7 @@ namespace IronPython.Runtime.Operations {
                 start += len;
                 if (start < 0) start = 0;
             }
-            return Ops.Bool2Object(self.Substring(start).EndsWith(suffix));
+            return Ops.Bool2Object(self.Substring(start).EndsWith(suffix, StringComparison.Ordinal));
         }
 
         //  With optional start, test beginning at that position (the char at that index is
@@ -1569,20 +1712,20 @@ namespace IronPython.Runtime.Operations {
                 start += len;
                 if (start < 0) start = 0;
             }
-            if (end >= len) return Ops.Bool2Object(self.Substring(start).EndsWith(suffix));
+            if (end >= len) return Ops.Bool2Object(self.Substring(start).EndsWith(suffix, StringComparison.Ordinal));
             else if (end < 0) {
                 end += len;
                 if (end < 0) return Ops.FALSE;
             }
             if (end < start) return Ops.FALSE;
-            return Ops.Bool2Object(self.Substring(start, end - start).EndsWith(suffix));
+            return Ops.Bool2Object(self.Substring(start, end - start).EndsWith(suffix, StringComparison.Ordinal));
         }
 
 
         private static object EndsWith(string self, Tuple suffix) {
             foreach (object obj in suffix) {
                 if (TryString(obj)) {
-                    if (self.EndsWith(obj as string) == true) {
+                    if (self.EndsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -1600,7 +1743,7 @@ namespace IronPython.Runtime.Operations {
             }
             foreach (object obj in suffix) {
                 if (TryString(obj)) {
-                    if (self.Substring(start).EndsWith(obj as string) == true) {
+                    if (self.Substring(start).EndsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -1625,7 +1768,7 @@ namespace IronPython.Runtime.Operations {
 
             foreach (object obj in suffix) {
                 if (TryString(obj)) {
-                    if (self.Substring(start, end - start).EndsWith(obj as string) == true) {
+                    if (self.Substring(start, end - start).EndsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -1634,7 +1777,7 @@ namespace IronPython.Runtime.Operations {
         }
 
         private static object StartsWith(string self, string prefix) {
-            return Ops.Bool2Object(self.StartsWith(prefix));
+            return Ops.Bool2Object(self.StartsWith(prefix, StringComparison.Ordinal));
         }
 
         private static object StartsWith(string self, string prefix, int start) {
@@ -1644,7 +1787,7 @@ namespace IronPython.Runtime.Operations {
                 start += len;
                 if (start < 0) start = 0;
             }
-            return Ops.Bool2Object(self.Substring(start).StartsWith(prefix));
+            return Ops.Bool2Object(self.Substring(start).StartsWith(prefix, StringComparison.Ordinal));
         }
 
         private static object StartsWith(string self, string prefix, int start, int end) {
@@ -1655,19 +1798,19 @@ namespace IronPython.Runtime.Operations {
                 start += len;
                 if (start < 0) start = 0;
             }
-            if (end >= len) return Ops.Bool2Object(self.Substring(start).StartsWith(prefix));
+            if (end >= len) return Ops.Bool2Object(self.Substring(start).StartsWith(prefix, StringComparison.Ordinal));
             else if (end < 0) {
                 end += len;
                 if (end < 0) return Ops.FALSE;
             }
             if (end < start) return Ops.FALSE;
-            return Ops.Bool2Object(self.Substring(start, end - start).StartsWith(prefix));
+            return Ops.Bool2Object(self.Substring(start, end - start).StartsWith(prefix, StringComparison.Ordinal));
         }
 
         private static object StartsWith(string self, Tuple prefix) {
             foreach (object obj in prefix) {
                 if (TryString(obj)) {
-                    if (self.StartsWith(obj as string) == true) {
+                    if (self.StartsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -1684,7 +1827,7 @@ namespace IronPython.Runtime.Operations {
             }
             foreach (object obj in prefix) {
                 if (TryString(obj)) {
-                    if (self.Substring(start).StartsWith(obj as string) == true) {
+                    if (self.Substring(start).StartsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -1709,7 +1852,7 @@ namespace IronPython.Runtime.Operations {
 
             foreach (object obj in prefix) {
                 if (TryString(obj)) {
-                    if (self.Substring(start, end - start).StartsWith(obj as string) == true) {
+                    if (self.Substring(start, end - start).StartsWith(obj as string, StringComparison.Ordinal) == true) {
                         return Ops.Bool2Object(true);
                     }
                 }
@@ -137,6 +137,18 @@ namespace IronPython.Runtime {
             }
         }
 
+        internal object Object {
+            get {
+                return @object;
+            }
+        }
+
+        internal int Offset {
+            get {
+                return offset;
+            }
+        }
+
         #region ICodeFormattable Members
 
         [PythonName("__repr__")]
@@ -99,44 +99,89 @@ namespace IronPython.Runtime {
     // Read data as binary. We encode binary data in the low order byte of each character of the strings
     // returned so there will be a X2 expansion in space required (but normal string indexing can be used to
     // inspect the data).
+    //
+    // The data is read from the stream a buffer at a time.  Lines are found by scanning the buffer for '\n'
+    // and each run of bytes is converted into characters in one go.  Since the stream is ahead of the
+    // data we've returned we keep track of our own position; the file rewinds the stream past the
+    // unread data before writing (see Unread).
     internal class PythonBinaryReader : PythonStreamReader {
 
-        // Buffer size (in bytes) used when reading until the end of the stream.
-        private const int BufferSize = 4096;
+        // Default buffer size (in bytes).  open() replaces it w/ any bufsize greater than 1, smaller
+        // ones included, as CPython does; a bufsize of 0 or 1 keeps the default.
+        internal const int DefaultBufferSize = 4096;
+
         private byte[] buffer;
+        private char[] chars;           // buffer converted into characters, same size as buffer
+        private int bufPos, bufLen;     // the unread data is buffer[bufPos..bufLen)
+        private long position;
 
         public PythonBinaryReader(Stream stream)
+            : this(stream, DefaultBufferSize) {
+        }
+
+        public PythonBinaryReader(Stream stream, int bufferSize)
             : base(stream, null) {
+            if (stream.CanSeek) position = stream.Position;
+            buffer = new byte[bufferSize];
+            chars = new char[bufferSize];
+        }
+
+        // Changes the size of the buffer, any data already buffered is preserved.
+        internal int BufferSize {
+            get {
+                return buffer.Length;
+            }
+            set {
+                if (value < bufLen - bufPos) value = bufLen - bufPos;
+
+                byte[] newBuffer = new byte[value];
+                Array.Copy(buffer, bufPos, newBuffer, 0, bufLen - bufPos);
+                bufLen -= bufPos;
+                bufPos = 0;
+                buffer = newBuffer;
+                chars = new char[value];
+            }
         }
 
         // Read at most size characters (bytes in this case) and return the result as a string.
         public override String Read(int size) {
-            byte[] data;
-            if (size <= BufferSize) {
-                if (buffer == null)
-                    buffer = new byte[BufferSize];
-                data = buffer;
-            } else
-                data = new byte[size];
-            int count = stream.Read(data, 0, size);
-            return PackDataIntoString(data, count);
+            if (size <= bufLen - bufPos) return Take(size);
+
+            char[] res = new char[size];
+            int count = 0;
+            while (count < size) {
+                if (bufPos == bufLen) {
+                    if (size - count >= buffer.Length) {
+                        // large reads bypass the buffer
+                        count += ReadDirect(res, count, size - count);
+                        break;
+                    }
+                    if (!FillBuffer()) break;
+                }
+
+                int n = Math.Min(size - count, bufLen - bufPos);
+                CopyChars(buffer, bufPos, res, count, n);
+                bufPos += n;
+                count += n;
+            }
+
+            position += count;
+            if (count == 0)
+                return String.Empty;
+            return new String(res, 0, count);
         }
 
         // Read until the end of the stream and return the result as a single string.
         public override String ReadToEnd() {
             StringBuilder sb = new StringBuilder();
-            int totalcount = 0;
-            if (buffer == null)
-                buffer = new byte[BufferSize];
-            while (true) {
-                int count = stream.Read(buffer, 0, BufferSize);
-                if (count == 0)
-                    break;
-                sb.Append(PackDataIntoString(buffer, count));
-                totalcount += count;
-                if (count < BufferSize)
-                    break;
-            }
+            do {
+                int n = bufLen - bufPos;
+                CopyChars(buffer, bufPos, chars, 0, n);
+                sb.Append(chars, 0, n);
+                bufPos = bufLen;
+                position += n;
+            } while (FillBuffer());
+
             if (sb.Length == 0)
                 return String.Empty;
             return sb.ToString();
@@ -145,33 +190,38 @@ namespace IronPython.Runtime {
         // Read characters up to and including a '\n' (or until EOF, in which case the string will not be
         // newline terminated).
         public override String ReadLine() {
-            StringBuilder sb = new StringBuilder(80);
-            while (true) {
-                int b = stream.ReadByte();
-                if (b == -1)
-                    break;
-                sb.Append((char)b);
-                if (b == '\n')
-                    break;
-            }
-            if (sb.Length == 0)
-                return String.Empty;
-            return sb.ToString();
+            return ReadLineWorker(Int32.MaxValue);
         }
 
         // Read characters up to and including a '\n' (or until EOF or the given size, in which case the
         // string will not be newline terminated).
         public override String ReadLine(int size) {
-            StringBuilder sb = new StringBuilder(80);
-            while (size-- > 0) {
-                int b = stream.ReadByte();
-                if (b == -1)
-                    break;
-                sb.Append((char)b);
-                if (b == '\n')
-                    break;
+            return ReadLineWorker(size < 0 ? Int32.MaxValue : size);
+        }
+
+        private String ReadLineWorker(int size) {
+            StringBuilder sb = null;
+            while (size > 0) {
+                if (bufPos == bufLen && !FillBuffer()) break;
+
+                int limit = Math.Min(size, bufLen - bufPos);
+                int newline = Array.IndexOf(buffer, (byte)'\n', bufPos, limit);
+                int n = (newline == -1) ? limit : newline - bufPos + 1;
+
+                // the common case: the whole line is in the buffer
+                if (sb == null && newline != -1) return Take(n);
+
+                if (sb == null) sb = new StringBuilder(n + 80);
+                CopyChars(buffer, bufPos, chars, 0, n);
+                sb.Append(chars, 0, n);
+                bufPos += n;
+                position += n;
+                size -= n;
+
+                if (newline != -1) break;
             }
-            if (sb.Length == 0)
+
+            if (sb == null || sb.Length == 0)
                 return String.Empty;
             return sb.ToString();
         }
@@ -179,23 +229,68 @@ namespace IronPython.Runtime {
         // Discard any data we may have buffered based on the current stream position. Called after seeking in
         // the stream.
         public override void DiscardBufferedData() {
-            // No buffering is performed.
+            bufPos = bufLen = 0;
+        }
+
+        // Moves the stream back to the first unread byte and discards the buffer so that the stream is
+        // positioned where the file is expected to be (before writing).  Streams which can't seek (such as
+        // pipes and sockets) have independent input and output so the buffered data is kept.
+        internal void Unread() {
+            if (bufPos != bufLen && stream.CanSeek) {
+                stream.Seek(bufPos - bufLen, SeekOrigin.Current);
+                DiscardBufferedData();
+            }
         }
 
         public override long Position {
             get {
-                return stream.Position;
+                return position;
             }
             internal set {
+                position = value;
             }
         }
 
+        // Returns the next count buffered bytes as a string.
+        private String Take(int count) {
+            if (count == 0)
+                return String.Empty;
+
+            CopyChars(buffer, bufPos, chars, 0, count);
+            bufPos += count;
+            position += count;
+            return new String(chars, 0, count);
+        }
+
+        private bool FillBuffer() {
+            bufPos = 0;
+            bufLen = stream.Read(buffer, 0, buffer.Length);
+            return bufLen > 0;
+        }
+
+        // Reads up to count bytes straight from the stream into res, returns the number read.
+        private int ReadDirect(char[] res, int index, int count) {
+            byte[] data = new byte[count];
+            int total = 0;
+            while (total < count) {
+                int n = stream.Read(data, total, count - total);
+                if (n == 0) break;
+                total += n;
+            }
+            CopyChars(data, 0, res, index, total);
+            return total;
+        }
+
+        private static void CopyChars(byte[] data, int index, char[] res, int resIndex, int count) {
+            for (int i = 0; i < count; i++)
+                res[resIndex + i] = (char)data[index + i];
+        }
+
         // Convert a byte array into a string by casting each byte into a character.
         internal static String PackDataIntoString(byte[] data, int count) {
-            StringBuilder sb = new StringBuilder(count);
-            for (int i = 0; i < count; i++)
-                sb.Append((char)data[i]);
-            return sb.ToString();
+            char[] res = new char[count];
+            CopyChars(data, 0, res, 0, count);
+            return new String(res);
         }
 
     }
@@ -665,8 +760,10 @@ namespace IronPython.Runtime {
         // Write the data in the input string to the output stream. No newline conversion is performed.
         public override int Write(String data) {
             int count = data.Length;
+            byte[] bytes = new byte[count];
             for (int i = 0; i < count; i++)
-                stream.WriteByte((byte)data[i]);
+                bytes[i] = (byte)data[i];
+            stream.Write(bytes, 0, count);
             return count;
         }
 
@@ -781,7 +878,7 @@ namespace IronPython.Runtime {
     }
 
     [PythonType("file")]
-    public class PythonFile : IDynamicObject, IDisposable {
+    public class PythonFile : IDynamicObject, IDisposable, System.Collections.IEnumerator {
         // Enumeration of each stream mode.
         private enum PythonFileMode {
             Binary,
@@ -867,9 +964,15 @@ namespace IronPython.Runtime {
 
                 if (seekEnd) stream.Seek(0, SeekOrigin.End);
 
-                if (cls == TypeCache.PythonFile) return new PythonFile(stream, context.SystemState.DefaultEncoding, name, inMode);
+                PythonFile res;
+                if (cls == TypeCache.PythonFile) {
+                    res = new PythonFile(stream, context.SystemState.DefaultEncoding, name, inMode);
+                } else {
+                    res = cls.ctor.Call(cls, stream, context.SystemState.DefaultEncoding, name, inMode) as PythonFile;
+                }
 
-                return cls.ctor.Call(cls, stream, context.SystemState.DefaultEncoding, name, inMode) as PythonFile;
+                if (res != null && bufsize > 1) res.SetReadBufferSize(bufsize);
+                return res;
             } catch (UnauthorizedAccessException e) {
                 throw new IOException(e.Message, e);
             }
@@ -902,6 +1005,8 @@ namespace IronPython.Runtime {
         private readonly PythonStreamWriter writer;
         private bool isclosed = false;
         private Nullable<long> reseekPosition;
+        private bool flushOnWrite = true;
+        private string current;     // the last line returned by the IEnumerator interface
 
         public bool softspace = false;
 
@@ -991,6 +1096,24 @@ namespace IronPython.Runtime {
             PythonFileManager.Remove(this);
         }
 
+        // Changes the size of the read buffer of a binary mode file, text mode files are unaffected.
+        internal void SetReadBufferSize(int size) {
+            PythonBinaryReader binaryReader = reader as PythonBinaryReader;
+            if (binaryReader != null) binaryReader.BufferSize = size;
+        }
+
+        // Files are normally flushed after every write.  Files over a stream which does its own write
+        // buffering (such as those returned by socket.makefile) leave it to the stream to decide when
+        // to send the data, and only flush when flush() or close() is called.
+        internal bool FlushOnWrite {
+            get {
+                return flushOnWrite;
+            }
+            set {
+                flushOnWrite = value;
+            }
+        }
+
         [PythonName("close")]
         public virtual object Close() {
             Dispose(true);
@@ -1121,7 +1244,13 @@ namespace IronPython.Runtime {
                     origin = SeekOrigin.Begin;
                     break;
                 case 1:
-                    origin = SeekOrigin.Current;
+                    // the reader may have read ahead of the current position
+                    if (reader != null) {
+                        offset += reader.Position;
+                        origin = SeekOrigin.Begin;
+                    } else {
+                        origin = SeekOrigin.Current;
+                    }
                     break;
                 case 2:
                     origin = SeekOrigin.End;
@@ -1147,12 +1276,15 @@ namespace IronPython.Runtime {
             ThrowIfClosed();
 
             if (writer != null) {
+                PythonBinaryReader binaryReader = reader as PythonBinaryReader;
+                if (binaryReader != null) binaryReader.Unread();
+
                 ResetForWrite();
 
                 int bytesWritten = writer.Write(s);
                 if (reader != null)
                     reader.Position += bytesWritten;
-                Flush();
+                if (flushOnWrite) Flush();
             } else {
                 throw Ops.IOError("Can not write to " + this.name);
             }
@@ -1231,6 +1363,28 @@ namespace IronPython.Runtime {
             return this;
         }
 
+        #region IEnumerator Members
+
+        // "for line in f" iterates through these rather than calling next, so the end of the file
+        // doesn't need to raise StopIteration.
+
+        object System.Collections.IEnumerator.Current {
+            get {
+                return current;
+            }
+        }
+
+        bool System.Collections.IEnumerator.MoveNext() {
+            current = ReadLine();
+            return current != "";
+        }
+
+        void System.Collections.IEnumerator.Reset() {
+            throw new NotImplementedException();
+        }
+
+        #endregion
+
         [PythonName("__str__")]
         public override string ToString() {
             return string.Format("<{0} file '{1}', mode '{2}' at 0x{3:X8}>",
@@ -95,11 +95,19 @@ namespace IronPython.Runtime {
         #endregion
     }
 
+    /// <summary>
+    /// Maps strings to SymbolIds and back.  Looking up an existing symbol doesn't take a lock:
+    /// idToFieldTable is a Hashtable, which supports any number of readers concurrently with a
+    /// single writer, and ids is an array which is only ever replaced by a larger copy.  Adding
+    /// a symbol is serialized on lockObj and stores the string into ids before publishing its id
+    /// in idToFieldTable, so any id a reader can obtain is present in the array it sees.
+    /// </summary>
     public static partial class SymbolTable {
         static object lockObj = new object();
 
-        static Dictionary<string, int> idToFieldTable = new Dictionary<string, int>();
-        static List<string> ids;
+        static Hashtable idToFieldTable = new Hashtable();     // string -> boxed int
+        static volatile string[] ids;
+        static int idCount;
 
         public const int EmptyId = 0;
         /// <summary>SymbolId for null string</summary>
@@ -112,10 +120,10 @@ namespace IronPython.Runtime {
         public static readonly SymbolId ObjectKeys = new SymbolId(ObjectKeysId);
 
         static SymbolTable() {
-            ids = new List<string>(LastWellKnownId);
-            ids.Add(null);          // initialize the null string
+            ids = new string[LastWellKnownId * 2];
+            idCount = 1;            // initialize the null string
             Initialize();           // add the rest of them
-            Debug.Assert(ids.Count == LastWellKnownId, "Possible duplicate in the symbol table initialization");
+            Debug.Assert(idCount == LastWellKnownId, "Possible duplicate in the symbol table initialization");
         }
 
         public static SymbolId StringToId(string field) {
@@ -124,22 +132,42 @@ namespace IronPython.Runtime {
 
             PerfTrack.NoteEvent(PerfTrack.Categories.DictInvoke, "FieldTable " + field.ToString());
 
-            int res;
-            lock (lockObj) {
-                if (!idToFieldTable.TryGetValue(field, out res)) {
-                    // register new id...
-                    res = ids.Count;
-                    // Console.WriteLine("Registering {0} as {1}", field, res);
-                    ids.Add(field);
-                    idToFieldTable[field] = res;
+            object res = idToFieldTable[field];
+            if (res == null) {
+                lock (lockObj) {
+                    res = idToFieldTable[field];
+                    if (res == null) {
+                        res = AddSymbol(field);
+                    }
                 }
             }
-            return new SymbolId(res);
+            return new SymbolId((int)res);
+        }
+
+        /// <summary>
+        /// Registers a new symbol.  Must be called w/ lockObj held.
+        /// </summary>
+        private static object AddSymbol(string field) {
+            int id = idCount;
+            string[] cur = ids;
+            if (id == cur.Length) {
+                string[] newIds = new string[cur.Length * 2];
+                Array.Copy(cur, newIds, cur.Length);
+                cur = newIds;
+            }
+            cur[id] = field;
+            ids = cur;
+            idCount = id + 1;
+
+            object res = id;
+            idToFieldTable[field] = res;
+            return res;
         }
 
         public static string IdToString(SymbolId id) {
-            PerfTrack.NoteEvent(PerfTrack.Categories.DictInvoke, "BackwardsFieldTableLookup " + ids[id.Id] == null ? "(null)" : ids[id.Id]);
-            return ids[id.Id];
+            string[] cur = ids;
+            PerfTrack.NoteEvent(PerfTrack.Categories.DictInvoke, "BackwardsFieldTableLookup " + cur[id.Id] == null ? "(null)" : cur[id.Id]);
+            return cur[id.Id];
         }
 
         public static string[] IdsToStrings(IList<SymbolId> ids) {
@@ -0,0 +1,516 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+
+namespace IronPython.Runtime {
+    /// <summary>
+    /// A stable, adaptive merge sort - the same algorithm as CPython's list.sort (see
+    /// Objects/listsort.txt in the CPython sources).
+    ///
+    /// The array is split into runs which are already in order (strictly descending runs are
+    /// reversed in place), short runs are extended to a minimum length w/ binary insertion sort,
+    /// and the runs are merged while keeping the lengths of the pending runs balanced.  When one
+    /// run keeps supplying the next element the merge switches to galloping (an exponential
+    /// search) so that long stretches are found w/ a logarithmic number of comparisons.  Sorted,
+    /// reversed and partially ordered data need far fewer than n log n comparisons.
+    ///
+    /// TComparer is a struct so that calls to the comparer are bound directly.  If the comparer
+    /// throws, the array still holds all of the elements it started with, in some order.
+    /// </summary>
+    internal sealed class TimSort<T, TComparer> where TComparer : struct, IComparer<T> {
+        private const int MinMerge = 64;            // shorter arrays are just binary insertion sorted
+        private const int InitialMinGallop = 7;
+        private const int InitialTempLength = 256;
+        private const int MaxPendingRuns = 85;      // enough for 2**64 elements, see listsort.txt
+
+        private readonly T[] a;
+        private readonly int length;
+        private TComparer comparer;                 // not readonly, calls would be made on a copy
+        private int minGallop = InitialMinGallop;
+        private T[] tmp;
+
+        // the stack of runs which haven't been merged yet
+        private readonly int[] runBase = new int[MaxPendingRuns];
+        private readonly int[] runLength = new int[MaxPendingRuns];
+        private int runCount;
+
+        private TimSort(T[] a, int length, TComparer comparer) {
+            this.a = a;
+            this.length = length;
+            this.comparer = comparer;
+        }
+
+        /// <summary>
+        /// Sorts the count elements of a starting at index.
+        /// </summary>
+        public static void Sort(T[] a, int index, int count, TComparer comparer) {
+            if (count < 2) return;
+
+            TimSort<T, TComparer> ts = new TimSort<T, TComparer>(a, count, comparer);
+            int lo = index, hi = index + count;
+
+            if (count < MinMerge) {
+                ts.BinarySort(lo, hi, lo + ts.CountRunAndMakeAscending(lo, hi));
+                return;
+            }
+
+            int minRun = GetMinRunLength(count);
+            int remaining = count;
+            do {
+                int run = ts.CountRunAndMakeAscending(lo, hi);
+                if (run < minRun) {
+                    int force = Math.Min(remaining, minRun);
+                    ts.BinarySort(lo, lo + force, lo + run);
+                    run = force;
+                }
+
+                ts.PushRun(lo, run);
+                ts.MergeCollapse();
+
+                lo += run;
+                remaining -= run;
+            } while (remaining != 0);
+
+            ts.MergeForceCollapse();
+            Debug.Assert(ts.runCount == 1 && ts.runLength[0] == count);
+        }
+
+        #region Runs
+
+        /// <summary>
+        /// Returns the length of the run starting at lo.  A descending run is reversed so that
+        /// the run is always ascending.  Descending runs must be strictly descending so that
+        /// reversing them doesn't change the order of equal elements.
+        /// </summary>
+        private int CountRunAndMakeAscending(int lo, int hi) {
+            int runHi = lo + 1;
+            if (runHi == hi) return 1;
+
+            if (comparer.Compare(a[runHi++], a[lo]) < 0) {
+                while (runHi < hi && comparer.Compare(a[runHi], a[runHi - 1]) < 0) runHi++;
+                Array.Reverse(a, lo, runHi - lo);
+            } else {
+                while (runHi < hi && comparer.Compare(a[runHi], a[runHi - 1]) >= 0) runHi++;
+            }
+
+            return runHi - lo;
+        }
+
+        /// <summary>
+        /// Sorts a[lo..hi) w/ binary insertion sort, a[lo..start) is already sorted.
+        /// </summary>
+        private void BinarySort(int lo, int hi, int start) {
+            if (start == lo) start++;
+
+            for (; start < hi; start++) {
+                T pivot = a[start];
+
+                // find the position after any elements equal to the pivot to keep the sort stable
+                int left = lo, right = start;
+                while (left < right) {
+                    int mid = (left + right) >> 1;
+                    if (comparer.Compare(pivot, a[mid]) < 0) right = mid;
+                    else left = mid + 1;
+                }
+
+                Array.Copy(a, left, a, left + 1, start - left);
+                a[left] = pivot;
+            }
+        }
+
+        /// <summary>
+        /// Returns the minimum run length for an array of n elements: a value between
+        /// MinMerge / 2 and MinMerge such that n / minrun is a power of 2, or a little less
+        /// than one, which keeps the final merges balanced.
+        /// </summary>
+        private static int GetMinRunLength(int n) {
+            int r = 0;
+            while (n >= MinMerge) {
+                r |= n & 1;
+                n >>= 1;
+            }
+            return n + r;
+        }
+
+        private void PushRun(int start, int count) {
+            runBase[runCount] = start;
+            runLength[runCount] = count;
+            runCount++;
+        }
+
+        /// <summary>
+        /// Merges pending runs until the invariants hold for every run on the stack:
+        ///     runLength[i - 2] > runLength[i - 1] + runLength[i]
+        ///     runLength[i - 1] > runLength[i]
+        /// so that the lengths of the runs grow at least as fast as the Fibonacci numbers.
+        /// </summary>
+        private void MergeCollapse() {
+            while (runCount > 1) {
+                int n = runCount - 2;
+                if ((n > 0 && runLength[n - 1] <= runLength[n] + runLength[n + 1]) ||
+                    (n > 1 && runLength[n - 2] <= runLength[n - 1] + runLength[n])) {
+                    if (runLength[n - 1] < runLength[n + 1]) n--;
+                } else if (runLength[n] > runLength[n + 1]) {
+                    break;
+                }
+                MergeAt(n);
+            }
+        }
+
+        private void MergeForceCollapse() {
+            while (runCount > 1) {
+                int n = runCount - 2;
+                if (n > 0 && runLength[n - 1] < runLength[n + 1]) n--;
+                MergeAt(n);
+            }
+        }
+
+        /// <summary>
+        /// Merges the runs at i and i + 1 on the stack, i must be the second or third from the top.
+        /// </summary>
+        private void MergeAt(int i) {
+            int base1 = runBase[i], len1 = runLength[i];
+            int base2 = runBase[i + 1], len2 = runLength[i + 1];
+            Debug.Assert(base1 + len1 == base2);
+
+            runLength[i] = len1 + len2;
+            if (i == runCount - 3) {
+                runBase[i + 1] = runBase[i + 2];
+                runLength[i + 1] = runLength[i + 2];
+            }
+            runCount--;
+
+            // elements of run 1 which are <= the first element of run 2 are already in place...
+            int k = GallopRight(a[base2], a, base1, len1, 0);
+            base1 += k;
+            len1 -= k;
+            if (len1 == 0) return;
+
+            // ... as are the elements of run 2 which are >= the last element of run 1
+            len2 = GallopLeft(a[base1 + len1 - 1], a, base2, len2, len2 - 1);
+            if (len2 == 0) return;
+
+            if (len1 <= len2) {
+                MergeLo(base1, len1, base2, len2);
+            } else {
+                MergeHi(base1, len1, base2, len2);
+            }
+        }
+
+        #endregion
+
+        #region Galloping
+
+        /// <summary>
+        /// Returns the position in the sorted range src[start..start+count) at which key should be
+        /// inserted, before any elements equal to it.  The search starts at start + hint.
+        /// </summary>
+        private int GallopLeft(T key, T[] src, int start, int count, int hint) {
+            int lastOfs = 0, ofs = 1;
+            if (comparer.Compare(key, src[start + hint]) > 0) {
+                // gallop right until src[start + hint + lastOfs] < key <= src[start + hint + ofs]
+                int maxOfs = count - hint;
+                while (ofs < maxOfs && comparer.Compare(key, src[start + hint + ofs]) > 0) {
+                    lastOfs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) ofs = maxOfs;     // overflow
+                }
+                if (ofs > maxOfs) ofs = maxOfs;
+
+                lastOfs += hint;
+                ofs += hint;
+            } else {
+                // gallop left until src[start + hint - ofs] < key <= src[start + hint - lastOfs]
+                int maxOfs = hint + 1;
+                while (ofs < maxOfs && comparer.Compare(key, src[start + hint - ofs]) <= 0) {
+                    lastOfs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) ofs = maxOfs;
+                }
+                if (ofs > maxOfs) ofs = maxOfs;
+
+                int t = lastOfs;
+                lastOfs = hint - ofs;
+                ofs = hint - t;
+            }
+
+            // src[start + lastOfs] < key <= src[start + ofs], binary search the rest
+            lastOfs++;
+            while (lastOfs < ofs) {
+                int m = lastOfs + ((ofs - lastOfs) >> 1);
+                if (comparer.Compare(key, src[start + m]) > 0) lastOfs = m + 1;
+                else ofs = m;
+            }
+            return ofs;
+        }
+
+        /// <summary>
+        /// Like GallopLeft, but returns the position after any elements equal to key.
+        /// </summary>
+        private int GallopRight(T key, T[] src, int start, int count, int hint) {
+            int lastOfs = 0, ofs = 1;
+            if (comparer.Compare(key, src[start + hint]) < 0) {
+                // gallop left until src[start + hint - ofs] <= key < src[start + hint - lastOfs]
+                int maxOfs = hint + 1;
+                while (ofs < maxOfs && comparer.Compare(key, src[start + hint - ofs]) < 0) {
+                    lastOfs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) ofs = maxOfs;
+                }
+                if (ofs > maxOfs) ofs = maxOfs;
+
+                int t = lastOfs;
+                lastOfs = hint - ofs;
+                ofs = hint - t;
+            } else {
+                // gallop right until src[start + hint + lastOfs] <= key < src[start + hint + ofs]
+                int maxOfs = count - hint;
+                while (ofs < maxOfs && comparer.Compare(key, src[start + hint + ofs]) >= 0) {
+                    lastOfs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) ofs = maxOfs;
+                }
+                if (ofs > maxOfs) ofs = maxOfs;
+
+                lastOfs += hint;
+                ofs += hint;
+            }
+
+            // src[start + lastOfs] <= key < src[start + ofs], binary search the rest
+            lastOfs++;
+            while (lastOfs < ofs) {
+                int m = lastOfs + ((ofs - lastOfs) >> 1);
+                if (comparer.Compare(key, src[start + m]) < 0) ofs = m;
+                else lastOfs = m + 1;
+            }
+            return ofs;
+        }
+
+        #endregion
+
+        #region Merging
+
+        /// <summary>
+        /// Merges the adjacent runs a[base1..base1+len1) and a[base2..base2+len2) in place,
+        /// used when the first run is the shorter one which is copied out to the temp array.
+        /// The first element of run 2 must belong before the first element of run 1 and the last
+        /// element of run 1 after the last element of run 2.
+        /// </summary>
+        private void MergeLo(int base1, int len1, int base2, int len2) {
+            T[] tmp = EnsureCapacity(len1);
+            Array.Copy(a, base1, tmp, 0, len1);
+
+            int cursor1 = 0;        // next element of run 1 (in tmp)
+            int cursor2 = base2;    // next element of run 2 (in a)
+            int dest = base1;       // a[dest..cursor2) is free and always len1 long
+
+            a[dest++] = a[cursor2++];
+            if (--len2 == 0) {
+                Array.Copy(tmp, cursor1, a, dest, len1);
+                return;
+            }
+            if (len1 == 1) {
+                Array.Copy(a, cursor2, a, dest, len2);
+                a[dest + len2] = tmp[cursor1];
+                return;
+            }
+
+            int minGallop = this.minGallop;
+            try {
+                for (; ; ) {
+                    int count1 = 0, count2 = 0;     // number of times in a row each run won
+
+                    // one pair at a time until one run starts winning consistently
+                    do {
+                        if (comparer.Compare(a[cursor2], tmp[cursor1]) < 0) {
+                            a[dest++] = a[cursor2++];
+                            count2++;
+                            count1 = 0;
+                            if (--len2 == 0) goto done;
+                        } else {
+                            a[dest++] = tmp[cursor1++];
+                            count1++;
+                            count2 = 0;
+                            if (--len1 == 1) goto done;
+                        }
+                    } while ((count1 | count2) < minGallop);
+
+                    // gallop until neither run is winning consistently
+                    do {
+                        count1 = GallopRight(a[cursor2], tmp, cursor1, len1, 0);
+                        if (count1 != 0) {
+                            Array.Copy(tmp, cursor1, a, dest, count1);
+                            dest += count1;
+                            cursor1 += count1;
+                            len1 -= count1;
+                            if (len1 <= 1) goto done;
+                        }
+                        a[dest++] = a[cursor2++];
+                        if (--len2 == 0) goto done;
+
+                        count2 = GallopLeft(tmp[cursor1], a, cursor2, len2, 0);
+                        if (count2 != 0) {
+                            Array.Copy(a, cursor2, a, dest, count2);
+                            dest += count2;
+                            cursor2 += count2;
+                            len2 -= count2;
+                            if (len2 == 0) goto done;
+                        }
+                        a[dest++] = tmp[cursor1++];
+                        if (--len1 == 1) goto done;
+
+                        minGallop--;
+                    } while (count1 >= InitialMinGallop || count2 >= InitialMinGallop);
+
+                    // penalize leaving galloping mode
+                    if (minGallop < 0) minGallop = 0;
+                    minGallop += 2;
+                }
+            done:
+                ;
+            } catch {
+                // the comparer failed, put the rest of run 1 back in the free space
+                Array.Copy(tmp, cursor1, a, dest, len1);
+                throw;
+            } finally {
+                this.minGallop = minGallop < 1 ? 1 : minGallop;
+            }
+
+            if (len1 == 1) {
+                // the last element of run 1 belongs after the rest of run 2
+                Array.Copy(a, cursor2, a, dest, len2);
+                a[dest + len2] = tmp[cursor1];
+            } else {
+                // len1 can only be 0 if the comparer is inconsistent
+                Array.Copy(tmp, cursor1, a, dest, len1);
+            }
+        }
+
+        /// <summary>
+        /// Like MergeLo but the second run is the shorter one which is copied to the temp array
+        /// and the merge works from the end of the runs.
+        /// </summary>
+        private void MergeHi(int base1, int len1, int base2, int len2) {
+            T[] tmp = EnsureCapacity(len2);
+            Array.Copy(a, base2, tmp, 0, len2);
+
+            int cursor1 = base1 + len1 - 1;     // next element of run 1 (in a)
+            int cursor2 = len2 - 1;             // next element of run 2 (in tmp)
+            int dest = base2 + len2 - 1;        // a(cursor1..dest] is free and always len2 long
+
+            a[dest--] = a[cursor1--];
+            if (--len1 == 0) {
+                Array.Copy(tmp, 0, a, dest - (len2 - 1), len2);
+                return;
+            }
+            if (len2 == 1) {
+                dest -= len1;
+                cursor1 -= len1;
+                Array.Copy(a, cursor1 + 1, a, dest + 1, len1);
+                a[dest] = tmp[cursor2];
+                return;
+            }
+
+            int minGallop = this.minGallop;
+            try {
+                for (; ; ) {
+                    int count1 = 0, count2 = 0;
+
+                    do {
+                        if (comparer.Compare(tmp[cursor2], a[cursor1]) < 0) {
+                            a[dest--] = a[cursor1--];
+                            count1++;
+                            count2 = 0;
+                            if (--len1 == 0) goto done;
+                        } else {
+                            a[dest--] = tmp[cursor2--];
+                            count2++;
+                            count1 = 0;
+                            if (--len2 == 1) goto done;
+                        }
+                    } while ((count1 | count2) < minGallop);
+
+                    do {
+                        count1 = len1 - GallopRight(tmp[cursor2], a, base1, len1, len1 - 1);
+                        if (count1 != 0) {
+                            dest -= count1;
+                            cursor1 -= count1;
+                            len1 -= count1;
+                            Array.Copy(a, cursor1 + 1, a, dest + 1, count1);
+                            if (len1 == 0) goto done;
+                        }
+                        a[dest--] = tmp[cursor2--];
+                        if (--len2 == 1) goto done;
+
+                        count2 = len2 - GallopLeft(a[cursor1], tmp, 0, len2, len2 - 1);
+                        if (count2 != 0) {
+                            dest -= count2;
+                            cursor2 -= count2;
+                            len2 -= count2;
+                            Array.Copy(tmp, cursor2 + 1, a, dest + 1, count2);
+                            if (len2 <= 1) goto done;
+                        }
+                        a[dest--] = a[cursor1--];
+                        if (--len1 == 0) goto done;
+
+                        minGallop--;
+                    } while (count1 >= InitialMinGallop || count2 >= InitialMinGallop);
+
+                    if (minGallop < 0) minGallop = 0;
+                    minGallop += 2;
+                }
+            done:
+                ;
+            } catch {
+                // the comparer failed, put the rest of run 2 back in the free space
+                Array.Copy(tmp, 0, a, dest - (len2 - 1), len2);
+                throw;
+            } finally {
+                this.minGallop = minGallop < 1 ? 1 : minGallop;
+            }
+
+            if (len2 == 1) {
+                // the first element of run 2 belongs before the rest of run 1
+                dest -= len1;
+                cursor1 -= len1;
+                Array.Copy(a, cursor1 + 1, a, dest + 1, len1);
+                a[dest] = tmp[cursor2];
+            } else {
+                // len2 can only be 0 if the comparer is inconsistent
+                Array.Copy(tmp, 0, a, dest - (len2 - 1), len2);
+            }
+        }
+
+        /// <summary>
+        /// Returns a temp array which can hold at least minCapacity elements.  The array is grown
+        /// in powers of 2 up to half the length of the sorted range, which is the most a merge
+        /// ever needs.
+        /// </summary>
+        private T[] EnsureCapacity(int minCapacity) {
+            if (tmp == null || tmp.Length < minCapacity) {
+                int size = tmp == null ? InitialTempLength : tmp.Length;
+                while (size < minCapacity) size <<= 1;
+                if (size > length / 2) size = Math.Max(minCapacity, length / 2);
+                tmp = new T[size];
+            }
+            return tmp;
+        }
+
+        #endregion
+    }
+}
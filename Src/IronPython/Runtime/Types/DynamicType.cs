@@ -17,6 +17,7 @@ using System;
 using System.Reflection;
 using System.Diagnostics;
 using System.Collections.Generic;
+using System.Threading;
 
 using IronPython.Runtime.Operations;
 using IronPython.Runtime.Calls;
@@ -42,6 +43,11 @@ namespace IronPython.Runtime.Types {
 
         public IAttributesDictionary dict;
         private Tuple methodResolutionOrder;
+        private bool hasOldClassInMro;
+
+        // Bumped whenever our dictionary or bases (or those of any of our base types) change
+        // so that cached lookups against the type can be validated cheaply.
+        private int version;
 
         // Cached attribute fields
         public MethodWrapper __getitem__F;
@@ -154,7 +160,7 @@ namespace IronPython.Runtime.Types {
         }
 
         public virtual void Initialize() {
-            if (methodResolutionOrder == null) methodResolutionOrder = CalculateMro(BaseClasses);
+            if (methodResolutionOrder == null) MethodResolutionOrder = CalculateMro(BaseClasses);
         }
 
         protected void AddProtocolWrappers() {
@@ -362,6 +368,35 @@ namespace IronPython.Runtime.Types {
             }
         }
 
+        /// <summary>
+        /// The current version of the type.  Any lookup result cached against a type is only
+        /// valid for as long as the version it was computed under is still current.
+        /// </summary>
+        internal int Version {
+            get { return Thread.VolatileRead(ref version); }
+        }
+
+        /// <summary>
+        /// Invalidates all lookups cached against this type and its subtypes.  Must be called
+        /// after the type's dictionary or bases have been updated.
+        /// </summary>
+        internal void UpdateVersion() {
+            Interlocked.Increment(ref version);
+
+            foreach (object subclass in LookupSubclasses()) {
+                ((DynamicType)subclass).UpdateVersion();
+            }
+        }
+
+        /// <summary>
+        /// True if the result of looking up an attribute on an instance of this type depends only
+        /// on the type's MRO (and for user types the instance's dictionary) so that the slot may be
+        /// cached by a GetAttrSite until the type's version changes.
+        /// </summary>
+        internal virtual bool IsAttributeLookupCacheable {
+            get { return false; }
+        }
+
         /// <summary>
         /// This is called when __bases__ changes. We need to initialize all the state of the type and its subtypes
         /// </summary>
@@ -383,7 +418,26 @@ namespace IronPython.Runtime.Types {
             return false;
         }
 
-        protected bool TryLookupSlot(ICallerContext context, SymbolId name, out object ret) {
+        protected internal bool TryLookupSlot(ICallerContext context, SymbolId name, out object ret) {
+            Initialize();
+
+            if (hasOldClassInMro) {
+                // old-style classes don't track their subclasses so we can't
+                // cache anything which might come from their dictionaries.
+                return TryLookupSlotUncached(context, name, out ret);
+            }
+
+            int curVersion = Version;
+            CallerContextAttributes flags = context == null ? CallerContextAttributes.None : context.ContextFlags;
+            bool found;
+            if (MethodCache.TryGetValue(this, curVersion, name, flags, out found, out ret)) return found;
+
+            found = TryLookupSlotUncached(context, name, out ret);
+            MethodCache.Add(this, curVersion, name, flags, found, ret);
+            return found;
+        }
+
+        private bool TryLookupSlotUncached(ICallerContext context, SymbolId name, out object ret) {
             if (TryGetSlot(context, name, out ret)) return true;
             return TryLookupSlotInBases(context, name, out ret);
         }
@@ -436,9 +490,7 @@ namespace IronPython.Runtime.Types {
                     }
                     break;
                 case SymbolTable.MethodResolutionOrderId:
-                    if (methodResolutionOrder == null)
-                        methodResolutionOrder = CalculateMro(BaseClasses);
-                    ret = methodResolutionOrder;
+                    ret = MethodResolutionOrder;
                     return true;
             }
 
@@ -455,13 +507,29 @@ namespace IronPython.Runtime.Types {
 
         internal Tuple MethodResolutionOrder {
             get {
-                if (methodResolutionOrder == null) methodResolutionOrder = CalculateMro(BaseClasses);
+                if (methodResolutionOrder == null) MethodResolutionOrder = CalculateMro(BaseClasses);
                 return methodResolutionOrder;
             }
             set {
+                bool hasOldClass = false;
+                foreach (object type in value) {
+                    if (type is OldClass) hasOldClass = true;
+                }
+                hasOldClassInMro = hasOldClass;
                 methodResolutionOrder = value;
             }
         }
+
+        /// <summary>
+        /// True if an old-style class appears anywhere in our MRO.
+        /// </summary>
+        internal bool HasOldClassInMro {
+            get {
+                if (methodResolutionOrder == null) MethodResolutionOrder = CalculateMro(BaseClasses);
+                return hasOldClassInMro;
+            }
+        }
+
         protected virtual void RawSetSlot(SymbolId name, object value) {
             if (name == SymbolTable.Name) {
                 __name__ = value;
@@ -637,21 +705,27 @@ namespace IronPython.Runtime.Types {
 
             object slot;
             if (TryGetSlot(context, name, out slot)) {
-                if (Ops.SetDescriptor(slot, null, value)) return;
+                if (Ops.SetDescriptor(slot, null, value)) {
+                    UpdateVersion();
+                    return;
+                }
             }
 
             RawSetSlot(name, value);
+            UpdateVersion();
         }
 
         public void DeleteAttr(ICallerContext context, SymbolId name) {
             object slot;
             if (TryGetSlot(context, name, out slot)) {
                 if (Ops.DelDescriptor(slot, null)) {
+                    UpdateVersion();
                     return;
                 }
             }
 
             RawDeleteSlot(name);
+            UpdateVersion();
         }
 
         public virtual List GetAttrNames(ICallerContext context) {
@@ -0,0 +1,118 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+using System.Runtime.CompilerServices;
+
+using IronPython.Runtime.Calls;
+
+namespace IronPython.Runtime.Types {
+    /// <summary>
+    /// A process-wide cache of the results of DynamicType.TryLookupSlot.
+    ///
+    /// The cache is a direct-mapped table indexed by a hash of (type, version, name).  Entries
+    /// record the version of the type they were computed under, so any update to the type or one
+    /// of its bases (which bumps the version of the type and its subtypes) implicitly invalidates
+    /// them.  Lookups whose result depends on the caller's context (members only visible after
+    /// "import clr") also record the context flags.
+    ///
+    /// The hit and miss counters are not updated atomically so that the lookup path doesn't
+    /// contend across threads; they are accurate enough for tuning.
+    /// </summary>
+    public static class MethodCache {
+        private const int CacheSize = 4096;     // must be a power of 2
+        private static Entry[] entries = new Entry[CacheSize];
+        private static long hits, misses;
+
+        #region Public API Surface
+
+        /// <summary>
+        /// The number of lookups which were satisfied from the cache.
+        /// </summary>
+        public static long Hits {
+            get { return hits; }
+        }
+
+        /// <summary>
+        /// The number of lookups which required walking the MRO.
+        /// </summary>
+        public static long Misses {
+            get { return misses; }
+        }
+
+        public static int Size {
+            get { return CacheSize; }
+        }
+
+        /// <summary>
+        /// Removes all entries from the cache and resets the hit and miss counts.
+        /// </summary>
+        public static void Clear() {
+            entries = new Entry[CacheSize];
+            hits = misses = 0;
+        }
+
+        #endregion
+
+        #region Internal implementation
+
+        internal static bool TryGetValue(DynamicType type, int version, SymbolId name, CallerContextAttributes flags, out bool found, out object slot) {
+            Entry entry = entries[GetIndex(type, version, name)];
+            if (entry != null && entry.type == type && entry.version == version && entry.name == name.Id && entry.flags == flags) {
+                hits++;
+                found = entry.found;
+                slot = entry.slot;
+                return true;
+            }
+
+            misses++;
+            found = false;
+            slot = null;
+            return false;
+        }
+
+        internal static void Add(DynamicType type, int version, SymbolId name, CallerContextAttributes flags, bool found, object slot) {
+            entries[GetIndex(type, version, name)] = new Entry(type, version, name.Id, flags, found, slot);
+        }
+
+        private static int GetIndex(DynamicType type, int version, SymbolId name) {
+            int hash = RuntimeHelpers.GetHashCode(type) ^ (version * 16777619) ^ (name.Id * 40503);
+            return (hash ^ (hash >> 12)) & (CacheSize - 1);
+        }
+
+        /// <summary>
+        /// Entries are immutable so that readers never observe a partially updated entry.
+        /// </summary>
+        private sealed class Entry {
+            public readonly DynamicType type;
+            public readonly int version;
+            public readonly int name;
+            public readonly CallerContextAttributes flags;
+            public readonly bool found;
+            public readonly object slot;
+
+            public Entry(DynamicType type, int version, int name, CallerContextAttributes flags, bool found, object slot) {
+                this.type = type;
+                this.version = version;
+                this.name = name;
+                this.flags = flags;
+                this.found = found;
+                this.slot = slot;
+            }
+        }
+
+        #endregion
+    }
+}
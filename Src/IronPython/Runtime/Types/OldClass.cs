@@ -880,6 +880,17 @@ namespace IronPython.Runtime.Types {
             return false;
         }
 
+        /// <summary>
+        /// Looks up name in the class unless the instance dictionary defines it.
+        /// </summary>
+        internal bool TryLookupClassSlot(SymbolId name, out object ret) {
+            if (__dict__.ContainsKey(name)) {
+                ret = null;
+                return false;
+            }
+            return __class__.TryLookupSlot(name, out ret);
+        }
+
         private bool TryRawGetAttr(SymbolId name, out object ret) {
             if (__dict__.TryGetValue(name, out ret)) return true;
 
@@ -235,6 +235,8 @@ namespace IronPython.Runtime.Types {
 
                 appendedAttrs = attrInjector;
             }
+
+            UpdateVersion();
         }
 
         #endregion
@@ -870,6 +872,9 @@ namespace IronPython.Runtime.Types {
                     AddModule();
 
                     dict = new ProxyDictionary(dict.SymbolAttributes);
+
+                    // anything cached while we were being initialized is now stale
+                    UpdateVersion();
                 }
             }
         }
@@ -935,6 +940,14 @@ namespace IronPython.Runtime.Types {
             }
         }
 
+        internal override bool IsAttributeLookupCacheable {
+            get {
+                // sub-classes such as ComObject and CompiledType customize instance lookup
+                return (GetType() == typeof(ReflectedType) || GetType() == typeof(OpsReflectedType)) &&
+                    prependedAttrs == null && appendedAttrs == null;
+            }
+        }
+
         public override bool TryGetAttr(ICallerContext context, object self, SymbolId name, out object ret) {
             if (prependedAttrs != null && prependedAttrs.TryGetAttr(self, name, out ret)) {
                 return true;
@@ -308,6 +308,8 @@ namespace IronPython.Runtime.Types {
 
                     ReinitializeHierarchy();
                 }
+
+                UpdateVersion();
             }
         }
 
@@ -361,6 +363,14 @@ namespace IronPython.Runtime.Types {
             return false;
         }
 
+        internal override bool IsAttributeLookupCacheable {
+            get {
+                // types w/ metaclasses or a custom __getattribute__ can do anything on lookup, and
+                // old-style classes in our MRO can be updated w/o updating our version.
+                return GetType() == typeof(UserType) && __getattribute__F.IsObjectMethod() && !HasOldClassInMro;
+            }
+        }
+
         public override object GetAttr(ICallerContext context, object self, SymbolId name) {
             if (__getattribute__F.IsObjectMethod()) {
                 object ret;
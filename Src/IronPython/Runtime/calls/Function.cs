@@ -52,6 +52,7 @@ namespace IronPython.Runtime.Calls {
             KwArgs = 0x08,
             Generator = 0x20,
             FutureDivision = 0x2000,
+            IterationStop = 0x40000000,     // not a CPython flag, see PythonFunction.CanStopIteration
         }
         #endregion
 
@@ -129,7 +130,7 @@ namespace IronPython.Runtime.Calls {
         public object Flags {
             [PythonName("co_flags")]
             get {
-                FuncCodeFlags res = flags;
+                FuncCodeFlags res = flags & ~FuncCodeFlags.IterationStop;
                 FunctionN funcN = func as FunctionN;
                 FunctionX funcX = func as FunctionX;
                 if (funcX != null) {
@@ -197,14 +198,19 @@ namespace IronPython.Runtime.Calls {
             lineNo = line;
         }
 
-        // This is only used to set the value of FutureDivision and Generator flags
+        // This is only used to set the value of FutureDivision, Generator and IterationStop flags
         public void SetFlags(int value) {
-            this.flags = (FuncCodeFlags)value & (FuncCodeFlags.FutureDivision | FuncCodeFlags.Generator);
+            this.flags = (FuncCodeFlags)value & (FuncCodeFlags.FutureDivision | FuncCodeFlags.Generator | FuncCodeFlags.IterationStop);
         }
 
         #endregion
 
         #region Internal API Surface
+        internal bool HasIterationStop(PythonFunction f) {
+            // func_code may have been replaced w/ the code of another function
+            return func == f && (flags & FuncCodeFlags.IterationStop) != 0;
+        }
+
         internal object Call(ModuleScope curFrame) {
             if (compiledCode != null) {
                 return compiledCode.Run(curFrame);
@@ -385,6 +391,16 @@ namespace IronPython.Runtime.Calls {
             }
         }
 
+        /// <summary>
+        /// True if the function was compiled to return Ops.IterationStopped, instead of raising
+        /// StopIteration or IndexError, when an iterator calls it through Ops.CallIterationMethod.
+        /// </summary>
+        internal bool CanStopIteration {
+            get {
+                return code.HasIterationStop(this);
+            }
+        }
+
         public override object CallInstance(ICallerContext context, object instance, params object[] args) {
             return Call(context, PrependInstance(instance, args));
         }
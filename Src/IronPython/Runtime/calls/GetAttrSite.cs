@@ -0,0 +1,179 @@
+/* **********************************************************************************
+ *
+ * Copyright (c) Microsoft Corporation. All rights reserved.
+ *
+ * This source code is subject to terms and conditions of the Shared Source License
+ * for IronPython. A copy of the license can be found in the License.html file
+ * at the root of this distribution. If you can not locate the Shared Source License
+ * for IronPython, please send an email to ironpy@microsoft.com.
+ * By using this source code in any fashion, you are agreeing to be bound by
+ * the terms of the Shared Source License for IronPython.
+ *
+ * You must not remove this notice, or any other, from this software.
+ *
+ * **********************************************************************************/
+
+using System;
+
+using IronPython.Runtime.Operations;
+using IronPython.Runtime.Types;
+
+namespace IronPython.Runtime.Calls {
+    /// <summary>
+    /// A polymorphic inline cache for a single "obj.attr" expression in generated code.
+    ///
+    /// Each entry remembers the slot found in the MRO of a receiver's DynamicType along with the
+    /// version of the type at the time of the lookup.  As long as the version is unchanged (no
+    /// assignment to the class dictionary or __bases__ of the type or any of its bases) the slot
+    /// can be re-used and we only need to invoke the descriptor.  After MaxEntries different
+    /// types have been seen the site goes megamorphic and always falls back to Ops.GetAttr.
+    /// </summary>
+    public sealed class GetAttrSite {
+        private const int MaxEntries = 4;
+        private static readonly Entry[] EmptyEntries = new Entry[0];
+
+        private readonly SymbolId name;
+        private Entry[] entries = EmptyEntries;    // copy-on-write, never mutated once published
+        private bool megamorphic;
+
+        public GetAttrSite(SymbolId name) {
+            this.name = name;
+        }
+
+        /// <summary>
+        /// Returns true if lookups of name can be served by a GetAttrSite.  Names which are
+        /// special-cased by the attribute lookup routines always go through Ops.GetAttr.
+        /// </summary>
+        public static bool IsCacheableName(SymbolId name) {
+            return name != SymbolTable.Dict && name != SymbolTable.Class && name != SymbolTable.WeakRef;
+        }
+
+        public SymbolId Name {
+            get { return name; }
+        }
+
+        public bool IsMegamorphic {
+            get { return megamorphic; }
+        }
+
+        public object GetAttr(ICallerContext context, object o) {
+            if (!megamorphic && !(o is ICustomAttributes)) {
+                DynamicType dt = Ops.GetDynamicType(o);
+
+                Entry[] cur = entries;
+                for (int i = 0; i < cur.Length; i++) {
+                    Entry entry = cur[i];
+                    if (entry.type == dt) {
+                        if (entry.version == dt.Version && entry.flags == context.ContextFlags) {
+                            object ret;
+                            if (TryGetCachedValue(entry, o, out ret)) return ret;
+                            return Ops.GetAttr(context, o, name);
+                        }
+                        break;
+                    }
+                }
+
+                return Miss(context, o, dt);
+            }
+
+            return Ops.GetAttr(context, o, name);
+        }
+
+        /// <summary>
+        /// Produces the value of the attribute from a valid entry, or returns false if the
+        /// full lookup is required (no slot, __getattr__, or an error to report).
+        /// </summary>
+        private bool TryGetCachedValue(Entry entry, object instance, out object value) {
+            if (entry.cacheable) {
+                if (entry.checkInstanceDict) {
+                    // user types check the instance before the type
+                    IAttributesDictionary dict = ((ISuperDynamicObject)instance).GetDict();
+                    if (dict != null && dict.TryGetValue(name, out value)) return true;
+                }
+
+                if (entry.hasSlot) {
+                    value = entry.type.UncheckedGetDescriptor(entry.slot, instance, entry.type);
+                    return true;
+                }
+            }
+
+            value = null;
+            return false;
+        }
+
+        private object Miss(ICallerContext context, object o, DynamicType dt) {
+            // read the version before doing the lookup so that a concurrent update
+            // of the type leaves us w/ a stale entry rather than a wrong one.
+            int version = dt.Version;
+            CallerContextAttributes flags = context.ContextFlags;
+
+            Entry entry;
+            if (dt.IsAttributeLookupCacheable) {
+                object slot;
+                bool hasSlot = dt.TryLookupSlot(context, name, out slot);
+                entry = new Entry(dt, version, flags, dt is UserType, hasSlot, slot);
+            } else {
+                entry = new Entry(dt, version, flags);
+            }
+
+            AddEntry(entry);
+
+            return Ops.GetAttr(context, o, name);
+        }
+
+        private void AddEntry(Entry entry) {
+            Entry[] cur = entries;
+
+            for (int i = 0; i < cur.Length; i++) {
+                if (cur[i].type == entry.type) {
+                    // the type has been updated, replace the stale entry
+                    Entry[] updated = (Entry[])cur.Clone();
+                    updated[i] = entry;
+                    entries = updated;
+                    return;
+                }
+            }
+
+            if (cur.Length == MaxEntries) {
+                megamorphic = true;
+                entries = EmptyEntries;
+                return;
+            }
+
+            Entry[] res = new Entry[cur.Length + 1];
+            Array.Copy(cur, res, cur.Length);
+            res[cur.Length] = entry;
+            entries = res;
+        }
+
+        private sealed class Entry {
+            public readonly DynamicType type;
+            public readonly int version;
+            public readonly CallerContextAttributes flags;
+
+            public readonly bool cacheable;
+            public readonly bool checkInstanceDict;
+            public readonly bool hasSlot;
+            public readonly object slot;
+
+            /// <summary>
+            /// Creates an entry for a type whose lookups can't be cached.
+            /// </summary>
+            public Entry(DynamicType type, int version, CallerContextAttributes flags) {
+                this.type = type;
+                this.version = version;
+                this.flags = flags;
+            }
+
+            public Entry(DynamicType type, int version, CallerContextAttributes flags, bool checkInstanceDict, bool hasSlot, object slot) {
+                this.type = type;
+                this.version = version;
+                this.flags = flags;
+                this.cacheable = true;
+                this.checkInstanceDict = checkInstanceDict;
+                this.hasSlot = hasSlot;
+                this.slot = slot;
+            }
+        }
+    }
+}
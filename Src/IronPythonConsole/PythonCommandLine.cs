@@ -204,10 +204,12 @@ namespace IronPythonConsole {
                         }
                         Options.BinariesDirectory = (string)args[0];
                         break;
+                    case "-X:CacheModules": Options.CacheCompiledModules = true; break;
                     case "-X:FastEval": Options.FastEvaluation = true; break;
                     case "-X:Frames": Options.Frames = true; break;
                     case "-X:GenerateAsSnippets": Options.GenerateModulesAsSnippets = true; break;
                     case "-X:ILDebug": Options.ILDebug = true; break;
+                    case "-X:InlineNumerics": Options.InlineNumericOperations = true; break;
                     case "-c":
                         args.RemoveAt(0);
                         if (args.Count == 0) {
@@ -227,6 +229,7 @@ namespace IronPythonConsole {
                         return options;
 #endif
                     case "-X:MTA": mta = true; break;
+                    case "-X:NoAttributeCache": Options.CacheAttributeLookups = false; break;
                     case "-X:NoOptimize": Options.OptimizeReflectCalls = false; break;
                     case "-X:NoTraceback": Options.TraceBackSupport = false; break;
                     case "-X:MaxRecursion":
@@ -239,6 +242,14 @@ namespace IronPythonConsole {
                         break;
                     case "-X:PrivateBinding": Options.PrivateBinding = true; break;
                     case "-X:Python25": Options.Python25 = true; break;
+                    case "-X:RegexCompileThreshold":
+                        args.RemoveAt(0);
+                        int regexThreshold = 0;
+                        if (args.Count == 0 || !Int32.TryParse((string)args[0], out regexThreshold)) {
+                            PrintUsageAndExit();
+                        }
+                        Options.RegexCompileThreshold = regexThreshold;
+                        break;
                     case "-X:SaveAssemblies": Options.SaveAndReloadBinaries = true; break;
                     case "-X:ShowClrExceptions": options.ShowClrExceptions = true; break;
                     case "-X:StaticMethods": Options.GenerateDynamicMethods = false; break;
@@ -322,6 +333,9 @@ namespace IronPythonConsole {
             Console.WriteLine("  -X:AssembliesDir       Set the directory for saving generated assemblies");
 #if !IRONPYTHON_WINDOW
             Console.WriteLine("  -X:AutoIndent          Automatically insert indentation");
+#endif
+            Console.WriteLine("  -X:CacheModules        Save compiled modules and re-use them on later imports");
+#if !IRONPYTHON_WINDOW
             Console.WriteLine("  -X:ColorfulConsole     Enable ColorfulConsole");
             Console.WriteLine("  -X:ExceptionDetail     Enable ExceptionDetail mode");
 #endif
@@ -329,12 +343,15 @@ namespace IronPythonConsole {
             Console.WriteLine("  -X:Frames              Generate custom frames");
             Console.WriteLine("  -X:GenerateAsSnippets  Generate code to run in snippet mode");
             Console.WriteLine("  -X:ILDebug             Output generated IL code to a text file for debugging");
+            Console.WriteLine("  -X:InlineNumerics      Inline int and float arithmetic and comparisons");
             Console.WriteLine("  -X:MaxRecursion        Set the maximum recursion level");
             Console.WriteLine("  -X:MTA                 Run in multithreaded apartment");
+            Console.WriteLine("  -X:NoAttributeCache    Do not cache attribute lookups at each access site");
             Console.WriteLine("  -X:NoOptimize          Disable optimized methods");
             Console.WriteLine("  -X:NoTraceback         Do not emit traceback code");
             Console.WriteLine("  -X:PassExceptions      Do not catch exceptions that are unhandled by Python code");
             Console.WriteLine("  -X:PrivateBinding      Enable binding to private members");
+            Console.WriteLine("  -X:RegexCompileThreshold  Compile regular expressions after this many uses (0: always, -1: never)");
             Console.WriteLine("  -X:SaveAssemblies      Save generated assemblies");
             Console.WriteLine("  -X:ShowClrExceptions   Display CLS Exception information");
             Console.WriteLine("  -X:StaticMethods       Generate static methods only");
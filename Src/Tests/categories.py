@@ -72,6 +72,7 @@ IronPythonTests = {
                 test_operator
                 test_random
                 test_re
+                test_select
                 test_socket
                 test_struct
                 test_sys
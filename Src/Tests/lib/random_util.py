@@ -0,0 +1,57 @@
+#####################################################################################
+#
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#
+#  This source code is subject to terms and conditions of the Shared Source License
+#  for IronPython. A copy of the license can be found in the License.html file
+#  at the root of this distribution. If you can not locate the Shared Source License
+#  for IronPython, please send an email to ironpy@microsoft.com.
+#  By using this source code in any fashion, you are agreeing to be bound by
+#  the terms of the Shared Source License for IronPython.
+#
+#  You must not remove this notice, or any other, from this software.
+#
+######################################################################################
+
+# A small deterministic random number generator for the tests.  It has the parts of
+# random.Random the tests use, without needing the standard library's random module.
+
+class Random:
+    def __init__(self, seed):
+        self.state = seed % 2147483646 + 1
+
+    def _next(self):
+        # 30 bits from the Park-Miller generator, using Schrage's method so that
+        # everything stays a plain int
+        hi, lo = divmod(self.state, 127773)
+        self.state = 16807 * lo - 2836 * hi
+        if self.state <= 0: self.state += 2147483647
+        return self.state >> 1
+
+    def getrandbits(self, k):
+        res = 0L
+        for i in xrange(0, k, 30):
+            res = (res << 30) | self._next()
+        return res >> (-k % 30)
+
+    def random(self):
+        return (self._next() * 1073741824.0 + self._next()) / 1152921504606846976.0
+
+    def randrange(self, start, stop=None):
+        if stop is None: start, stop = 0, start
+        n = stop - start
+        if n <= 0: raise ValueError('empty range for randrange()')
+        bits, m = 0, n - 1
+        while m:
+            m >>= 1
+            bits += 1
+        while True:
+            if bits <= 30: res = self._next() >> (30 - bits)
+            else: res = self.getrandbits(bits)
+            if res < n: return start + res
+
+    def randint(self, a, b):
+        return self.randrange(a, b + 1)
+
+    def choice(self, seq):
+        return seq[self.randrange(len(seq))]
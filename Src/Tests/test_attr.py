@@ -173,4 +173,91 @@ def test_attraccess():
     attr_access(OldStyleClass())
     attr_access(C())
 
+def test_attr_cache_invalidation():
+    # attribute accesses are cached at each access site, updates to the
+    # class, its bases, and the instance must all be observed.
+    class A(object):
+        x = 1
+    class B(A):
+        pass
+    def get_x(o): return o.x
+    b = B()
+    for i in range(3): AreEqual(get_x(b), 1)
+    A.x = 2
+    AreEqual(get_x(b), 2)
+    B.x = 3
+    AreEqual(get_x(b), 3)
+    del B.x
+    AreEqual(get_x(b), 2)
+    b.x = 4
+    AreEqual(get_x(b), 4)
+    del b.__dict__['x']
+    AreEqual(get_x(b), 2)
+    class C(object):
+        x = 5
+    B.__bases__ = (C,)
+    AreEqual(get_x(b), 5)
+    del C.x
+    AssertError(AttributeError, get_x, b)
+    A.__getattr__ = lambda self, name: 'getattr'
+    B.__bases__ = (A,)
+    del A.x
+    AreEqual(get_x(b), 'getattr')
+
+def test_attr_cache_polymorphic():
+    class A(object):
+        real = 'A'
+    class B(object):
+        def real(self): return 'B'
+    class C(A):
+        pass
+    class D:
+        real = 'D'
+    def get_real(o): return o.real
+    for i in range(2):
+        AreEqual(get_real(1j), 0.0)
+        AreEqual(get_real(complex(2, 3)), 2.0)
+        AreEqual(get_real(A()), 'A')
+        AreEqual(get_real(B())(), 'B')
+        AreEqual(get_real(C()), 'A')
+        AreEqual(get_real(D()), 'D')
+        AssertError(AttributeError, get_real, 1)
+        AssertError(AttributeError, get_real, object())
+
+def test_method_cache():
+    from IronPython.Runtime.Types import MethodCache
+    class C(object):
+        def f(self): return 'C'
+    class D(C):
+        pass
+    d = D()
+    hits = MethodCache.Hits
+    for i in range(5): AreEqual(getattr(d, 'f')(), 'C')
+    Assert(MethodCache.Hits > hits)
+    
+    # updates to a base class are seen through the cache
+    C.f = lambda self: 'C2'
+    AreEqual(getattr(d, 'f')(), 'C2')
+    D.f = lambda self: 'D'
+    AreEqual(getattr(d, 'f')(), 'D')
+    del D.f
+    AreEqual(getattr(d, 'f')(), 'C2')
+    class E(object):
+        def f(self): return 'E'
+    D.__bases__ = (E, )
+    AreEqual(getattr(d, 'f')(), 'E')
+    
+    # old-style bases aren't cached, but must still be correct
+    class O:
+        def f(self): return 'O'
+    class N(O, object):
+        pass
+    n = N()
+    AreEqual(getattr(n, 'f')(), 'O')
+    O.f = lambda self: 'O2'
+    AreEqual(getattr(n, 'f')(), 'O2')
+    
+    MethodCache.Clear()
+    AreEqual(getattr(d, 'f')(), 'E')
+
 run_test(__name__)
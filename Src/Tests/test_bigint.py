@@ -50,3 +50,191 @@ while j > k:
 
 Assert(12297829382473034410)
 
+# products of large numbers (which use Karatsuba and Toom-3) checked against
+# the sum of the products by each 16-bit piece of one operand (which are done
+# by the schoolbook algorithm)
+def schoolbook_multiply(x, y):
+    res = 0L
+    shift = 0
+    sign = 1
+    if y < 0: y, sign = -y, -1
+    while y:
+        res += (x * (y & 0xffff)) << shift
+        y >>= 16
+        shift += 16
+    return res * sign
+
+def test_multiply():
+    from lib.random_util import Random
+    r = Random(12345)
+    # either side of the Karatsuba thresholds, 64 digits (2048 bits) for products
+    # and 80 digits (2560 bits) for squares
+    for bits in (100, 2000, 2100, 2600, 3000):
+        for i in range(3):
+            x = r.getrandbits(bits) * r.choice((1, -1))
+            y = r.getrandbits(r.choice((bits, bits / 3, bits * 2))) + 1
+            AreEqual(x * y, schoolbook_multiply(x, y))
+            AreEqual(x * x, schoolbook_multiply(x, x))
+            AreEqual(x ** 2, x * x)
+            AreEqual(x ** 3, schoolbook_multiply(x * x, x))
+    # just past the Toom-3 thresholds, 2048 digits for products and 4096 for squares,
+    # checked against the products of the halves (which use Karatsuba)
+    for bits, y_bits in ((66000, 66000), (66000, 99000), (132000, 0)):
+        x = r.getrandbits(bits) | (1L << (bits - 1))
+        half = bits / 2
+        hi, lo = x >> half, x & ((1L << half) - 1)
+        if y_bits:
+            y = r.getrandbits(y_bits) | (1L << (y_bits - 1))
+            AreEqual(x * y, ((hi * y) << half) + lo * y)
+            AreEqual(-x * y, -(((hi * y) << half) + lo * y))
+        else:
+            AreEqual(x * x, ((hi * hi) << bits) + ((hi * lo) << (half + 1)) + lo * lo)
+    # all ones is the worst case for the carries
+    for bits in (100, 2100, 2600, 66000, 132000):
+        x = (1L << bits) - 1
+        AreEqual(x * x, (1L << (2 * bits)) - (1L << (bits + 1)) + 1)
+        AreEqual(x * (x - 1), (1L << (2 * bits)) - 3 * (1L << bits) + 2)
+
+test_multiply()
+
+def schoolbook_str(x):
+    if x < 0: return '-' + schoolbook_str(-x)
+    groups = []
+    while x:
+        x, rem = divmod(x, 1000000000)
+        groups.append('%09d' % rem)
+    groups.reverse()
+    return ''.join(groups).lstrip('0') or '0'
+
+def test_radix_conversion():
+    from lib.random_util import Random
+    r = Random(54321)
+    for bits in (10, 1000, 1300, 1500, 5000, 10000, 40000):
+        for i in range(3):
+            x = r.getrandbits(bits) * r.choice((1, -1))
+            s = str(x)
+            AreEqual(s, schoolbook_str(x))
+            AreEqual(long(s), x)
+            AreEqual(long(' ' + s + ' '), x)
+            AreEqual(long(hex(x)[:-1], 0), x)
+            AreEqual(long(oct(x)[:-1], 0), x)
+    for n in (100, 1000, 10000, 20000):
+        AreEqual(str(10L ** n), '1' + '0' * n)
+        AreEqual(str(10L ** n - 1), '9' * n)
+        AreEqual(long('1' + '0' * n), 10L ** n)
+        AreEqual(long('0' * n + '123'), 123)
+        AreEqual(long('f' * n, 16), 16L ** n - 1)
+    AreEqual(long(u'\u0661\u0662' * 500), long('12' * 500))
+    AssertError(ValueError, long, '1' * 1000 + 'x')
+    AssertError(ValueError, long, '9' * 1000, 8)
+
+test_radix_conversion()
+
+def square_and_multiply_pow(x, y, z):
+    result = 1
+    x = x % z
+    while y:
+        if y & 1: result = result * x % z
+        x = x * x % z
+        y >>= 1
+    return result % z
+
+def square_and_multiply_pow2(x, y, bits):
+    # x ** y % 2 ** bits, masking rather than dividing
+    mask = (1L << bits) - 1
+    result = 1
+    x = x & mask
+    while y:
+        if y & 1: result = result * x & mask
+        x = x * x & mask
+        y >>= 1
+    return result
+
+def test_pow_mod():
+    from lib.random_util import Random
+    r = Random(2468)
+    for bits in (32, 64, 100, 512, 1024, 2048, 4096, 9000):
+        # an even and an odd modulus are enough for the sizes where the reference is slowest
+        for i in range(bits < 4096 and 4 or 2):
+            z = r.getrandbits(bits) | (1L << (bits - 1))
+            if i % 2: z |= 1        # odd moduli use Montgomery reduction
+            x = r.getrandbits(bits + 30) * r.choice((1, -1))
+            # the reference divides at every step, so large moduli get short exponents
+            y = r.getrandbits(min(r.choice((3, 30, bits)), (1 << 15) / bits))
+            expected = square_and_multiply_pow(x, y, z)
+            AreEqual(pow(x, y, z), expected)
+            AreEqual(pow(x, y, -z), expected and expected - z)
+            AreEqual(x.__pow__(y, z), expected)
+    # longer exponents use wider windows, up to 6 bits past 671 bits
+    for bits, y_bits in ((100, 100), (300, 300), (1024, 1024), (4096, 700), (9000, 700)):
+        x = r.getrandbits(bits + 30) * r.choice((1, -1))
+        y = r.getrandbits(y_bits) | (1L << (y_bits - 1))
+        AreEqual(pow(x, y, 1L << bits), square_and_multiply_pow2(x, y, bits))
+    # Fermat's little theorem and Euler's criterion for Mersenne primes, none of
+    # which has 3 as a quadratic residue
+    for q in (521, 1279, 2203):
+        p = (1L << q) - 1
+        AreEqual(pow(3L, p - 1, p), 1)
+        AreEqual(pow(3L, p, p), 3)
+        AreEqual(pow(3L, (p - 1) / 2, p), p - 1)
+    AreEqual(pow(2L, 1, -2), 0)
+    AreEqual(pow(-2L, 3, 5), 2)
+    AreEqual(pow(-2L, 3, -5), -3)
+    AreEqual(pow(12L, 5, 1L << 70), 12 ** 5)
+    AssertError(ValueError, pow, 2L, 3, 0L)
+
+test_pow_mod()
+
+def multiply_benchmark():
+    import time
+    from lib.random_util import Random
+    r = Random(1)
+    print "%8s %12s %12s" % ("digits", "x * y (ms)", "x * x (ms)")
+    for digits in (300, 1000, 3000, 10000, 30000, 100000):
+        x = r.getrandbits(digits * 10 / 3)
+        y = r.getrandbits(digits * 10 / 3)
+        count = max(1, 3000000 / digits / digits)
+        start = time.clock()
+        for i in xrange(count): x * y
+        mul = (time.clock() - start) * 1000 / count
+        start = time.clock()
+        for i in xrange(count): x * x
+        sqr = (time.clock() - start) * 1000 / count
+        print "%8d %12.3f %12.3f" % (digits, mul, sqr)
+
+def radix_conversion_benchmark():
+    import time
+    from lib.random_util import Random
+    r = Random(1)
+    print "%8s %12s %12s" % ("digits", "str (ms)", "long (ms)")
+    for digits in (1000, 10000, 100000, 300000):
+        x = r.getrandbits(digits * 10 / 3)
+        start = time.clock()
+        s = str(x)
+        to_str = (time.clock() - start) * 1000
+        start = time.clock()
+        long(s)
+        from_str = (time.clock() - start) * 1000
+        print "%8d %12.3f %12.3f" % (len(s), to_str, from_str)
+
+def pow_mod_benchmark():
+    import time
+    from lib.random_util import Random
+    r = Random(1)
+    print "%8s %16s %16s %16s" % ("bits", "odd mod (ms)", "even mod (ms)", "square and multiply (ms)")
+    for bits in (512, 1024, 2048, 4096):
+        z = r.getrandbits(bits) | (1L << (bits - 1)) | 1
+        x = r.getrandbits(bits) % z
+        y = r.getrandbits(bits)
+        count = max(1, 2000000 / bits / bits)
+        times = []
+        for f, mod in ((pow, z), (pow, z + 1), (square_and_multiply_pow, z)):
+            start = time.clock()
+            for i in xrange(count): f(x, y, mod)
+            times.append((time.clock() - start) * 1000 / count)
+        print "%8d %16.3f %16.3f %16.3f" % (bits, times[0], times[1], times[2])
+
+if __name__ == '__main__':
+    multiply_benchmark()
+    radix_conversion_benchmark()
+    pow_mod_benchmark()
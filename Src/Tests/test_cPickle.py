@@ -641,4 +641,49 @@ def test_unpickler(module=cPickle, verbose=True):
 
         if verbose: print 'ok'
 
+def test_file_like_objects():
+    data = [1, 'abc', {'x': [2.5, None]}, ('t', True)] * 50
+
+    for proto in range(3):
+        AreEqual(cPickle.loads(cPickle.dumps(data, proto)), data)
+        
+        # cStringIO
+        s = StringIO()
+        cPickle.dump(data, s, proto)
+        cPickle.dump('second', s, proto)
+        s.seek(0)
+        AreEqual(cPickle.load(s), data)
+        AreEqual(cPickle.load(s), 'second')
+        AreEqual(cPickle.load(StringIO(s.getvalue())), data)
+        
+        # a real file
+        fname = path_combine(testpath.temporary_dir, 'pickle_test.tmp')
+        f = file(fname, 'wb')
+        cPickle.dump(data, f, proto)
+        cPickle.dump('second', f, proto)
+        f.close()
+        f = file(fname, 'rb')
+        AreEqual(cPickle.load(f), data)
+        AreEqual(cPickle.load(f), 'second')
+        f.close()
+        
+        # a user defined object, each dump writes its output before returning
+        class Writer:
+            def __init__(self): self.chunks = []
+            def write(self, s): self.chunks.append(s)
+        w = Writer()
+        p = cPickle.Pickler(w, proto)
+        p.dump(data)
+        AreEqual(cPickle.loads(''.join(w.chunks)), data)
+        
+        if is_cli:
+            # writes are batched
+            Assert(len(w.chunks) < 10)
+            
+            # the list based pickler
+            p = cPickle.Pickler(proto)
+            p.dump(data)
+            AreEqual(cPickle.loads(p.getvalue()), data)
+
+
 run_test(__name__)
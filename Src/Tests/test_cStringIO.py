@@ -194,3 +194,45 @@ def test_o(init):
 test_i(init_StringI)
 test_i(init_StringO)
 test_o(init_StringO)
+
+# writes in the middle, past the end and after getvalue
+def test_write_positions():
+    o = cStringIO.StringIO()
+    o.write("abcdef")
+    AreEqual(o.getvalue(), "abcdef")
+    o.seek(2)
+    o.write("XY")
+    AreEqual(o.tell(), 4)
+    AreEqual(o.getvalue(), "abXYef")
+    o.seek(4)
+    o.write("123")
+    AreEqual(o.getvalue(), "abXY123")
+    o.seek(9)
+    o.write("!")
+    AreEqual(o.getvalue(), "abXY123\0\0!")
+    o.seek(3)
+    o.truncate()
+    AreEqual(o.getvalue(), "abX")
+    o.write("yz")
+    AreEqual(o.getvalue(), "abXyz")
+
+test_write_positions()
+
+def test_many_writes(count):
+    o = cStringIO.StringIO()
+    for i in xrange(count):
+        o.write("x")
+    AreEqual(o.tell(), count)
+    AreEqual(len(o.getvalue()), count)
+
+test_many_writes(10000)
+
+# many small writes take linear time
+def many_writes_benchmark(count):
+    import time
+    start = time.clock()
+    test_many_writes(count)
+    print '%d writes: %.2f seconds' % (count, time.clock() - start)
+
+if __name__ == '__main__':
+    many_writes_benchmark(1000000)
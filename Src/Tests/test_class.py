@@ -1622,4 +1622,61 @@ def test_fastnew_int():
     AreEqual(int(C5()), -123456789012345678910)
     for x in [C6, C7]:      AssertError(TypeError, int, x())       
 
+def test_method_call():
+    """o.m(args) calls the unbound function directly when it's a plain method"""
+    class New(object):
+        def m(self, *args): return ('new',) + args
+        def many(self, a, b, c, d, e, f, g): return (a, b, c, d, e, f, g)
+        @staticmethod
+        def s(x): return x
+        @classmethod
+        def c(cls, x): return (cls, x)
+    
+    class Old:
+        def m(self, *args): return ('old',) + args
+    
+    for cls, tag in [(New, 'new'), (Old, 'old')]:
+        o = cls()
+        AreEqual(o.m(), (tag,))
+        AreEqual(o.m(1), (tag, 1))
+        AreEqual(o.m(1, 2, 3, 4, 5), (tag, 1, 2, 3, 4, 5))
+        AreEqual(o.m(1, 2, 3, 4, 5, 6), (tag, 1, 2, 3, 4, 5, 6))
+        
+        # the instance dictionary shadows the method
+        o.m = lambda *args: ('instance',) + args
+        AreEqual(o.m(1), ('instance', 1))
+        del o.__dict__['m']
+        AreEqual(o.m(1), (tag, 1))
+        
+        # updates to the class are seen
+        cls.m = lambda self, *args: ('updated',) + args
+        AreEqual(o.m(2), ('updated', 2))
+    
+    o = New()
+    AreEqual(o.many(1, 2, 3, 4, 5, 6, 7), (1, 2, 3, 4, 5, 6, 7))
+    AreEqual(o.s(1), 1)
+    AreEqual(o.c(1), (New, 1))
+    AreEqual([1, 2].index(2), 1)
+    AreEqual('abc'.upper(), 'ABC')
+    
+    # the attribute is looked up before the arguments are evaluated
+    log = []
+    def arg():
+        log.append('arg')
+        return 1
+    AssertError(AttributeError, lambda: o.missing(arg()))
+    AreEqual(log, [])
+    
+    class GetAttr(object):
+        def __getattr__(self, name): return lambda *args: (name,) + args
+    AreEqual(GetAttr().foo(1), ('foo', 1))
+    
+    # errors from the call are the same as for a bound method
+    try:
+        o.many(1)
+        AssertUnreachable()
+    except TypeError:
+        pass
+
+
 run_test(__name__)
@@ -539,4 +539,100 @@ def test_overwrite_readonly():
         AssertUnreachable() # should throw
     #any other exceptions fail
 
-run_test(__name__)
\ No newline at end of file
+def test_binary_buffering():
+    # lines shorter than, equal to and longer than the read buffer, so that
+    # lines start and end on either side of the buffer boundaries
+    lines = []
+    for i in range(200):
+        lines.append(chr(128 + i % 128) * ((i + 1) * 97 % 9000) + '\r\n'[i % 2:])
+    lines.append('no newline at the end')
+    data = ''.join(lines)
+
+    f = file(temp_file, "wb")
+    f.write(data)
+    f.close()
+
+    for bufsize in (-1, 1, 10, 100000):
+        f = file(temp_file, "rb", bufsize)
+        AreEqual(list(f), lines)
+        f.close()
+
+        f = file(temp_file, "rb", bufsize)
+        AreEqual(f.readlines(), lines)
+        f.close()
+
+        f = file(temp_file, "rb", bufsize)
+        count = 0
+        for line in f.xreadlines():
+            AreEqual(line, lines[count])
+            count += 1
+        AreEqual(count, len(lines))
+        AreEqual(f.readline(), '')
+        f.close()
+
+    # mixing reads, readlines, tell and seek
+    f = file(temp_file, "rb")
+    AreEqual(f.readline(5), lines[0][:5])
+    AreEqual(f.tell(), 5)
+    AreEqual(f.readline(), lines[0][5:])
+    AreEqual(f.read(3), lines[1][:3])
+    AreEqual(f.tell(), len(lines[0]) + 3)
+    f.seek(-2, 1)
+    AreEqual(f.tell(), len(lines[0]) + 1)
+    AreEqual(f.readline(), lines[1][1:])
+    start = len(lines[0]) + len(lines[1])
+    AreEqual(f.read(20000), data[start:start + 20000])
+    AreEqual(f.read(), data[start + 20000:])
+    AreEqual(f.read(), '')
+    f.seek(0)
+    AreEqual(f.read(), data)
+    f.close()
+
+    # writing after reading goes to the position we've read up to
+    f = file(temp_file, "r+b")
+    AreEqual(f.readline(), lines[0])
+    f.write('xyz')
+    AreEqual(f.tell(), len(lines[0]) + 3)
+    AreEqual(f.readline(), lines[1][3:])
+    f.seek(0)
+    AreEqual(f.read(start), lines[0] + 'xyz' + lines[1][3:])
+    f.close()
+
+    # "for line in f" on a subclass still goes through its next method
+    class MyFile(file):
+        def next(self):
+            return file.next(self) + '!'
+
+    f = MyFile(temp_file, "rb")
+    for line in f:
+        Assert(line.endswith('!'))
+    f.close()
+
+def binary_read_throughput(count):
+    import time
+    f = file(temp_file, "wb")
+    for i in xrange(count):
+        f.write('line %d of a binary mode log file\n' % i)
+    f.close()
+
+    # a tiny buffer goes back to the stream every few bytes, much like the
+    # old reader which called ReadByte for every byte.
+    for bufsize in (16, -1, 65536):
+        start = time.clock()
+        f = file(temp_file, "rb", bufsize)
+        for line in f: pass
+        f.close()
+        iterate = time.clock() - start
+
+        start = time.clock()
+        f = file(temp_file, "rb", bufsize)
+        AreEqual(len(f.readlines()), count)
+        f.close()
+        readlines = time.clock() - start
+
+        print 'bufsize %d: %d lines iterated in %.2f seconds, read by readlines in %.2f seconds' % (bufsize, count, iterate, readlines)
+
+run_test(__name__)
+
+if __name__ == '__main__':
+    binary_read_throughput(1000000)
@@ -589,6 +589,54 @@ else:
 if is_cli:
     test_copyfrompackages()
 
+def test_module_cache():
+    import IronPython
+    
+    _cachedir = path_combine(testpath.temporary_dir, 'ModuleCacheDir')
+    ensure_directory_present(_cachedir)
+    clean_directory(_cachedir)
+    _f_cached = path_combine(_cachedir, 'cachedmod.py')
+    write_to_file(_f_cached, 'value = 1')
+    
+    def cache_files():
+        return [f for f in nt.listdir(_cachedir) if f.endswith('.ipyc')]
+    
+    save = IronPython.Compiler.Options.CacheCompiledModules
+    IronPython.Compiler.Options.CacheCompiledModules = True
+    sys.path.append(_cachedir)
+    try:
+        import cachedmod
+        AreEqual(cachedmod.value, 1)
+        files = cache_files()
+        AreEqual(len(files), 1)
+        
+        # the second import loads the cached assembly
+        del sys.modules['cachedmod']
+        import cachedmod
+        AreEqual(cachedmod.value, 1)
+        AreEqual(cache_files(), files)
+        
+        # a changed source file misses the cache
+        del sys.modules['cachedmod']
+        write_to_file(_f_cached, 'value = 2  # changed')
+        import cachedmod
+        AreEqual(cachedmod.value, 2)
+        AreEqual(len([f for f in cache_files() if f not in files]), 1)
+        
+        # the module is re-created when it's loaded from the same cache file again
+        del sys.modules['cachedmod']
+        import cachedmod
+        del sys.modules['cachedmod']
+        import cachedmod
+        AreEqual(cachedmod.value, 2)
+    finally:
+        IronPython.Compiler.Options.CacheCompiledModules = save
+        sys.path.remove(_cachedir)
+        if 'cachedmod' in sys.modules: del sys.modules['cachedmod']
+
+if is_cli:
+    test_module_cache()
+
 # remove all test files
 
 #delete_all_f(__name__)
@@ -308,6 +308,44 @@ def test_CreateLambda_Division():
     Assert(result < 1)
 
     
+def test_code_cache():
+    o = CreateOptions()
+    o.CodeCacheSize = 2
+    pe = IronPython.Hosting.PythonEngine(o)
+    
+    AreEqual(pe.Evaluate("1 + 2"), 3)
+    AreEqual(pe.Evaluate("1 + 2"), 3)
+    AreEqual(pe.CodeCacheHits, 1)
+    AreEqual(pe.CodeCacheMisses, 1)
+    
+    # cached code runs against the module it's given
+    m = pe.CreateModule('test', False)
+    m.Globals['x'] = 'abc'
+    pe.Globals['x'] = 'def'
+    AreEqual(pe.Evaluate("x", m), 'abc')
+    AreEqual(pe.Evaluate("x"), 'def')
+    
+    pe.Execute("y = x * 2")
+    pe.Execute("y = x * 2", m)
+    AreEqual(pe.Globals['y'], 'defdef')
+    AreEqual(m.Globals['y'], 'abcabc')
+    
+    load_iron_python_test()
+    from IronPythonTest import SimpleReturnDelegateArg1
+    AreEqual(pe.CreateLambda[SimpleReturnDelegateArg1]("arg1 + 1")(2), 3)
+    AreEqual(pe.CreateLambda[SimpleReturnDelegateArg1]("arg1 + 1")(3), 4)
+    Assert(pe.CodeCacheEvictions > 0)
+    
+    # code compiled w/ different flags isn't shared
+    AreEqual(pe.Evaluate("1 / 2"), 0)
+    pe.DefaultModule.TrueDivision = True
+    AreEqual(pe.Evaluate("1 / 2"), 0.5)
+    
+    pe.ClearCodeCache()
+    AreEqual(pe.CodeCacheHits, 0)
+    AreEqual(pe.CodeCacheMisses, 0)
+    AreEqual(pe.CodeCacheEvictions, 0)
+    
 def test_interactive_input():
     x = pe.ParseInteractiveInput("""x = "abc\\
 """, True)
@@ -89,6 +89,125 @@ y = ['1']
 y += Indexer()
 Assert(y == ['1', 1, 2, 3, 4, 5, 6, 7, 8, 9, 0])
 
+# __iter__ returning a generator or a built-in iterator
+class GenIterable:
+    def __init__(self, n):
+        self.n = n
+    def __iter__(self):
+        for i in range(self.n):
+            yield i
+
+class ListIterable(object):
+    def __iter__(self):
+        return iter([1, 2, 3])
+
+import itertools
+for obj, expected in [(GenIterable(3), [0, 1, 2]), (GenIterable(0), []), (ListIterable(), [1, 2, 3])]:
+    AreEqual([x for x in obj], expected)
+    AreEqual(list(obj), expected)
+    AreEqual(tuple(obj), tuple(expected))
+    AreEqual(sum(obj), sum(expected))
+    AreEqual(list(itertools.chain(obj, obj)), expected + expected)
+    
+    y = []
+    for x in obj: y.append(x)
+    AreEqual(y, expected)
+
+# an explicit next() still raises StopIteration
+it = iter(GenIterable(1))
+AreEqual(it.next(), 0)
+AssertError(StopIteration, it.next)
+
+# user next and __getitem__ methods ending the loop
+class CountTo:
+    def __init__(self, n):
+        self.i = 0
+        self.n = n
+    def __iter__(self):
+        return self
+    def next(self):
+        if self.i >= self.n: raise StopIteration
+        self.i += 1
+        return self.i
+
+class CountToNew(object):
+    def __init__(self, n):
+        self.i = 0
+        self.n = n
+    def __iter__(self):
+        return self
+    def next(self):
+        if self.i >= self.n: raise StopIteration()
+        self.i += 1
+        return self.i
+
+class SequenceTo:
+    def __init__(self, n):
+        self.n = n
+    def __getitem__(self, index):
+        if index >= self.n: raise IndexError, index
+        return index + 1
+
+for cls in [CountTo, CountToNew, SequenceTo]:
+    AreEqual([x for x in cls(3)], [1, 2, 3])
+    AreEqual(list(cls(3)), [1, 2, 3])
+    AreEqual(tuple(cls(3)), (1, 2, 3))
+    AreEqual(sum(cls(4)), 10)
+    AreEqual(list(itertools.chain(cls(2), cls(1))), [1, 2, 1])
+    AreEqual(list(itertools.islice(cls(5), 2)), [1, 2])
+    AreEqual(list(cls(0)), [])
+
+    y = []
+    for x in cls(2): y.append(x)
+    AreEqual(y, [1, 2])
+
+# calling the methods directly still raises
+it = CountTo(1)
+AreEqual(it.next(), 1)
+AssertError(StopIteration, it.next)
+AssertError(StopIteration, it.next)
+AssertError(StopIteration, CountToNew(0).next)
+AssertError(IndexError, SequenceTo(0).__getitem__, 0)
+
+# the iteration stop doesn't leak into the next call
+def stop_or_value(stop):
+    if stop: raise StopIteration
+    return 'value'
+
+it = CountTo(0)
+AreEqual(list(it), [])
+AssertError(StopIteration, stop_or_value, True)
+AreEqual(stop_or_value(False), 'value')
+
+# a raise handled inside next doesn't end the loop
+class Skipping:
+    def __init__(self):
+        self.i = 0
+    def __iter__(self):
+        return self
+    def next(self):
+        self.i += 1
+        try:
+            if self.i == 2: raise StopIteration
+        except StopIteration:
+            self.i += 1
+        if self.i > 4: raise StopIteration
+        return self.i
+
+AreEqual(list(Skipping()), [1, 3, 4])
+
+# other exceptions from next still propagate
+class Failing:
+    def __iter__(self):
+        return self
+    def next(self):
+        raise ValueError
+
+AssertError(ValueError, list, Failing())
+
+# the flag is not visible through co_flags
+AreEqual(CountTo.next.func_code.co_flags & 0x40000000, 0)
+
 AssertErrorWithMessages(TypeError, "iter() takes at least 1 argument (0 given)", 
                                    "iter expected at least 1 arguments, got 0", iter)
 
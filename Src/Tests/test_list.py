@@ -97,6 +97,69 @@ def test_sort():
     l.sort(lambda x, y: x > y)
     AreEqual(l, l2)
 
+def test_sort_large():
+    from lib.random_util import Random
+    r = Random(42)
+    
+    # ints, floats and strings are compared directly, mixed types aren't
+    for data in ([r.randint(-1000, 1000) for i in range(5000)],
+                 [r.random() for i in range(5000)],
+                 [str(r.randint(0, 1000)) for i in range(5000)],
+                 [r.choice((1, 2L, 3.0, True)) for i in range(5000)]):
+        l = data[:]
+        l.sort()
+        for i in range(len(l) - 1):
+            Assert(l[i] <= l[i + 1])
+        l2 = data[:]
+        l2.sort(lambda x, y: cmp(x, y))
+        AreEqual(l, l2)
+        l2 = data[:]
+        l2.sort(reverse=True)
+        l.reverse()
+        AreEqual(l, l2)
+    
+    # partially ordered data
+    l = range(1000) + range(2000, 1000, -1) + range(500)
+    l2 = l[:]
+    l.sort()
+    AreEqual(l, sorted(l2, lambda x, y: cmp(x, y)))
+    
+    # stability, w/ key and reverse
+    data = [(r.randint(0, 10), i) for i in range(2000)]
+    l = data[:]
+    l.sort(key=lambda x: x[0])
+    for i in range(len(l) - 1):
+        Assert(l[i][0] < l[i + 1][0] or (l[i][0] == l[i + 1][0] and l[i][1] < l[i + 1][1]))
+    l = data[:]
+    l.sort(key=lambda x: x[0], reverse=True)
+    for i in range(len(l) - 1):
+        Assert(l[i][0] > l[i + 1][0] or (l[i][0] == l[i + 1][0] and l[i][1] < l[i + 1][1]))
+    
+    # NaN isn't ordered, it just mustn't break the sort
+    nan = 1e300 * 1e300 / (1e300 * 1e300)
+    l = [3.0, nan, 1.0, 2.0] * 100
+    l.sort()
+    AreEqual(len(l), 400)
+
+def test_sort_errors():
+    l = range(100)
+    def bad_cmp(x, y):
+        l.append(x)
+        return cmp(x, y)
+    AssertError(ValueError, l.sort, bad_cmp)
+    
+    # a failed comparison leaves all of the elements in the list
+    data = [(i * 7919) % 1000 for i in range(1000)]
+    class MyError(Exception): pass
+    def failing_cmp(x, y):
+        counter[0] += 1
+        if counter[0] == 2000: raise MyError()
+        return cmp(x, y)
+    counter = [0]
+    l = data[:]
+    AssertError(MyError, l.sort, failing_cmp)
+    AreEqual(sorted(l), sorted(data))
+
 def test_list_in_list():
     aList = [['a']]
     anItem = ['a']
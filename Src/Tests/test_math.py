@@ -282,3 +282,51 @@ def %s(self, other):
 
                         
 test_extensible_math()
+
+def test_inline_numerics():
+    if not is_cli: return
+    import IronPython
+    
+    code = """def f(a, b):
+    return (a + b, a - b, a * b, a < b, a <= b, a > b, a >= b, a == b, a != b)
+"""
+    values = [0, 1, -1, 7, 2147483647, -2147483648, 65536, 1.5, -0.0, 1e308, 3L, 'abc', True]
+    nan = 1e308 * 10 - 1e308 * 10
+    
+    def compile_f(inline):
+        save = IronPython.Compiler.Options.InlineNumericOperations
+        IronPython.Compiler.Options.InlineNumericOperations = inline
+        try:
+            d = {}
+            exec code in d
+            return d['f']
+        finally:
+            IronPython.Compiler.Options.InlineNumericOperations = save
+    
+    fast, slow = compile_f(True), compile_f(False)
+    for x in values:
+        for y in values:
+            try:
+                expected = slow(x, y)
+            except TypeError:
+                AssertError(TypeError, fast, x, y)
+                continue
+            res = fast(x, y)
+            AreEqual(res, expected)
+            AreEqual([type(r) for r in res], [type(r) for r in expected])
+    
+    # overflow promotes to long
+    AreEqual(fast(2147483647, 1)[0], 2147483648L)
+    AreEqual(fast(-2147483648, 1)[1], -2147483649L)
+    AreEqual(fast(65536, 65536)[2], 4294967296L)
+    
+    # comparisons w/ NaN are all false except for !=
+    AreEqual(fast(nan, 1.0)[3:], (False, False, False, False, False, True))
+    AreEqual(fast(nan, nan)[3:], slow(nan, nan)[3:])
+    
+    # subclasses of int and float are not special cased
+    class myint(int):
+        def __add__(self, other): return 'myint'
+    AreEqual(fast(myint(1), 2)[0], 'myint')
+
+test_inline_numerics()
@@ -443,4 +443,26 @@ def test_arg_Double():
     ]:
         _try_arg(target, arg, mapping, funcTypeError, funcOverflowError)
 
+def test_overload_cache():
+    from IronPython.Compiler import MethodBinderCache
+    from System import Math
+    from System.Text import StringBuilder
+
+    # the overload selected for one set of argument types must not leak into another
+    for i in range(3):
+        AreEqual(Math.Max(1, 2), 2)
+        AreEqual(type(Math.Max(1, 2)), int)
+        AreEqual(Math.Max(1.5, 2.5), 2.5)
+        AreEqual(type(Math.Max(1.5, 2.5)), float)
+        AreEqual(Math.Max(System.Int64.Parse('3'), System.Int64.Parse('4')), 4)
+        AssertError(TypeError, Math.Max, 'abc', 'def')
+
+    hits = MethodBinderCache.Hits
+    sb = StringBuilder()
+    for x in ['a', 1, 2.5, 'b', True]:
+        sb.Append(x)
+    AreEqual(sb.ToString(), 'a12.5bTrue')
+    Assert(MethodBinderCache.Hits > hits)
+    Assert(0.0 <= MethodBinderCache.HitRatio <= 1.0)
+
 run_test(__name__)
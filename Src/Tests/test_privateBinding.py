@@ -86,6 +86,58 @@ else:
         # !!! AreEqual("_InternalClsPart__privateEvent" in dir(InternalClsPart), True)
         # !!! AreEqual("_InternalClsPart__privateMethod" in dir(InternalClsPart), True)
 
+    def test_IdDispenser():
+        import IronPython.Runtime
+        import thread, time
+        IdDispenser = IronPython.Runtime.IdDispenser
+
+        keep = [object() for i in range(100)]
+        ids = [id(o) for o in keep]
+        for o, i in zip(keep, ids):
+            Assert(IdDispenser.GetObject(i) is o)
+        AreEqual(IdDispenser.GetObject(-1), None)
+
+        # give out ids for objects which die until the tables are rebuilt, the live
+        # objects are still found by id afterwards and the dead ones aren't
+        table = IdDispenser._IdDispenser__idtable
+        for n in range(20):
+            dead = [id(object()) for i in range(5000)]
+            System.GC.Collect()
+            System.GC.WaitForPendingFinalizers()
+            id(object())
+            if IdDispenser._IdDispenser__idtable is not table: break
+        Assert(IdDispenser._IdDispenser__idtable is not table)
+        for o, i in zip(keep, ids):
+            Assert(IdDispenser.GetObject(i) is o)
+            AreEqual(id(o), i)
+        for i in dead:
+            AreEqual(IdDispenser.GetObject(i), None)
+
+        # lookups don't take the lock, they run alongside new ids and rebuilds
+        errors = []
+        done = []
+        def reader():
+            try:
+                for n in range(200):
+                    for o, i in zip(keep, ids):
+                        if IdDispenser.GetObject(i) is not o: errors.append(i)
+            finally:
+                done.append(None)
+        def writer():
+            try:
+                for n in range(20000):
+                    o = object()
+                    i = id(o)
+                    if IdDispenser.GetObject(i) is not o: errors.append(i)
+                    if n % 5000 == 0: System.GC.Collect()
+            finally:
+                done.append(None)
+        for f in (reader, reader, writer, writer):
+            thread.start_new_thread(f, ())
+        while len(done) < 4:
+            time.sleep(0.01)
+        AreEqual(errors, [])
+
 # use this when running standalone
 #run_test(__name__)
 
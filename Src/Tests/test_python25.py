@@ -714,6 +714,13 @@ if isPython25:
             # end == start
         AreEqual(s.endswith(("here","nomatch"),-6, -6), False)
         AreEqual(s.endswith(("",None),-6, -6), True)
+
+    def test_string_startswith_ordinal():
+        # each prefix in the tuple is compared ordinally
+        AreEqual('a\xadb'.startswith(('x', 'ab')), False)
+        AreEqual('a\xadb'.startswith(('x', 'a\xad')), True)
+        AreEqual('a\xadb'.endswith(('x', 'ab'), 0), False)
+        AreEqual('a\xadb'.endswith(('x', '\xadb'), 0), True)
         
     def test_any():
         class A: pass
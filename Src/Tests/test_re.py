@@ -367,4 +367,82 @@ def test_eol():
     AreEqual(s.group(0), '<')
     AreEqual(r.search("<Z", 0), None)
 
+def test_cache():
+    re.purge()
+    p = re.compile('ab+c')
+    Assert(re.compile('ab+c') is p)
+    Assert(re.compile('ab+c', re.I) is not p)
+    Assert(re.compile(p) is p)
+    
+    # flags of a compiled pattern are preserved
+    p = re.compile('abc', re.I)
+    AreEqual(re.match(p, 'ABC').group(0), 'ABC')
+    
+    re.purge()
+    Assert(re.compile('ab+c') is not p)
+    
+    # more patterns than the cache holds
+    for i in range(500):
+        AreEqual(re.match('x%d(y*)' % i, 'x%dyy' % i).group(1), 'yy')
+        AreEqual(re.sub('y%d' % i, 'a', 'xy%dx' % i), 'xax')
+    AreEqual(re.findall('b', 'abcb'), ['b', 'b'])
+
+def test_finditer_findall_split():
+    p = re.compile('(a)(b*)')
+    AreEqual(p.findall('xabbyaz'), [('a', 'bb'), ('a', '')])
+    AreEqual(p.findall('xabbyaz', 2), [('a', '')])
+    AreEqual(p.findall('xabbyaz', 0, 3), [('a', 'b')])
+    AreEqual(re.findall('x*', 'axxb'), ['', 'xx', '', ''])
+    AreEqual([m.span() for m in p.finditer('xabbyaz')], [(1, 4), (5, 6)])
+    AreEqual([m.span() for m in p.finditer('xabbyaz', 2)], [(5, 6)])
+    AreEqual([m.span() for m in p.finditer('xabbyaz', 0, 3)], [(1, 3)])
+    AreEqual([m.group() for m in re.finditer('x*', 'axxb')], ['', 'xx', '', ''])
+    AreEqual(re.split(',', 'a,b,,c'), ['a', 'b', '', 'c'])
+    AreEqual(re.split('(,)', 'a,b'), ['a', ',', 'b'])
+    AreEqual(re.split(',', 'a,b,c', 1), ['a', 'b,c'])
+    
+    # matches are produced as the iterator is advanced
+    s = 'ab' * 1000000
+    it = re.finditer('b', s)
+    AreEqual(it.next().span(), (1, 2))
+    AreEqual(it.next().span(), (3, 4))
+    count = 2
+    for m in it: count += 1
+    AreEqual(count, 1000000)
+
+def test_compiled_patterns():
+    if not is_cli: return
+    from IronPython.Compiler import Options
+    old = Options.RegexCompileThreshold
+    try:
+        Options.RegexCompileThreshold = 5
+        p = re.compile('(a+)(?P<b>b*)c', re.I)
+        Assert(('(a+)(?P<b>b*)c', re.I) not in re.compiled_patterns())
+        for i in range(10):
+            AreEqual(p.match('AAbbc').groups(), ('AA', 'bb'))
+            AreEqual(p.search('xxaBc').group('b'), 'B')
+            AreEqual(p.sub('x', 'acabc'), 'xx')
+        Assert(('(a+)(?P<b>b*)c', re.I) in re.compiled_patterns())
+        
+        # compile everything up front
+        Options.RegexCompileThreshold = 0
+        p = re.compile('compiled now')
+        Assert(('compiled now', 0) in re.compiled_patterns())
+        AreEqual(p.findall('compiled now, compiled now'), ['compiled now', 'compiled now'])
+        
+        # a pattern which is dropped from the cache and compiled again is only listed once
+        for i in range(3):
+            re.purge()
+            AreEqual(re.match('compiled again', 'compiled again').span(), (0, 14))
+        AreEqual(re.compiled_patterns().count(('compiled again', 0)), 1)
+        AreEqual(re.compiled_patterns()[0], ('compiled again', 0))
+        
+        # never compile
+        Options.RegexCompileThreshold = -1
+        p = re.compile('never compiled')
+        for i in range(10): p.match('never compiled')
+        Assert(('never compiled', 0) not in re.compiled_patterns())
+    finally:
+        Options.RegexCompileThreshold = old
+
 run_test(__name__)
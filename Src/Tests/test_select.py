@@ -0,0 +1,156 @@
+#####################################################################################
+#
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#
+#  This source code is subject to terms and conditions of the Shared Source License
+#  for IronPython. A copy of the license can be found in the License.html file
+#  at the root of this distribution. If you can not locate the Shared Source License
+#  for IronPython, please send an email to ironpy@microsoft.com.
+#  By using this source code in any fashion, you are agreeing to be bound by
+#  the terms of the Shared Source License for IronPython.
+#
+#  You must not remove this notice, or any other, from this software.
+#
+######################################################################################
+
+#
+# test select
+#
+
+from lib.assert_util import *
+
+import select
+import socket
+
+def listener():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(50)
+    return server
+
+def connect(server):
+    client = socket.socket()
+    client.connect(server.getsockname())
+    conn, addr = server.accept()
+    return client, conn
+
+def test_select_timeout():
+    server = listener()
+    try:
+        AreEqual(select.select([server], [], [], 0), ([], [], []))
+        AreEqual(select.select([server], [], [], 0.01), ([], [], []))
+        AssertError(ValueError, select.select, [server], [], [], -1)
+        AssertError(TypeError, select.select, [object()], [], [], 0)
+    finally:
+        server.close()
+
+def test_select_ready():
+    server = listener()
+    client, conn = connect(server)
+    try:
+        # nothing to read yet, but both ends can be written to
+        r, w, x = select.select([client, conn], [client, conn], [], 0)
+        AreEqual(r, [])
+        AreEqual(w, [client, conn])
+        AreEqual(x, [])
+
+        client.send('abc')
+        r, w, x = select.select([conn.fileno(), client.fileno()], [], [], 1)
+        AreEqual(r, [conn.fileno()])
+        AreEqual(conn.recv(3), 'abc')
+
+        # objects w/ a fileno method are returned as is
+        class wrapper(object):
+            def __init__(self, sock): self.sock = sock
+            def fileno(self): return self.sock.fileno()
+        wrapped = wrapper(client)
+        AreEqual(select.select([], [wrapped], [], 0)[1], [wrapped])
+    finally:
+        client.close()
+        conn.close()
+        server.close()
+
+def test_select_many():
+    # a single threaded echo server handling many connections
+    server = listener()
+    clients = []
+    conns = []
+    try:
+        for i in range(200):
+            client = socket.socket()
+            client.connect(server.getsockname())
+            clients.append(client)
+            r, w, x = select.select([server], [], [], 5)
+            AreEqual(r, [server])
+            conns.append(server.accept()[0])
+
+        for i in range(len(clients)):
+            clients[i].send(str(i))
+
+        pending = list(conns)
+        while pending:
+            r, w, x = select.select(pending, [], [], 5)
+            Assert(r)
+            for conn in r:
+                conn.send(conn.recv(10))
+                pending.remove(conn)
+
+        for i in range(len(clients)):
+            AreEqual(clients[i].recv(10), str(i))
+    finally:
+        for s in clients + conns + [server]:
+            s.close()
+
+def test_poll():
+    server = listener()
+    client, conn = connect(server)
+    try:
+        p = select.poll()
+        p.register(conn, select.POLLIN)
+        AreEqual(p.poll(0), [])
+
+        client.send('x')
+        AreEqual(p.poll(1000), [(conn.fileno(), select.POLLIN)])
+        conn.recv(1)
+
+        # re-registering changes the mask
+        p.register(conn)
+        AreEqual(p.poll(0), [(conn.fileno(), select.POLLOUT)])
+
+        p.unregister(conn)
+        AssertError(KeyError, p.unregister, conn)
+        AreEqual(p.poll(0), [])
+    finally:
+        client.close()
+        conn.close()
+        server.close()
+
+def test_poll_closed():
+    server = listener()
+    client, conn = connect(server)
+    other = socket.socket()
+    closed = other.fileno()
+    other.close()
+    try:
+        p = select.poll()
+        p.register(closed)
+        p.register(conn, select.POLLIN)
+        client.send('x')
+        AreEqual(select.select([conn], [], [], 1)[0], [conn])
+
+        # the closed socket doesn't hide the events of the valid one, on every call
+        expected = [(closed, select.POLLNVAL), (conn.fileno(), select.POLLIN)]
+        expected.sort()
+        for i in range(2):
+            res = p.poll(1000)
+            res.sort()
+            AreEqual(res, expected)
+
+        p.unregister(closed)
+        AreEqual(p.poll(0), [(conn.fileno(), select.POLLIN)])
+    finally:
+        client.close()
+        conn.close()
+        server.close()
+
+run_test(__name__)
@@ -31,4 +31,74 @@ if is_cli:
     
         s.close()
     
+    def connected_pair():
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        client = socket.socket()
+        client.connect(server.getsockname())
+        conn = server.accept()[0]
+        server.close()
+        return client, conn
+    
+    def test_makefile():
+        client, conn = connected_pair()
+        
+        # buffered writes are sent on flush
+        wf = client.makefile('wb')
+        rf = conn.makefile('rb')
+        wf.write('line 1\nline 2\n')
+        wf.write('x' * 10000 + '\n')
+        wf.flush()
+        AreEqual(rf.readline(), 'line 1\n')
+        AreEqual(rf.readline(), 'line 2\n')
+        AreEqual(rf.readline(), 'x' * 10000 + '\n')
+        
+        # line buffered writes are sent at the end of a line
+        wf2 = client.makefile('w', 1)
+        wf2.write('abc')
+        wf2.write('def\nghi')
+        AreEqual(rf.readline(), 'abcdef\n')
+        wf2.close()
+        AreEqual(rf.read(3), 'ghi')
+        
+        # unbuffered files don't read ahead, the rest of the data is left for recv
+        wf.write('first\nsecond')
+        wf.flush()
+        rf0 = conn.makefile('rb', 0)
+        AreEqual(rf0.readline(), 'first\n')
+        rf0.close()
+        AreEqual(conn.recv(6), 'second')
+        
+        # the socket stays open until its files are closed
+        wf.write('after close')
+        client.close()
+        wf.close()
+        AreEqual(rf.read(), 'after close')
+        rf.close()
+        conn.close()
+    
+    def test_recv_into():
+        from System import Array, Byte
+        client, conn = connected_pair()
+        
+        buf = Array.CreateInstance(Byte, 10)
+        client.send('hello')
+        AreEqual(conn.recv_into(buf), 5)
+        AreEqual([chr(buf[i]) for i in range(5)], list('hello'))
+        
+        client.send('world')
+        AreEqual(conn.recv_into(buf, 3), 3)
+        AreEqual([chr(buf[i]) for i in range(3)], list('wor'))
+        nbytes, address = conn.recvfrom_into(buf)
+        AreEqual(nbytes, 2)
+        AreEqual([chr(buf[i]) for i in range(2)], list('ld'))
+        
+        AssertError(TypeError, conn.recv_into, 'abc')
+        AssertError(ValueError, conn.recv_into, buf, 11)
+        AssertError(ValueError, conn.recv, -1)
+        
+        client.close()
+        conn.close()
+    
     run_test(__name__)
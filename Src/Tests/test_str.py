@@ -119,6 +119,94 @@ def test_split():
     Assert("1--2--3--4--5--6--7--8--9--0".split("--", 2) == ['1', '2', '3--4--5--6--7--8--9--0'])
 
 
+def naive_find(s, sub, start, end):
+    for i in range(start, end - len(sub) + 1):
+        if s[i:i + len(sub)] == sub: return i
+    return -1
+
+def naive_rfind(s, sub, start, end):
+    for i in range(end - len(sub), start - 1, -1):
+        if s[i:i + len(sub)] == sub: return i
+    return -1
+
+def naive_split(s, sep):
+    res, start = [], 0
+    i = naive_find(s, sep, 0, len(s))
+    while i != -1:
+        res.append(s[start:i])
+        start = i + len(sep)
+        i = naive_find(s, sep, start, len(s))
+    res.append(s[start:])
+    return res
+
+def test_search_needle_lengths():
+    from lib.random_util import Random
+    r = Random(42)
+    for alphabet in ('ab', 'abcd', u'ab\xe9\u0161\u0261\u4e00 '):
+        for length in (0, 1, 7, 50, 300, 2000):
+            s = ''.join([r.choice(alphabet) for i in xrange(length)])
+            for m in (1, 2, 3, 5, 8, 13, 40):
+                if length > m and r.random() < 0.7:
+                    pos = r.randrange(length - m + 1)
+                    sub = s[pos:pos + m]
+                else:
+                    sub = ''.join([r.choice(alphabet) for i in xrange(m)])
+                start, end = r.randrange(length + 1), r.randrange(length + 1)
+                AreEqual(s.find(sub), naive_find(s, sub, 0, len(s)))
+                AreEqual(s.find(sub, start, end), naive_find(s, sub, start, end))
+                AreEqual(s.rfind(sub), naive_rfind(s, sub, 0, len(s)))
+                AreEqual(s.rfind(sub, start, end), naive_rfind(s, sub, start, end))
+                AreEqual(sub in s, naive_find(s, sub, 0, len(s)) != -1)
+                parts = naive_split(s, sub)
+                AreEqual(s.split(sub), parts)
+                AreEqual(s.count(sub), len(parts) - 1)
+                AreEqual(s.replace(sub, '<>'), '<>'.join(parts))
+                AreEqual(s.replace(sub, '<>', 2), '<>'.join(parts[:3]) + sub.join([''] + parts[3:]))
+                AreEqual(s.split(sub, 1), parts[:1] + [sub.join(parts[1:])][:len(parts) - 1])
+                AreEqual(sub.join(s.rsplit(sub)), s)
+                i = naive_rfind(s, sub, 0, len(s))
+                AreEqual(s.rsplit(sub, 1), i != -1 and [s[:i], s[i + m:]] or [s])
+
+def test_search_ordinal():
+    # characters are compared ordinally, ignorable and combining characters aren't special
+    AreEqual(u'e\u0301'.find('e'), 0)
+    AreEqual(u'e\u0301' in u'xe\u0301', True)
+    AreEqual('e' in u'e\u0301', True)
+    AreEqual('\xad' in 'abc', False)
+    AreEqual('a\xadb'.find('ab'), -1)
+    AreEqual('a\xadb'.count('ab'), 0)
+    AreEqual('a\xadb'.replace('ab', 'x'), 'a\xadb')
+    AreEqual('a\xadb'.split('ab'), ['a\xadb'])
+    AreEqual('a\xadb'.startswith('ab'), False)
+    AreEqual('a\xadb'.endswith('ab'), False)
+    AreEqual('ba\xadb'.startswith('ab', 1), False)
+    AreEqual('ba\xadb'.endswith('ab', 1, 4), False)
+    AreEqual('a\xadb'.startswith('a\xad'), True)
+    AreEqual('a\xadb'.endswith('\xadb', 0, 3), True)
+    AreEqual(u'e\u0301'.startswith('e'), True)
+    AreEqual('\xc5' in u'A\u030a', False)
+    AreEqual(u'A\u030aB'.rfind('A'), 0)
+    # characters which share a low byte
+    AreEqual((u'\u0161' * 2000 + 'a' * 10).find(u'\u0261' * 8), -1)
+    AreEqual((u'\u0161' * 2000 + u'\u0261' * 8).find(u'\u0261' * 8), 2000)
+
+def test_search_empty():
+    AreEqual(''.count(''), 1)
+    AreEqual('abc'.count(''), 4)
+    AreEqual('abc'.count('', 1), 3)
+    AreEqual('abc'.count('', 2, 1), 0)
+    AreEqual('abc'.find('b', 2, 1), -1)
+    AreEqual('abc'.find('', 2, 1), -1)
+    AreEqual('abc'.find('', 1), 1)
+    AreEqual('abc'.replace('b', 'x', -2), 'axc')
+    AreEqual('aaa'.rsplit('aa'), ['a', ''])
+    AreEqual('aaa'.split('aa'), ['', 'a'])
+    AreEqual('aaaa'.rsplit('aa'), ['', '', ''])
+    AreEqual('aaaaa'.rsplit('aa'), ['a', '', ''])
+    AreEqual('a,b,c'.rsplit(',', 1), ['a,b', 'c'])
+    AreEqual('a,b,c'.split(',', 0), ['a,b,c'])
+    AssertError(ValueError, 'abc'.rsplit, '', 1)
+
 def test_codecs():
     #all the encodings that should be supported
     #encodings = [ 'cp1252','ascii', 'utf-8', 'utf-16', 'latin-1', 'iso-8859-1', 'utf-16-le', 'utf-16-be', 'unicode-escape', 'raw-unicode-escape']
@@ -221,4 +309,23 @@ def test_str_equals():
     AreEqual(id(x), id(y))
     AreEqual(id(x), id(True))
 
+def search_benchmark():
+    import time
+    words = ['the', 'quick', 'brown', 'fox', 'jumps', 'over', 'lazy', 'dog', 'python',
+             'interpreter', 'parses', 'source', 'text', 'counts', 'tokens']
+    text = ' '.join([words[(i * 7) % len(words)] for i in xrange(200000)])
+    print "%-36s %12s %12s %12s %12s" % ("substring", "in (ms)", "find (ms)", "count (ms)", "replace (ms)")
+    for sub in ('z', 'o', 'zq', 'ox', 'zebra', 'lazy dog', 'interpreterx',
+                'parses source text counts tokensx'):
+        times = []
+        for op in (lambda: sub in text, lambda: text.find(sub), lambda: text.count(sub),
+                   lambda: text.replace(sub, 'X')):
+            start = time.clock()
+            for i in xrange(5): op()
+            times.append((time.clock() - start) * 1000 / 5)
+        print "%-36s %12.3f %12.3f %12.3f %12.3f" % (repr(sub), times[0], times[1], times[2], times[3])
+
 run_test(__name__)
+
+if __name__ == '__main__':
+    search_benchmark()
@@ -56,12 +56,52 @@ def test_negative():
     
     AssertError(struct.error, struct.pack, 'a', 1)
     
-    # BUG: 1033
     # such chars should be in the leading position only
-    
-    #for x in '=@<>!':
-    #    AssertError(struct.error, struct.pack, 'h'+x+'h', 1, 2)   
+    for x in '=@<>!':
+        AssertError(struct.error, struct.pack, 'h'+x+'h', 1, 2)   
 
     #AssertError(struct.error, struct.pack, 'c', 300) 
     
+def test_struct():
+    s = struct.Struct('<hI3sx')
+    AreEqual(s.format, '<hI3sx')
+    AreEqual(s.size, 10)
+    AreEqual(struct.calcsize('<hI3sx'), 10)
+    
+    data = s.pack(-2, 5, 'ab')
+    AreEqual(data, '\xfe\xff\x05\x00\x00\x00ab\x00\x00')
+    AreEqual(s.unpack(data), (-2, 5, 'ab\x00'))
+    AreEqual(struct.pack('>hI3sx', -2, 5, 'ab'), '\xff\xfe\x00\x00\x00\x05ab\x00\x00')
+    AreEqual(struct.pack('3x'), '\x00\x00\x00')
+    AreEqual(struct.calcsize('5p'), 5)
+    AreEqual(struct.unpack('5p', struct.pack('5p', 'abcdef')), ('abcd',))
+    
+    AssertError(struct.error, s.pack, 1, 2)
+    AssertError(struct.error, s.pack, 1, 2, 'a', 4)
+    AssertError(struct.error, s.unpack, data[1:])
+    AssertError(struct.error, struct.Struct, 'h3')
+    
+    # unpacking from part of a string or buffer
+    AreEqual(s.unpack_from('xyz' + data + 'xyz', 3), (-2, 5, 'ab\x00'))
+    AreEqual(s.unpack_from(data + 'xyz'), (-2, 5, 'ab\x00'))
+    AreEqual(struct.unpack_from('<h', data, 6), (ord('a') + 256 * ord('b'),))
+    AreEqual(s.unpack(buffer('xyz' + data, 3)), (-2, 5, 'ab\x00'))
+    AreEqual(s.unpack_from(buffer('xyz' + data + 'xyz', 3)), (-2, 5, 'ab\x00'))
+    AssertError(struct.error, s.unpack_from, data, 1)
+    AssertError(struct.error, s.unpack_from, buffer(data, 1))
+
+def test_struct_byte_array():
+    if not is_cli: return
+    import System
+    buf = System.Array.CreateInstance(System.Byte, 12)
+    s = struct.Struct('<hI3sx')
+    s.pack_into(buf, 1, -2, 5, 'ab')
+    AreEqual(list(buf), [0, 0xfe, 0xff, 5, 0, 0, 0, ord('a'), ord('b'), 0, 0, 0])
+    AreEqual(s.unpack_from(buf, 1), (-2, 5, 'ab\x00'))
+    struct.pack_into('>H', buf, -2, 0x1234)
+    AreEqual(struct.unpack_from('>H', buf, 10), (0x1234,))
+    AreEqual(struct.unpack('>H', System.Array[System.Byte]((0x12, 0x34))), (0x1234,))
+    AssertError(struct.error, s.pack_into, buf, 3, -2, 5, 'ab')
+    AssertError(TypeError, s.pack_into, 'a string', 0, -2, 5, 'ab')
+
 run_test(__name__)
\ No newline at end of file
@@ -318,6 +318,52 @@ if is_cli:
     
     
     
+    # symbol table test cases
+    
+    def Init_SymbolTable(loopCnt):
+        global oc, outsideFuncEnvValue
+        outsideFuncEnvValue = object()
+        oc = MyUserType()
+        setattr(oc, 'outsideFuncEnv', outsideFuncEnvValue)
+    
+    def Reader_RuntimeName(i):
+        # build the names at runtime so they're interned through the symbol table
+        AreEqual(getattr(oc, 'outside' + 'FuncEnv'), outsideFuncEnvValue)
+        AreEqual(getattr(oc, ''.join(['o', 'n', 'e'])), 'one')
+    
+    def Writer_NewSymbols(i, writerIndex):
+        # every name is new, forcing the symbol table to grow while the reader runs
+        attrName = 'sym%d_%s' % (writerIndex, str(i).translate(transTable))
+        AreEqual(getattr(oc, attrName, None), None)
+    
+    def SymbolTable_Throughput(threadCount, loopCnt):
+        """measures getattr throughput w/ runtime strings from many threads"""
+        import time
+        names = ['one', 'two', 'three', 'four', 'five', 'six']
+        obj = MyUserType()
+        start = ManualResetEvent(False)
+        
+        def worker():
+            start.WaitOne()
+            for i in xrange(loopCnt):
+                for name in names:
+                    getattr(obj, name + '')
+        
+        threads = []
+        for x in range(threadCount):
+            th = Thread(worker)
+            th.IsBackground = True
+            th.Start()
+            threads.append(th)
+        
+        begin = time.clock()
+        start.Set()
+        for th in threads: th.Join()
+        elapsed = time.clock() - begin
+        
+        if elapsed > 0:
+            print '%d threads: %d lookups/sec' % (threadCount, threadCount * loopCnt * len(names) / elapsed)
+    
     testCases = [ # initialization, reader, writer, test loopCnt, post-condition.  
                   #    Multiple writes can be provided w/ a tuple   
                   
@@ -335,6 +381,9 @@ if is_cli:
                   (Init_UserType, Reader_HasAttr, Writer_Generic, 10000),             
                   (Init_UserType_Bases, UserType_Read_BasesAndMro, UserType_Write_Bases, 10000),
                   
+                  # symbol table tests
+                  (Init_SymbolTable, Reader_RuntimeName, (Writer_NewSymbols, Writer_NewSymbols, Writer_NewSymbols), 10000),
+                  
                   # list tests
                   
                   (Init_List_Sort, Nop, (List_Sorter, List_Sorter), 1000),
@@ -384,6 +433,9 @@ if is_cli:
             # run all tests
             for test in testCases:
                 doOneTest(test)
+            
+            for threadCount in (1, 4, 32):
+                SymbolTable_Throughput(threadCount, 10000)
         else:
             # run one test
             toRun = list(sys.argv)
@@ -74,6 +74,18 @@ def test_xrange_corner_cases():
     AreEqual(x[0], 0)
     AreEqual(x[1], sys.maxint-1)
 
+def test_range_corner_cases():
+    import sys
+    # stepping past the last element mustn't wrap around
+    AreEqual(range(sys.maxint - 5, sys.maxint, 2), [sys.maxint - 5, sys.maxint - 3, sys.maxint - 1])
+    AreEqual(range(sys.maxint - 1, sys.maxint, sys.maxint), [sys.maxint - 1])
+    AreEqual(range(-sys.maxint + 5, -sys.maxint - 1, -2), [-sys.maxint + 5, -sys.maxint + 3, -sys.maxint + 1])
+    AreEqual(range(-sys.maxint, -sys.maxint - 1, -sys.maxint - 1), [-sys.maxint])
+    AreEqual(range(0, sys.maxint, sys.maxint - 1), [0, sys.maxint - 1])
+    AreEqual(range(-sys.maxint - 1, sys.maxint, sys.maxint), [-sys.maxint - 1, -1, sys.maxint - 1])
+    AreEqual(range(sys.maxint, -sys.maxint - 1, -sys.maxint), [sys.maxint, 0, -sys.maxint])
+    AssertError(OverflowError, range, -sys.maxint - 1, sys.maxint, 1)
+
 def test_xrange_coverage():
     ## ToString
     AreEqual(str(xrange(0, 3, 1)), "xrange(3)")
@@ -91,4 +103,85 @@ def test_xrange_coverage():
     AssertError(TypeError, lambda: xrange(4)[:2])
 
 
+def _loop_values(kind, *args):
+    res = []
+    if kind == 'range':
+        if len(args) == 1:
+            for i in range(args[0]): res.append(i)
+        elif len(args) == 2:
+            for i in range(args[0], args[1]): res.append(i)
+        else:
+            for i in range(args[0], args[1], args[2]): res.append(i)
+    else:
+        if len(args) == 1:
+            for i in xrange(args[0]): res.append(i)
+        elif len(args) == 2:
+            for i in xrange(args[0], args[1]): res.append(i)
+        else:
+            for i in xrange(args[0], args[1], args[2]): res.append(i)
+    return res
+
+def test_counted_loop():
+    import sys
+    for kind in ('range', 'xrange'):
+        for args in [(10,), (0,), (-10,), (3, 10), (10, 3), (-10, -3), (3, 20, 2), (3, 20, -2),
+                     (20, 3, -2), (-20, -3, 2), (7, 23, 4), (7, -23, -4),
+                     (sys.maxint - 2, sys.maxint), (-sys.maxint - 1, -sys.maxint + 2),
+                     (sys.maxint - 5, sys.maxint, 2), (-sys.maxint + 5, -sys.maxint - 1, -2),
+                     (3L, 6L), (True, 4)]:
+            AreEqual(_loop_values(kind, *args), range(*args))
+        AssertError(ValueError, _loop_values, kind, 1, 10, 0)
+        AssertError(TypeError, _loop_values, kind, 'abc')
+    
+    # break, continue & else
+    res = []
+    for i in range(10):
+        if i == 2: continue
+        if i == 5: break
+        res.append(i)
+    else:
+        res.append('else')
+    AreEqual(res, [0, 1, 3, 4])
+    for i in xrange(3): pass
+    else: res.append('else')
+    AreEqual(res, [0, 1, 3, 4, 'else'])
+    
+    # assigning to the loop variable doesn't affect the iteration
+    res = []
+    for i in range(3):
+        res.append(i)
+        i = 100
+    AreEqual(res, [0, 1, 2])
+    
+    # arguments are evaluated once, in order
+    calls = []
+    def arg(x):
+        calls.append(x)
+        return x
+    for i in range(arg(1), arg(3), arg(1)): pass
+    AreEqual(calls, [1, 3, 1])
+
+def test_counted_loop_rebound():
+    global range
+    def f():
+        res = []
+        for i in range(3): res.append(i)
+        return res
+    AreEqual(f(), [0, 1, 2])
+    
+    range = lambda x: ['rebound'] * x
+    try:
+        AreEqual(f(), ['rebound'] * 3)
+    finally:
+        del range
+    AreEqual(f(), [0, 1, 2])
+    
+    def _loop(xrange):
+        res = []
+        for i in xrange(2): res.append(i)
+        return res
+    AreEqual(_loop(lambda x: 'ab'), ['a', 'b'])
+    AreEqual(_loop(xrange), [0, 1])
+
+
 run_test(__name__)
\ No newline at end of file